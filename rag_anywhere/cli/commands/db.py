@@ -271,6 +271,7 @@ def info(name: Optional[str] = typer.Argument(None, help="Database name (default
     
     documents = doc_store.list_documents()
     num_chunks = len(doc_store.get_all_chunk_ids())
+    doc_store.close()
     
     # Calculate storage size
     storage_mb = db_path.stat().st_size / (1024 * 1024) if db_path.exists() else 0
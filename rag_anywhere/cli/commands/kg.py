@@ -8,6 +8,7 @@ from typing import Optional, List
 import json
 
 from ..context import RAGContext
+from ...core.splitters.base import TextChunk
 
 app = typer.Typer(help="Knowledge graph operations")
 console = Console()
@@ -218,20 +219,7 @@ def reprocess_document(
             continue
 
         # Convert to TextChunk-like objects for processing
-        from ...core.splitters.base import TextChunk
-
-        text_chunks = []
-        for chunk in chunks:
-            tc = TextChunk(
-                content=chunk['content'],
-                start_char=chunk['start_char'],
-                end_char=chunk['end_char'],
-                metadata={
-                    'document_id': did,
-                    'chunk_index': chunk['chunk_index']
-                }
-            )
-            text_chunks.append(tc)
+        text_chunks = [TextChunk.from_row(chunk, did) for chunk in chunks]
 
         # Process with GLiNER
         chunk_entities_map = ctx.safe_gliner_processor.process_chunks(
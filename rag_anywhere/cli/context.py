@@ -1,7 +1,10 @@
 # rag_anywhere/cli/context.py
 
+import itertools
+import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from ..config import Config
 from ..config.embedding_config import get_embedding_provider, EMBEDDING_DIMENSION
@@ -13,12 +16,18 @@ from ..core import (
     Searcher
 )
 from ..core.keyword_search import KeywordSearcher
+from ..core.splitters import SplitterFactory, TextSplitter
+from ..core.loaders import LoadCache
 from ..core.entity_store import EntityStore
 from ..core.gliner import GLiNERExtractor, GLiNERSubChunker, GLiNERBatchProcessor
 from ..utils.logging import get_logger
 
 logger = get_logger('cli.context')
 
+# Numbers database loads across the process: unlike the stores' own
+# counters, it never repeats after a reload
+_load_counter = itertools.count(1)
+
 
 class RAGContext:
     """
@@ -44,6 +53,13 @@ class RAGContext:
         self.gliner_processor = None
         self.indexer = None
         self.searcher = None
+        # Number of the most recent load_database call (0: none yet)
+        self.load_generation = 0
+        # Splitters built for per-request overrides, keyed by file extension
+        # and overrides
+        self._splitter_cache: Dict[str, TextSplitter] = {}
+        # (timestamp, indexer generation, num_documents, num_vectors)
+        self._stats_cache: Optional[Tuple[float, int, int, int]] = None
 
         # Track loaded GLiNER model for reuse
         self._loaded_gliner_model = None
@@ -161,9 +177,17 @@ class RAGContext:
             )
 
         try:
+            # Stores are replaced from here on, even if loading fails midway
+            self.load_generation = next(_load_counter)
+            if self.document_store is not None:
+                self.document_store.close()
+                self.document_store = None
+
             # Load database config
             logger.debug(f"Loading database configuration for '{db_name}'")
             self.db_config = self.config.load_database_config(db_name)
+            self._splitter_cache = {}
+            self._stats_cache = None
             logger.debug(f"Database config loaded for '{db_name}'")
 
             # Load global embedding provider (singleton)
@@ -178,7 +202,10 @@ class RAGContext:
 
             # Initialize loader registry
             logger.debug("Initializing loader registry")
-            self.loader_registry = LoaderRegistry()
+            # Parsed PDF/DOCX output is cached by content hash across databases
+            self.loader_registry = LoaderRegistry(
+                cache=LoadCache(self.config.cache_dir / "loads.db")
+            )
 
             # Initialize document and vector stores
             db_path = str(self.config.get_database_db_path(db_name))
@@ -188,7 +215,8 @@ class RAGContext:
             logger.debug(f"Initializing vector store with dimension={EMBEDDING_DIMENSION}")
             self.vector_store = VectorStore(
                 db_path,
-                dimension=EMBEDDING_DIMENSION
+                dimension=EMBEDDING_DIMENSION,
+                index_type=self.db_config.get('vector_index', 'auto')
             )
 
             # Initialize keyword searcher
@@ -287,11 +315,6 @@ class RAGContext:
         """
         self.ensure_active_database()
         
-        # Get defaults for file type
-        config = self.config.get_splitter_config_for_file(
-            self.active_db_name,  # type: ignore[arg-type]
-            file_extension
-        )
         # Ensure active_db_name is not None
         if self.active_db_name is None:
             raise ValueError("No active database")
@@ -306,3 +329,58 @@ class RAGContext:
             config.update(overrides)
         
         return config
+
+    def get_override_splitter(self, file_extension: str, overrides: dict) -> TextSplitter:
+        """
+        Get a splitter for a file type with parameter overrides applied
+
+        Splitters are cached by file extension and overrides, so requests
+        (or batch items) with the same overrides share one instance without
+        re-reading the database config; the cache is cleared whenever a
+        database is loaded. Splitters keep no state between calls, so the
+        instance is safe to share.
+
+        Args:
+            file_extension: File extension (e.g., '.pdf')
+            overrides: Parameter overrides from CLI/API
+
+        Returns:
+            Text splitter
+        """
+        key = json.dumps([file_extension, overrides], sort_keys=True, default=str)
+
+        splitter = self._splitter_cache.get(key)
+        if splitter is None:
+            splitter_config = self.get_splitter_config(file_extension, overrides)
+            splitter = SplitterFactory.create_splitter(
+                splitter_config['strategy'],
+                token_estimator=self.safe_embedding_provider.estimate_tokens,
+                **{k: v for k, v in splitter_config.items() if k != 'strategy'}
+            )
+            self._splitter_cache[key] = splitter
+        return splitter
+
+    def get_content_stats(self, max_age: float = 1.0) -> Tuple[int, int]:
+        """
+        Get the number of documents and vectors in the active database
+
+        Counts are cached for up to max_age seconds, and recomputed as soon
+        as the indexer writes to the stores, so frequent status polling
+        does not hit the database every time.
+
+        Args:
+            max_age: Maximum age of cached counts in seconds
+
+        Returns:
+            (num_documents, num_vectors)
+        """
+        generation = self.safe_indexer.generation
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached and cached[1] == generation and now - cached[0] < max_age:
+            return cached[2], cached[3]
+
+        num_documents = self.safe_document_store.count()
+        num_vectors = self.vector_store.count()
+        self._stats_cache = (now, generation, num_documents, num_vectors)
+        return num_documents, num_vectors
@@ -77,6 +77,7 @@ class Config:
         self.databases_dir = self.config_dir / "databases"
         self.models_dir = self.config_dir / "models"
         self.gliner_models_dir = self.models_dir / "gliner"
+        self.cache_dir = self.config_dir / "cache"
         self.global_config_path = self.config_dir / "config.yaml"
 
         self._ensure_directories()
@@ -87,6 +88,7 @@ class Config:
         self.databases_dir.mkdir(parents=True, exist_ok=True)
         self.models_dir.mkdir(parents=True, exist_ok=True)
         self.gliner_models_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
         """Load YAML file"""
@@ -2,10 +2,12 @@
 
 import sqlite3
 import json
+import threading
 import uuid
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Iterator, Tuple
 
 from .splitters import TextChunk
+from .sqlite_utils import batched
 
 
 class DocumentStore:
@@ -13,16 +15,119 @@ class DocumentStore:
     SQLite-based document and chunk storage.
     Manages documents, their chunks, and metadata.
     """
+
+    # Page size for newly created databases. Vector pages are tens of KB, so
+    # larger pages mean fewer overflow pages to read when loading them.
+    # SQLite only applies it before the first table is created; existing
+    # databases keep their page size.
+    PAGE_SIZE = 8192
+
+    # Number of one-time data migrations (see _migrate) applied to a
+    # database, recorded in PRAGMA user_version
+    SCHEMA_VERSION = 2
+
+    # seq is an explicit INTEGER PRIMARY KEY (a rowid alias): VACUUM may
+    # renumber implicit rowids, and the FTS5 index (KeywordSearcher) is
+    # keyed on seq
+    CHUNKS_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS chunks (
+            seq INTEGER PRIMARY KEY,
+            id TEXT NOT NULL UNIQUE,
+            document_id TEXT NOT NULL,
+            chunk_index INTEGER NOT NULL,
+            content TEXT NOT NULL,
+            start_char INTEGER,
+            end_char INTEGER,
+            metadata TEXT,
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        )
+    """
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # Per-thread read connections, see _read_conn; every one opened is
+        # also tracked here so close() can reach those of other threads
+        self._local = threading.local()
+        self._read_conns: List[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+        # Connection that only polls the change counter, see data_version
+        self._version_conn: Optional[sqlite3.Connection] = None
+        self._version_lock = threading.Lock()
         self._init_db()
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """
+        Get this thread's read-only connection, opening it on first use
+
+        The lookups on the search path reuse it instead of opening a
+        connection per call. Each connection belongs to one thread, so
+        concurrent requests never share one; in WAL mode (set by the vector
+        store) readers see every committed write without blocking writers.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only used by this thread, but close() may run on another one
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA cache_size = -65536")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
+        return conn
+
+    def close(self):
+        """
+        Close the read connections of every thread and the version connection
+
+        Each read connection holds its own page cache and memory map, so a
+        store that is being replaced should be closed rather than left to
+        the garbage collector. A thread that uses the store again opens a
+        new connection.
+        """
+        with self._read_conns_lock:
+            conns, self._read_conns = self._read_conns, []
+            self._local = threading.local()
+        for conn in conns:
+            conn.close()
+
+        with self._version_lock:
+            if self._version_conn is not None:
+                self._version_conn.close()
+                self._version_conn = None
+
+    def __del__(self):
+        """Cleanup on deletion."""
+        if hasattr(self, '_read_conns_lock'):
+            self.close()
     
+    def data_version(self) -> int:
+        """
+        Get a marker that changes whenever the database file changes
+
+        Reads SQLite's ``PRAGMA data_version`` on a dedicated connection that
+        never writes, so it changes after every commit by any other
+        connection, including writes from other processes (the CLI). The
+        value is only comparable to other values from the same store.
+
+        Returns:
+            Change marker
+        """
+        with self._version_lock:
+            if self._version_conn is None:
+                self._version_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            (version,) = self._version_conn.execute("PRAGMA data_version").fetchone()
+        return version
+
     def _init_db(self):
         """Initialize database schema"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # No-op unless the database is still empty
+        cursor.execute(f"PRAGMA page_size = {self.PAGE_SIZE}")
+
         # Documents table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS documents (
@@ -44,18 +149,7 @@ class DocumentStore:
 
         
         # Chunks table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS chunks (
-                id TEXT PRIMARY KEY,
-                document_id TEXT NOT NULL,
-                chunk_index INTEGER NOT NULL,
-                content TEXT NOT NULL,
-                start_char INTEGER,
-                end_char INTEGER,
-                metadata TEXT,
-                FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
-            )
-        """)
+        cursor.execute(self.CHUNKS_TABLE_SQL)
         
         # Chunk vectors table (for persistence)
         cursor.execute("""
@@ -66,6 +160,27 @@ class DocumentStore:
             )
         """)
         
+        # Packed chunk vectors (VectorStore.VECTORS_PER_PAGE per row);
+        # chunk_ids is a JSON list in the row order of the float32 vectors.
+        # chunk_vectors above only remains for migrating older databases.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_vector_pages (
+                page_id INTEGER PRIMARY KEY,
+                chunk_ids TEXT NOT NULL,
+                vectors BLOB NOT NULL
+            )
+        """)
+        
+        # Page of each packed vector, so a chunk's vector can be found
+        # without loading the pages (VectorStore keeps it in step with
+        # chunk_vector_pages)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS chunk_vector_locations (
+                chunk_id TEXT PRIMARY KEY,
+                page_id INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        
         # Config table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS config (
@@ -74,13 +189,60 @@ class DocumentStore:
             )
         """)
         
+        self._migrate(cursor)
+
         # Indices for performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunks_document_id ON chunks(document_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_chunks_chunk_index ON chunks(chunk_index)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_chunks_document_chunk_index "
+            "ON chunks(document_id, chunk_index)"
+        )
         
         conn.commit()
         conn.close()
     
+    def _migrate(self, cursor: sqlite3.Cursor):
+        """
+        Apply the data migrations the database has not had yet
+
+        Each runs once per database: PRAGMA user_version records how many
+        have been applied, so opening an up-to-date store costs one pragma.
+        """
+        (version,) = cursor.execute("PRAGMA user_version").fetchone()
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        if version < 1:
+            # Drop chunks left behind by deletes from before chunks were
+            # removed explicitly (ON DELETE CASCADE is not enforced)
+            cursor.execute("""
+                DELETE FROM chunks
+                WHERE document_id NOT IN (SELECT id FROM documents)
+            """)
+
+        if version < 2:
+            # Give chunks an explicit INTEGER PRIMARY KEY, keeping existing
+            # rowids as seq. The table is rebuilt under a new name and
+            # renamed over the old one so foreign keys that reference
+            # chunks(id) keep their target; dropping the old table drops its
+            # FTS triggers, which KeywordSearcher recreates (see
+            # FTS_SCHEMA_VERSION)
+            cursor.execute("PRAGMA table_info(chunks)")
+            if 'seq' not in [column[1] for column in cursor.fetchall()]:
+                cursor.execute(self.CHUNKS_TABLE_SQL.replace(
+                    "EXISTS chunks (", "EXISTS chunks_new (", 1
+                ))
+                cursor.execute("""
+                    INSERT INTO chunks_new (seq, id, document_id, chunk_index, content, start_char, end_char, metadata)
+                    SELECT rowid, id, document_id, chunk_index, content, start_char, end_char, metadata
+                    FROM chunks
+                """)
+                cursor.execute("DROP TABLE chunks")
+                cursor.execute("ALTER TABLE chunks_new RENAME TO chunks")
+
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
     def add_document(
         self,
         filename: str,
@@ -120,11 +282,13 @@ class DocumentStore:
         # Insert chunks
         for idx, chunk in enumerate(chunks):
             chunk_id = f"{doc_id}_{idx}"
-            chunk_metadata = chunk.metadata or {}
-            chunk_metadata.update({
-                'document_id': doc_id,
-                'chunk_index': idx
-            })
+            # Stamp the caller's chunk in place so downstream stages (GLiNER)
+            # see the document ID without a second pass over the chunks
+            if chunk.metadata is None:
+                chunk.metadata = {}
+            chunk_metadata = chunk.metadata
+            chunk_metadata['document_id'] = doc_id
+            chunk_metadata['chunk_index'] = idx
             
             cursor.execute(
                 """
@@ -149,16 +313,13 @@ class DocumentStore:
     
     def get_document(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get document by ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._read_conn().cursor()
         
         cursor.execute(
             "SELECT * FROM documents WHERE id = ?",
             (doc_id,)
         )
         row = cursor.fetchone()
-        conn.close()
         
         if row is None:
             return None
@@ -199,6 +360,49 @@ class DocumentStore:
             'updated_at': row['updated_at']
         }
 
+    def get_documents_bulk(self, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several documents by ID in as few queries as possible
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping document ID to document (missing IDs are omitted)
+        """
+        documents = {}
+        if not doc_ids:
+            return documents
+
+        cursor = self._read_conn().cursor()
+
+        # Stay under SQLite's bound-parameter limit
+        for batch, placeholders in batched(doc_ids):
+            cursor.execute(f"SELECT * FROM documents WHERE id IN ({placeholders})", batch)
+            for row in cursor.fetchall():
+                documents[row['id']] = {
+                    'id': row['id'],
+                    'filename': row['filename'],
+                    'content': row['content'],
+                    'doc_type': row['doc_type'] if 'doc_type' in row.keys() else 'text',
+                    'metadata': json.loads(row['metadata']),
+                    'created_at': row['created_at'],
+                    'updated_at': row['updated_at']
+                }
+
+        return documents
+
+    def list_filenames(self) -> Set[str]:
+        """Get the filenames of all indexed documents"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT filename FROM documents")
+        filenames = {row[0] for row in cursor.fetchall()}
+
+        conn.close()
+        return filenames
+
     def list_documents(self) -> List[Dict[str, Any]]:
         """List all documents"""
         conn = sqlite3.connect(self.db_path)
@@ -220,6 +424,54 @@ class DocumentStore:
             for row in rows
         ]
     
+    def count(self) -> int:
+        """Get total number of documents"""
+        conn = sqlite3.connect(self.db_path)
+        (count,) = conn.execute("SELECT COUNT(*) FROM documents").fetchone()
+        conn.close()
+        return count
+    
+    def iter_documents_with_counts(
+        self,
+        raw_metadata: bool = False
+    ) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """
+        Iterate over all documents with their chunk counts, one row at a time
+
+        Rows are read from a single cursor over a join with the grouped chunk
+        counts, so memory stays constant however many documents there are.
+
+        Args:
+            raw_metadata: Leave metadata as its stored JSON text instead of
+                decoding it (for callers that only pass it through)
+
+        Yields:
+            (document dict as returned by list_documents, number of chunks)
+        """
+        # The caller may resume the generator from a different thread
+        # (e.g. a streaming response running in a threadpool)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.execute(
+                "SELECT d.id, d.filename, d.doc_type, d.metadata, d.created_at, "
+                "COALESCE(c.num_chunks, 0) AS num_chunks "
+                "FROM documents d LEFT JOIN ("
+                "SELECT document_id, COUNT(*) AS num_chunks FROM chunks GROUP BY document_id"
+                ") c ON c.document_id = d.id "
+                "ORDER BY d.created_at DESC"
+            )
+            for row in cursor:
+                yield {
+                    'id': row['id'],
+                    'filename': row['filename'],
+                    'doc_type': row['doc_type'] or 'text',
+                    'metadata': row['metadata'] if raw_metadata else json.loads(row['metadata']),
+                    'created_at': row['created_at']
+                }, row['num_chunks']
+        finally:
+            conn.close()
+    
     def delete_document(self, doc_id: str) -> bool:
         """
         Delete document and its chunks
@@ -236,25 +488,54 @@ class DocumentStore:
             conn.close()
             return False
         
-        # Delete document (cascades to chunks and vectors)
+        # Foreign keys are not enabled on these connections, so ON DELETE
+        # CASCADE does not fire: remove the chunks explicitly
+        cursor.execute("DELETE FROM chunks WHERE document_id = ?", (doc_id,))
         cursor.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
         conn.commit()
         conn.close()
         
         return True
     
-    def get_chunks_by_document(self, doc_id: str) -> List[Dict[str, Any]]:
-        """Get all chunks for a document"""
+    def delete_documents(self, doc_ids: List[str]):
+        """
+        Delete several documents with their chunks in a single transaction
+        (used to roll back a failed indexing run). Packed vector pages are
+        cleaned up by VectorStore.delete; rows left in the legacy
+        chunk_vectors table are removed here.
+
+        Args:
+            doc_ids: Document IDs
+        """
+        if not doc_ids:
+            return
+
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
+
+        # Stay under SQLite's bound-parameter limit; all batches share the
+        # one transaction
+        for batch, placeholders in batched(doc_ids):
+            cursor.execute(f"""
+                DELETE FROM chunk_vectors WHERE chunk_id IN (
+                    SELECT id FROM chunks WHERE document_id IN ({placeholders})
+                )
+            """, batch)
+            cursor.execute(f"DELETE FROM chunks WHERE document_id IN ({placeholders})", batch)
+            cursor.execute(f"DELETE FROM documents WHERE id IN ({placeholders})", batch)
+
+        conn.commit()
+        conn.close()
+
+    def get_chunks_by_document(self, doc_id: str) -> List[Dict[str, Any]]:
+        """Get all chunks for a document"""
+        cursor = self._read_conn().cursor()
         
         cursor.execute(
             "SELECT * FROM chunks WHERE document_id = ? ORDER BY chunk_index",
             (doc_id,)
         )
         rows = cursor.fetchall()
-        conn.close()
         
         return [
             {
@@ -269,15 +550,84 @@ class DocumentStore:
             for row in rows
         ]
     
-    def get_chunk(self, chunk_id: str) -> Optional[Dict[str, Any]]:
-        """Get chunk by ID"""
+    def count_chunks_by_documents(self, doc_ids: List[str]) -> Dict[str, int]:
+        """
+        Count the chunks of several documents in as few queries as possible
+
+        Args:
+            doc_ids: Document IDs
+
+        Returns:
+            Dict mapping document ID to chunk count (documents without
+            chunks are omitted)
+        """
+        counts = {}
+        if not doc_ids:
+            return counts
+
         conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
+
+        # Stay under SQLite's bound-parameter limit
+        for batch, placeholders in batched(doc_ids):
+            cursor.execute(
+                f"SELECT document_id, COUNT(*) FROM chunks "
+                f"WHERE document_id IN ({placeholders}) GROUP BY document_id",
+                batch
+            )
+            counts.update(cursor.fetchall())
+
+        conn.close()
+        return counts
+    
+    def get_chunks_range(
+        self,
+        doc_id: str,
+        start_idx: int,
+        end_idx: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the chunks of a document with start_idx <= chunk_index <= end_idx
+
+        Args:
+            doc_id: Document ID
+            start_idx: First chunk index (inclusive)
+            end_idx: Last chunk index (inclusive)
+
+        Returns:
+            Chunks ordered by chunk index
+        """
+        cursor = self._read_conn().cursor()
+
+        cursor.execute(
+            """
+            SELECT * FROM chunks
+            WHERE document_id = ? AND chunk_index BETWEEN ? AND ?
+            ORDER BY chunk_index
+            """,
+            (doc_id, start_idx, end_idx)
+        )
+        rows = cursor.fetchall()
+
+        return [
+            {
+                'id': row['id'],
+                'document_id': row['document_id'],
+                'chunk_index': row['chunk_index'],
+                'content': row['content'],
+                'start_char': row['start_char'],
+                'end_char': row['end_char'],
+                'metadata': json.loads(row['metadata'])
+            }
+            for row in rows
+        ]
+
+    def get_chunk(self, chunk_id: str) -> Optional[Dict[str, Any]]:
+        """Get chunk by ID"""
+        cursor = self._read_conn().cursor()
         
         cursor.execute("SELECT * FROM chunks WHERE id = ?", (chunk_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row is None:
             return None
@@ -291,6 +641,81 @@ class DocumentStore:
             'end_char': row['end_char'],
             'metadata': json.loads(row['metadata'])
         }
+
+    def get_chunks_bulk(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several chunks by ID in as few queries as possible
+
+        Args:
+            chunk_ids: Chunk IDs
+
+        Returns:
+            Dict mapping chunk ID to chunk (missing IDs are omitted)
+        """
+        chunks = {}
+        if not chunk_ids:
+            return chunks
+
+        cursor = self._read_conn().cursor()
+
+        # Stay under SQLite's bound-parameter limit
+        for batch, placeholders in batched(chunk_ids):
+            cursor.execute(f"SELECT * FROM chunks WHERE id IN ({placeholders})", batch)
+            for row in cursor.fetchall():
+                chunks[row['id']] = {
+                    'id': row['id'],
+                    'document_id': row['document_id'],
+                    'chunk_index': row['chunk_index'],
+                    'content': row['content'],
+                    'start_char': row['start_char'],
+                    'end_char': row['end_char'],
+                    'metadata': json.loads(row['metadata'])
+                }
+
+        return chunks
+    
+    def get_chunks_with_documents(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several chunks by ID together with their document's filename
+
+        Chunks and documents are joined in SQL, so one query (per batch of
+        IDs) replaces separate chunk and document lookups, and document
+        content is never read.
+
+        Args:
+            chunk_ids: Chunk IDs
+
+        Returns:
+            Dict mapping chunk ID to chunk, with an extra 'document_filename'
+            key (missing IDs, and chunks without a document, are omitted)
+        """
+        chunks = {}
+        if not chunk_ids:
+            return chunks
+
+        cursor = self._read_conn().cursor()
+
+        # Stay under SQLite's bound-parameter limit
+        for batch, placeholders in batched(chunk_ids):
+            cursor.execute(
+                f"SELECT c.*, d.filename AS document_filename FROM chunks c "
+                f"JOIN documents d ON d.id = c.document_id "
+                f"WHERE c.id IN ({placeholders})",
+                batch
+            )
+            for row in cursor.fetchall():
+                chunks[row['id']] = {
+                    'id': row['id'],
+                    'document_id': row['document_id'],
+                    'document_filename': row['document_filename'],
+                    'chunk_index': row['chunk_index'],
+                    'content': row['content'],
+                    'start_char': row['start_char'],
+                    'end_char': row['end_char'],
+                    'metadata': json.loads(row['metadata'])
+                }
+
+        return chunks
     
     def get_all_chunk_ids(self) -> List[str]:
         """Get all chunk IDs in the database"""
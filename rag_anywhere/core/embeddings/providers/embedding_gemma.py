@@ -1,6 +1,7 @@
 # rag_anywhere/core/embeddings/providers/embedding_gemma.py
 
 import sys
+import threading
 import traceback
 import platform
 import numpy as np
@@ -87,6 +88,9 @@ class EmbeddingGemmaProvider:
             )
 
         self.model_name = model_name
+        # The Hugging Face fast tokenizer is not safe to call from several
+        # threads at once (documents are split concurrently by the server)
+        self._tokenizer_lock = threading.Lock()
 
         sys.stderr.write("[EmbeddingGemma] Auto-detecting device...\n")
         sys.stderr.flush()
@@ -195,7 +199,8 @@ class EmbeddingGemmaProvider:
         try:
             # Use actual tokenizer for accurate count
             if hasattr(self.model, 'tokenizer'):
-                tokens = self.model.tokenizer.encode(text, add_special_tokens=True)
+                with self._tokenizer_lock:
+                    tokens = self.model.tokenizer.encode(text, add_special_tokens=True)
                 return len(tokens)
             else:
                 # Fallback to rough approximation
@@ -4,16 +4,28 @@ This module manages the knowledge graph layer on top of the document/chunk stora
 It stores entities (nodes) and their relationships to chunks (edges).
 """
 
+import functools
 import sqlite3
-from typing import List, Dict, Optional, Tuple
+import threading
+from typing import List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 import logging
 
 from .gliner.models import Entity
+from .sqlite_utils import batched
 
 logger = logging.getLogger(__name__)
 
 
+def _synchronized(method):
+    """Run an EntityStore method while holding the store's lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class EntityStore:
     """Manages entity and knowledge graph storage in SQLite."""
 
@@ -25,8 +37,11 @@ class EntityStore:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Shared by the server's event loop and its worker threads (e.g.
+        # batch indexing), so every method holds _lock while using it
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self):
@@ -95,6 +110,7 @@ class EntityStore:
         self.conn.commit()
         logger.info("Entity store database initialized")
 
+    @_synchronized
     def add_entities(
         self, chunk_id: str, entities: List[Entity], source: str = "gliner"
     ) -> int:
@@ -162,6 +178,7 @@ class EntityStore:
         self.conn.commit()
         return len(entities)
 
+    @_synchronized
     def get_chunk_entities(self, chunk_id: str) -> List[Dict]:
         """
         Get all entities for a specific chunk.
@@ -188,6 +205,7 @@ class EntityStore:
 
         return [dict(row) for row in cursor.fetchall()]
 
+    @_synchronized
     def get_entity_chunks(self, entity_name: str, category: Optional[str] = None) -> List[str]:
         """
         Get all chunks that mention a specific entity.
@@ -225,11 +243,13 @@ class EntityStore:
 
         return [row[0] for row in cursor.fetchall()]
 
+    @_synchronized
     def query_entities(
         self,
         category: Optional[str] = None,
         min_frequency: Optional[int] = None,
         limit: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict]:
         """
         Query entities with optional filters.
@@ -238,12 +258,15 @@ class EntityStore:
             category: Filter by entity category
             min_frequency: Minimum frequency (number of mentions)
             limit: Maximum number of results
+            columns: graph_nodes columns to return (all if None); must be
+                trusted names, they are not parameterized
 
         Returns:
             List of entity dicts
         """
         cursor = self.conn.cursor()
-        query = "SELECT * FROM graph_nodes WHERE 1=1"
+        selected = ", ".join(columns) if columns else "*"
+        query = f"SELECT {selected} FROM graph_nodes WHERE 1=1"
         params = []
 
         if category:
@@ -263,6 +286,7 @@ class EntityStore:
         cursor.execute(query, params)
         return [dict(row) for row in cursor.fetchall()]
 
+    @_synchronized
     def get_entity_by_id(self, entity_id: int) -> Optional[Dict]:
         """
         Get entity by ID.
@@ -278,6 +302,7 @@ class EntityStore:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    @_synchronized
     def get_entity_by_name(
         self, name: str, category: Optional[str] = None
     ) -> Optional[Dict]:
@@ -307,6 +332,7 @@ class EntityStore:
         row = cursor.fetchone()
         return dict(row) if row else None
 
+    @_synchronized
     def get_related_entities(
         self, entity_id: int, limit: Optional[int] = None
     ) -> List[Tuple[Dict, int]]:
@@ -343,6 +369,7 @@ class EntityStore:
         cursor.execute(query, params)
         return [(dict(row), row["co_occurrence_count"]) for row in cursor.fetchall()]
 
+    @_synchronized
     def get_stats(self) -> Dict:
         """
         Get knowledge graph statistics.
@@ -350,37 +377,41 @@ class EntityStore:
         Returns:
             Dict with entity counts, category breakdown, etc.
         """
-        cursor = self.conn.cursor()
-
-        # Total entities
-        cursor.execute("SELECT COUNT(*) as count FROM graph_nodes")
-        total_entities = cursor.fetchone()["count"]
-
-        # Total edges
-        cursor.execute("SELECT COUNT(*) as count FROM chunk_edges")
-        total_edges = cursor.fetchone()["count"]
-
-        # Entities by category
-        cursor.execute(
+        # One statement for all aggregates: per-category counts (their sum
+        # is the entity total), the edge count and the top entities, tagged
+        # by kind and ordered within each kind
+        cursor = self.conn.execute(
             """
-            SELECT category, COUNT(*) as count
+            SELECT 'category' AS kind, category AS name, NULL AS category,
+                   COUNT(*) AS value
             FROM graph_nodes
             GROUP BY category
-            ORDER BY count DESC
+            UNION ALL
+            SELECT 'edges', NULL, NULL, COUNT(*) FROM chunk_edges
+            UNION ALL
+            SELECT * FROM (
+                SELECT 'top', display_name, category, frequency
+                FROM graph_nodes
+                ORDER BY frequency DESC
+                LIMIT 10
+            )
+            ORDER BY kind, value DESC
         """
         )
-        by_category = {row["category"]: row["count"] for row in cursor.fetchall()}
 
-        # Top entities
-        cursor.execute(
-            """
-            SELECT display_name, category, frequency
-            FROM graph_nodes
-            ORDER BY frequency DESC
-            LIMIT 10
-        """
-        )
-        top_entities = [dict(row) for row in cursor.fetchall()]
+        by_category = {}
+        total_edges = 0
+        top_entities = []
+        for kind, name, category, value in cursor:
+            if kind == "category":
+                by_category[name] = value
+            elif kind == "edges":
+                total_edges = value
+            else:
+                top_entities.append(
+                    {"display_name": name, "category": category, "frequency": value}
+                )
+        total_entities = sum(by_category.values())
 
         return {
             "total_entities": total_entities,
@@ -389,6 +420,7 @@ class EntityStore:
             "top_entities": top_entities,
         }
 
+    @_synchronized
     def delete_chunk_entities(self, chunk_id: str) -> int:
         """
         Delete all entities for a chunk (cleanup).
@@ -415,6 +447,40 @@ class EntityStore:
 
         return deleted
 
+    @_synchronized
+    def delete_chunks_entities(self, chunk_ids: List[str]) -> int:
+        """
+        Delete all entities for several chunks in one pass (cleanup).
+
+        Args:
+            chunk_ids: Chunk identifiers
+
+        Returns:
+            Number of edges deleted
+        """
+        if not chunk_ids:
+            return 0
+
+        cursor = self.conn.cursor()
+        deleted = 0
+        # Stay under SQLite's bound-parameter limit
+        for batch, placeholders in batched(chunk_ids):
+            cursor.execute(
+                f"DELETE FROM chunk_edges WHERE chunk_id IN ({placeholders})", batch
+            )
+            deleted += cursor.rowcount
+
+        # Clean up orphaned nodes once for the whole batch
+        cursor.execute(
+            """
+            DELETE FROM graph_nodes
+            WHERE id NOT IN (SELECT DISTINCT node_id FROM chunk_edges)
+        """
+        )
+        self.conn.commit()
+
+        return deleted
+
     def close(self):
         """Close database connection."""
         if self.conn:
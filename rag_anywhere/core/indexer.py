@@ -1,10 +1,16 @@
 # rag_anywhere/core/indexer.py
 
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple
+
+import numpy as np
 
 from .loaders import LoaderRegistry
-from .splitters import SplitterFactory
+from .splitters import SplitterFactory, TextChunk, TextSplitter
 from .embeddings.providers.embedding_gemma import EmbeddingGemmaProvider
 from .document_store import DocumentStore
 from .vector_store import VectorStore
@@ -13,6 +19,58 @@ from .entity_store import EntityStore
 from .gliner import GLiNERBatchProcessor
 
 
+@dataclass
+class _PendingDocument:
+    """A document that has been stored and split but not yet embedded"""
+    doc_id: str
+    file_path: Path
+    chunks: List[TextChunk]
+    chunk_ids: List[str]
+    metadata: Dict[str, Any]
+
+
+class _Prefetcher:
+    """
+    Read files ahead of the loaders on a small thread pool.
+
+    Keeps up to ``depth`` reads in flight so disk I/O for upcoming files
+    overlaps with parsing, splitting and embedding of the current one. Files
+    are yielded in submission order as ``(path, data)``; ``data`` is None for
+    files that are too large to hold in memory or could not be read, in which
+    case the loader reads the file itself.
+    """
+
+    def __init__(self, files: List[Path], depth: int = 8, max_file_size: int = 64 * 1024 * 1024):
+        self.files = files
+        self.depth = depth
+        self.max_file_size = max_file_size
+
+    def _read(self, file_path: Path) -> Optional[bytes]:
+        try:
+            if file_path.stat().st_size > self.max_file_size:
+                return None
+            return file_path.read_bytes()
+        except OSError:
+            return None  # Let the loader report the error
+
+    def __iter__(self) -> Iterator[Tuple[Path, Optional[bytes]]]:
+        files = iter(self.files)
+        with ThreadPoolExecutor(max_workers=self.depth) as executor:
+            in_flight = deque()
+            for file_path in files:
+                in_flight.append((file_path, executor.submit(self._read, file_path)))
+                if len(in_flight) >= self.depth:
+                    break
+
+            while in_flight:
+                file_path, future = in_flight.popleft()
+                # Keep the queue full before waiting on the oldest read
+                next_path = next(files, None)
+                if next_path is not None:
+                    in_flight.append((next_path, executor.submit(self._read, next_path)))
+                yield file_path, future.result()
+
+
 class Indexer:
     """
     Orchestrates the document ingestion pipeline:
@@ -30,7 +88,8 @@ class Indexer:
         gliner_config: Optional[Dict[str, Any]] = None,
         loader_registry: Optional[LoaderRegistry] = None,
         splitter_strategy: str = "recursive",
-        splitter_kwargs: Optional[Dict[str, Any]] = None
+        splitter_kwargs: Optional[Dict[str, Any]] = None,
+        embed_batch_size: int = 256
     ):
         self.document_store = document_store
         self.vector_store = vector_store
@@ -40,6 +99,14 @@ class Indexer:
         self.gliner_processor = gliner_processor
         self.gliner_config = gliner_config or {}
         self.loader_registry = loader_registry or LoaderRegistry()
+        # Number of chunks sent to the embedding model per call, independent
+        # of document boundaries
+        self.embed_batch_size = embed_batch_size
+        # Bumped on every write to the stores, so callers can tell when
+        # cached counts are stale
+        self.generation = 0
+        # Documents may be prepared on several threads at once
+        self._generation_lock = threading.Lock()
 
         # Create splitter
         splitter_kwargs = splitter_kwargs or {}
@@ -49,11 +116,17 @@ class Indexer:
             **splitter_kwargs
         )
     
+    def _bump_generation(self):
+        """Record a write to the stores"""
+        with self._generation_lock:
+            self.generation += 1
+
     def index_document(
         self,
         file_path: Path,
         metadata: Optional[Dict[str, Any]] = None,
-        doc_type: str = "text"
+        doc_type: str = "text",
+        splitter: Optional[TextSplitter] = None
     ) -> str:
         """
         Index a single document
@@ -62,14 +135,209 @@ class Indexer:
             file_path: Path to document
             metadata: Optional additional metadata
             doc_type: Document type ('text' or 'code')
+            splitter: Splitter to use for this document instead of the
+                indexer's own (leaves self.splitter untouched, so calls may
+                run concurrently)
 
         Returns:
             Document ID
         """
-        file_path = Path(file_path)
+        pending = self._prepare_document(Path(file_path), metadata, doc_type, splitter=splitter)
+        error = self._complete_documents([pending])[pending.doc_id]
+        if error is not None:
+            raise error
+
+        print(f"✓ Successfully indexed document '{pending.file_path.name}' (ID: {pending.doc_id})")
+        return pending.doc_id
+
+    def index_documents(
+        self,
+        file_paths: List[Path],
+        metadata: Optional[Dict[str, Any]] = None,
+        doc_type: str = "text"
+    ) -> List[str]:
+        """
+        Index several documents, embedding their chunks in shared batches
+
+        Documents are loaded, split and stored one at a time, but their chunks
+        are pooled and embedded in batches of ``embed_batch_size`` regardless
+        of document boundaries. Errors are reported per document and do not
+        stop the remaining files from being indexed; a document that fails
+        is rolled back without affecting the others in its batch.
+
+        Args:
+            file_paths: Paths to documents
+            metadata: Optional metadata to apply to all documents
+            doc_type: Document type ('text' or 'code')
+
+        Returns:
+            List of document IDs that were indexed successfully
+        """
+        doc_ids: List[str] = []
+        group: List[_PendingDocument] = []
+        group_chunks = 0
+
+        # One query up front instead of a filename lookup per file
+        existing_names = self.document_store.list_filenames()
+
+        prefetcher = _Prefetcher([Path(file_path) for file_path in file_paths])
+        for file_path, data in prefetcher:
+            try:
+                pending = self._prepare_document(
+                    file_path, metadata, doc_type, existing_names, data
+                )
+            except Exception as e:
+                print(f"✗ Error indexing {file_path.name}: {e}")
+                continue
+
+            existing_names.add(file_path.name)
+            group.append(pending)
+            group_chunks += len(pending.chunks)
+
+            if group_chunks >= self.embed_batch_size:
+                doc_ids.extend(self._flush_group(group, existing_names))
+                group = []
+                group_chunks = 0
+
+        if group:
+            doc_ids.extend(self._flush_group(group, existing_names))
+
+        return doc_ids
+
+    def prepare_document(
+        self,
+        file_path: Path,
+        metadata: Optional[Dict[str, Any]] = None,
+        doc_type: str = "text",
+        splitter: Optional[TextSplitter] = None
+    ) -> "_PendingDocument":
+        """
+        Load, split and store a document without embedding it yet
+
+        The result is passed to complete_documents, which embeds the chunks
+        of many prepared documents in shared batches. Several documents may
+        be prepared concurrently.
+
+        Args:
+            file_path: Path to document
+            metadata: Optional additional metadata
+            doc_type: Document type ('text' or 'code')
+            splitter: Splitter to use instead of the indexer's own
+
+        Returns:
+            Prepared document (its doc_id is already assigned)
+        """
+        return self._prepare_document(Path(file_path), metadata, doc_type, splitter=splitter)
+
+    def complete_documents(
+        self,
+        pending: List["_PendingDocument"],
+        stop_on_error: bool = False
+    ) -> Dict[str, Optional[str]]:
+        """
+        Embed and index prepared documents, sharing embedding batches
+
+        Documents are completed in groups of about ``embed_batch_size``
+        chunks. A document that fails is rolled back on its own; the other
+        documents of its group are still indexed, unless ``stop_on_error``
+        is set.
+
+        Args:
+            pending: Documents returned by prepare_document
+            stop_on_error: Stop at the first failed document; the documents
+                after it are rolled back if they share its group, or left out
+                of the result and must be passed to discard_documents
+
+        Returns:
+            Dict mapping document ID to an error message, or None if the
+            document was indexed
+        """
+        results: Dict[str, Optional[str]] = {}
+        group: List[_PendingDocument] = []
+        group_chunks = 0
+
+        for i, item in enumerate(pending):
+            group.append(item)
+            group_chunks += len(item.chunks)
+            if group_chunks < self.embed_batch_size and i < len(pending) - 1:
+                continue
+
+            group_errors = self._complete_documents(group, stop_on_error)
+            for member in group:
+                if member.doc_id not in group_errors:
+                    continue  # Rolled back after an earlier failure
+                error = group_errors[member.doc_id]
+                if error is None:
+                    print(f"✓ Successfully indexed document '{member.file_path.name}' (ID: {member.doc_id})")
+                    results[member.doc_id] = None
+                else:
+                    print(f"✗ Error indexing {member.file_path.name}: {error}")
+                    results[member.doc_id] = str(error)
+            if stop_on_error and any(error is not None for error in group_errors.values()):
+                break
+
+            group = []
+            group_chunks = 0
+
+        return results
+
+    def discard_documents(self, pending: List["_PendingDocument"]):
+        """
+        Remove prepared documents that will not be completed
+
+        prepare_document already stored them with their chunks; this deletes
+        them again so they do not stay behind without vectors.
+
+        Args:
+            pending: Documents returned by prepare_document
+        """
+        if not pending:
+            return
+
+        for item in pending:
+            print(f"✗ Discarding prepared document '{item.file_path.name}'")
+        self.document_store.delete_documents([item.doc_id for item in pending])
+        self._bump_generation()
 
+    def _flush_group(
+        self,
+        group: List["_PendingDocument"],
+        existing_names: Set[str]
+    ) -> List[str]:
+        """Complete a group of prepared documents, reporting failures per document"""
+        doc_ids = []
+        for pending, error in zip(group, self._complete_documents(group).values()):
+            if error is None:
+                print(f"✓ Successfully indexed document '{pending.file_path.name}' (ID: {pending.doc_id})")
+                doc_ids.append(pending.doc_id)
+            else:
+                # Rolled back, so the name is free again
+                existing_names.discard(pending.file_path.name)
+                print(f"✗ Error indexing {pending.file_path.name}: {error}")
+        return doc_ids
+
+    def _prepare_document(
+        self,
+        file_path: Path,
+        metadata: Optional[Dict[str, Any]],
+        doc_type: str,
+        existing_names: Optional[Set[str]] = None,
+        data: Optional[bytes] = None,
+        splitter: Optional[TextSplitter] = None
+    ) -> "_PendingDocument":
+        """
+        Load, split and store a document and its chunks (no embeddings yet)
+
+        When ``existing_names`` is given, it is used to detect already indexed
+        documents and the database is only queried on a hit. ``data`` holds
+        the file contents when they were already read by the prefetcher.
+        ``splitter`` overrides self.splitter for this document.
+        """
         # Check if document already exists
-        existing = self.document_store.get_document_by_filename(file_path.name)
+        if existing_names is None or file_path.name in existing_names:
+            existing = self.document_store.get_document_by_filename(file_path.name)
+        else:
+            existing = None
         if existing:
             raise ValueError(
                 f"Document '{file_path.name}' already exists with ID {existing['id']}. "
@@ -78,7 +346,7 @@ class Indexer:
 
         print(f"Loading document: {file_path.name}")
         # Load document
-        content, file_metadata = self.loader_registry.load_document(file_path)
+        content, file_metadata = self.loader_registry.load_document(file_path, data)
 
         # Merge metadata
         if metadata:
@@ -86,11 +354,13 @@ class Indexer:
 
         print(f"Splitting document into chunks...")
         # Split into chunks
-        chunks = self.splitter.split(content)
+        chunks = (splitter or self.splitter).split(content)
         print(f"Created {len(chunks)} chunks")
 
         print(f"Storing document and chunks...")
-        # Store document and chunks (need doc_id for GLiNER processing)
+        # Store document and chunks (need doc_id for GLiNER processing).
+        # add_document also stamps document_id/chunk_index into each
+        # chunk's metadata as it inserts it.
         doc_id = self.document_store.add_document(
             filename=file_path.name,
             content=content,
@@ -98,109 +368,242 @@ class Indexer:
             metadata=file_metadata,
             doc_type=doc_type
         )
+        self._bump_generation()
 
-        # Track what we've indexed for rollback on failure
-        chunk_ids = [f"{doc_id}_{i}" for i in range(len(chunks))]
-        vectors_stored = False
-        fts_indexed = False
+        prefix = f"{doc_id}_"
+        return _PendingDocument(
+            doc_id=doc_id,
+            file_path=file_path,
+            chunks=chunks,
+            chunk_ids=[prefix + str(i) for i in range(len(chunks))],
+            metadata=file_metadata
+        )
 
-        try:
-            # Update chunks with document metadata for GLiNER processing
-            for i, chunk in enumerate(chunks):
-                if chunk.metadata is None:
-                    chunk.metadata = {}
-                chunk.metadata['document_id'] = doc_id
-                chunk.metadata['chunk_index'] = i
-
-            print(f"Generating embeddings for {len(chunks)} chunks...")
-            # Format chunks with EmbeddingGemma document prompt
-            # Title format: {filename}_{chunk_index}
-            formatted_chunks = [
-                self.embedding_provider.format_document_chunk(
-                    title=f"{file_path.stem}_{i}",
-                    content=chunk.content
-                )
-                for i, chunk in enumerate(chunks)
-            ]
-            # Generate embeddings
-            embeddings = self.embedding_provider.embed(formatted_chunks)
-
-            print(f"Storing vectors...")
-            # Store vectors
-            self.vector_store.add_batch(chunk_ids, embeddings)
-            vectors_stored = True
-
-            # Index in FTS5 for keyword search
-            if self.keyword_searcher:
-                print(f"Indexing for keyword search...")
-                fts_chunks = [(chunk_id, chunk.content, "") for chunk_id, chunk in zip(chunk_ids, chunks)]
-                self.keyword_searcher.index_chunks_batch(fts_chunks)
-                fts_indexed = True
-
-            # Extract entities with GLiNER
-            if self.gliner_processor and self.entity_store:
-                gliner_enabled = self.gliner_config.get('enabled', True)
-                if gliner_enabled:
-                    print(f"Extracting entities with GLiNER...")
-                    default_labels = self.gliner_config.get('default_labels', [])
-                    user_labels = file_metadata.get('gliner_labels', [])
-
-                    # Process chunks to extract entities
-                    chunk_entities_map = self.gliner_processor.process_chunks(
-                        chunks,
-                        default_labels,
-                        user_labels
-                    )
-
-                    # Store entities in entity store
-                    total_entities = 0
-                    for chunk_id, chunk_entities in chunk_entities_map.items():
-                        num_entities = self.entity_store.add_entities(
-                            chunk_id,
-                            chunk_entities.entities,
-                            source='gliner'
-                        )
-                        total_entities += num_entities
-
-                    print(f"✓ Extracted and stored {total_entities} entities")
-
-            print(f"✓ Successfully indexed document '{file_path.name}' (ID: {doc_id})")
-            return doc_id
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in fixed-size batches and return one (n, dim) array"""
+        batches = [
+            self.embedding_provider.embed(texts[i:i + self.embed_batch_size])
+            for i in range(0, len(texts), self.embed_batch_size)
+        ]
+        if len(batches) == 1:
+            return batches[0]
+        return np.concatenate(batches)
+
+    def _complete_documents(
+        self,
+        group: List["_PendingDocument"],
+        stop_on_error: bool = False
+    ) -> Dict[str, Optional[Exception]]:
+        """
+        Embed and index prepared documents: vectors, FTS5 and entities.
 
-        except Exception as e:
-            # Rollback: Clean up partial indexing
-            print(f"✗ Error during indexing, rolling back changes for '{file_path.name}'...")
+        The chunks of the whole group are embedded, and their vectors stored,
+        in shared batches. A shared step that fails is retried one document
+        at a time, so only the documents that fail on their own are rolled
+        back, each with its own error. With ``stop_on_error``, the documents
+        after the first failed one are rolled back as well and left out of
+        the result, as if processing had stopped there.
 
-            # Delete entities if any were stored
-            if self.entity_store:
-                for chunk_id in chunk_ids:
-                    try:
-                        self.entity_store.delete_chunk_entities(chunk_id)
-                    except Exception:
-                        pass  # Best effort cleanup
+        Returns:
+            Dict mapping document ID to the exception it failed with, or
+            None if the document was indexed
+        """
+        errors: Dict[str, Exception] = {}
 
-            # Delete from FTS5 if indexed
-            if fts_indexed and self.keyword_searcher:
+        embeddings = self._embed_group(group, errors)
+        stored = self._store_vectors(
+            [pending for pending in group if pending.doc_id in embeddings],
+            embeddings,
+            errors
+        )
+
+        # Extract entities with GLiNER
+        if self.gliner_processor and self.entity_store and self.gliner_config.get('enabled', True):
+            for pending in group:
+                if stop_on_error and errors:
+                    break
+                if pending.doc_id in errors:
+                    continue
                 try:
-                    self.keyword_searcher.delete_chunks_batch(chunk_ids)
-                except Exception:
-                    pass  # Best effort cleanup
+                    self._extract_entities(pending)
+                except Exception as e:
+                    errors[pending.doc_id] = e
+
+        results: Dict[str, Optional[Exception]] = {}
+        rollback: List[_PendingDocument] = []
+        for pending in group:
+            if stop_on_error and any(error is not None for error in results.values()):
+                rollback.append(pending)  # Never reached in a serial run
+                continue
+            results[pending.doc_id] = errors.get(pending.doc_id)
+            if pending.doc_id in errors:
+                rollback.append(pending)
+
+        self._rollback(rollback, stored)
+        return results
+
+    def _format_chunks(self, pending: "_PendingDocument") -> List[str]:
+        """Document chunks with the EmbeddingGemma document prompt"""
+        # Title format: {filename}_{chunk_index}
+        format_chunk = self.embedding_provider.format_document_chunk
+        stem = pending.file_path.stem
+        return [
+            format_chunk(title=f"{stem}_{i}", content=chunk.content)
+            for i, chunk in enumerate(pending.chunks)
+        ]
+
+    def _embed_group(
+        self,
+        group: List["_PendingDocument"],
+        errors: Dict[str, Exception]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Embed the chunks of a group in shared batches
+
+        If that fails, documents are embedded one at a time and the ones
+        that still fail are recorded in ``errors``. Documents without chunks
+        get no entry.
+
+        Returns:
+            Dict mapping document ID to its (num_chunks, dim) embeddings
+        """
+        texts = {pending.doc_id: self._format_chunks(pending) for pending in group if pending.chunks}
+        if not texts:
+            return {}
 
-            # Delete vectors if stored
-            if vectors_stored:
+        num_chunks = sum(len(doc_texts) for doc_texts in texts.values())
+        print(f"Generating embeddings for {num_chunks} chunks...")
+        try:
+            embeddings = self._embed([text for doc_texts in texts.values() for text in doc_texts])
+        except Exception as e:
+            if len(texts) == 1:
+                errors[next(iter(texts))] = e
+                return {}
+            print(f"✗ Shared embedding batch failed ({e}), retrying one document at a time...")
+            by_document = {}
+            for doc_id, doc_texts in texts.items():
                 try:
-                    self.vector_store.delete(chunk_ids)
-                except Exception:
-                    pass  # Best effort cleanup
+                    by_document[doc_id] = self._embed(doc_texts)
+                except Exception as doc_error:
+                    errors[doc_id] = doc_error
+            return by_document
+
+        by_document = {}
+        offset = 0
+        for doc_id, doc_texts in texts.items():
+            by_document[doc_id] = embeddings[offset:offset + len(doc_texts)]
+            offset += len(doc_texts)
+        return by_document
+
+    def _store_vectors(
+        self,
+        group: List["_PendingDocument"],
+        embeddings: Dict[str, np.ndarray],
+        errors: Dict[str, Exception]
+    ) -> Set[str]:
+        """
+        Store the vectors of a group in one add_batch call
+
+        If that fails, documents are stored one at a time and the ones that
+        still fail are recorded in ``errors``. FTS5 needs no work here: it is
+        maintained by triggers on the chunks table, so the chunks were indexed
+        when they were stored.
+
+        Returns:
+            IDs of the documents whose vectors were stored
+        """
+        if not group:
+            return set()
+
+        print(f"Storing vectors...")
+        chunk_ids = [chunk_id for pending in group for chunk_id in pending.chunk_ids]
+        if len(group) == 1:
+            vectors = embeddings[group[0].doc_id]
+        else:
+            vectors = np.concatenate([embeddings[pending.doc_id] for pending in group])
+
+        stored = set()
+        try:
+            self.vector_store.add_batch(chunk_ids, vectors)
+            stored.update(pending.doc_id for pending in group)
+        except Exception as e:
+            if len(group) == 1:
+                errors[group[0].doc_id] = e
+            else:
+                print(f"✗ Storing shared vector batch failed ({e}), retrying one document at a time...")
+                for pending in group:
+                    try:
+                        self.vector_store.add_batch(pending.chunk_ids, embeddings[pending.doc_id])
+                        stored.add(pending.doc_id)
+                    except Exception as doc_error:
+                        errors[pending.doc_id] = doc_error
+
+        if stored:
+            self._bump_generation()
+        return stored
+
+    def _rollback(self, pending: List["_PendingDocument"], stored: Set[str]):
+        """
+        Remove documents that were not completed, with everything indexed
+        for them so far (entities, vectors, chunks and the document row)
+        """
+        if not pending:
+            return
+
+        names = ", ".join(f"'{item.file_path.name}'" for item in pending)
+        print(f"✗ Error during indexing, rolling back changes for {names}...")
+        chunk_ids = [chunk_id for item in pending for chunk_id in item.chunk_ids]
+
+        # Delete entities if any were stored
+        if self.entity_store:
+            try:
+                self.entity_store.delete_chunks_entities(chunk_ids)
+            except Exception:
+                pass  # Best effort cleanup
 
-            # Delete document and chunks (cascades)
+        # Delete documents, chunks and persisted vectors in one
+        # transaction (triggers clear the FTS5 index)
+        try:
+            self.document_store.delete_documents([item.doc_id for item in pending])
+        except Exception:
+            pass  # Best effort cleanup
+
+        # FAISS lives in memory, so it still needs its own cleanup
+        stored_chunk_ids = [
+            chunk_id for item in pending if item.doc_id in stored
+            for chunk_id in item.chunk_ids
+        ]
+        if stored_chunk_ids:
             try:
-                self.document_store.delete_document(doc_id)
+                self.vector_store.delete(stored_chunk_ids)
             except Exception:
                 pass  # Best effort cleanup
+        self._bump_generation()
+
+    def _extract_entities(self, pending: "_PendingDocument"):
+        """Extract entities for one document's chunks and store them"""
+        print(f"Extracting entities with GLiNER...")
+        default_labels = self.gliner_config.get('default_labels', [])
+        user_labels = pending.metadata.get('gliner_labels', [])
+
+        # Process chunks to extract entities
+        chunk_entities_map = self.gliner_processor.process_chunks(
+            pending.chunks,
+            default_labels,
+            user_labels
+        )
+
+        # Store entities in entity store
+        total_entities = 0
+        for chunk_id, chunk_entities in chunk_entities_map.items():
+            num_entities = self.entity_store.add_entities(
+                chunk_id,
+                chunk_entities.entities,
+                source='gliner'
+            )
+            total_entities += num_entities
 
-            # Re-raise the original exception
-            raise e
+        print(f"✓ Extracted and stored {total_entities} entities")
     
     def index_directory(
         self,
@@ -247,13 +650,7 @@ class Indexer:
 
         print(f"Found {len(files)} documents to index")
 
-        doc_ids = []
-        for file_path in files:
-            try:
-                doc_id = self.index_document(file_path, metadata, doc_type)
-                doc_ids.append(doc_id)
-            except Exception as e:
-                print(f"✗ Error indexing {file_path.name}: {e}")
+        doc_ids = self.index_documents(files, metadata, doc_type)
 
         print(f"\n✓ Successfully indexed {len(doc_ids)}/{len(files)} documents")
         return doc_ids
@@ -272,22 +669,19 @@ class Indexer:
         chunks = self.document_store.get_chunks_by_document(doc_id)
         chunk_ids = [chunk['id'] for chunk in chunks]
         
-        # Delete from document store (cascades to chunks)
+        # Delete from document store (and its chunks; triggers clear the
+        # FTS5 index)
         if not self.document_store.delete_document(doc_id):
             return False
+        self._bump_generation()
         
         # Delete vectors
         if chunk_ids:
             self.vector_store.delete(chunk_ids)
 
-        # Delete from FTS5 index
-        if self.keyword_searcher and chunk_ids:
-            self.keyword_searcher.delete_chunks_batch(chunk_ids)
-
         # Delete entities from knowledge graph
         if self.entity_store and chunk_ids:
-            for chunk_id in chunk_ids:
-                self.entity_store.delete_chunk_entities(chunk_id)
+            self.entity_store.delete_chunks_entities(chunk_ids)
 
         print(f"✓ Removed document {doc_id} and {len(chunk_ids)} vectors")
         return True
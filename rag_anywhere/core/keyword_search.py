@@ -1,14 +1,20 @@
 # rag_anywhere/core/keyword_search.py
 
+import functools
 import re
 import sqlite3
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from .sqlite_utils import batched
 
 
 class KeywordSearcher:
     """
     Keyword-based search using SQLite FTS5 (Full-Text Search).
 
+    Requires the ``chunks`` and ``config`` tables created by DocumentStore;
+    the index follows ``chunks`` automatically through triggers.
+
     Features:
     - Fast inverted index with BM25 ranking
     - Porter stemming for better matching
@@ -62,61 +68,164 @@ class KeywordSearcher:
         # Wrap in quotes for exact phrase matching
         return f'"{query}"'
 
+    # Bump to drop and rebuild chunks_fts and its triggers on startup
+    FTS_SCHEMA_VERSION = "4"
+
     def _init_fts(self):
-        """Create FTS5 virtual table if it doesn't exist"""
+        """
+        Create the FTS5 virtual table and its triggers if they don't exist
+
+        The index is an external-content table over ``chunks``: FTS5 stores
+        only the inverted index and reads chunk text back from ``chunks`` by
+        its ``seq`` key, so content is not duplicated. ``seq`` is an explicit
+        INTEGER PRIMARY KEY, which (unlike an implicit rowid) VACUUM never
+        renumbers. Chunk IDs and metadata are not part of the index; results
+        are joined back to ``chunks`` on ``seq``. Triggers on ``chunks`` keep
+        the index in sync as chunks are inserted, updated and deleted, inside
+        the same transaction as the chunk write.
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        cursor.execute("SELECT value FROM config WHERE key = 'fts_schema_version'")
+        row = cursor.fetchone()
+        if row is None or row[0] != self.FTS_SCHEMA_VERSION:
+            # Migration: recreate from scratch and repopulate from chunks
+            cursor.execute("DROP TRIGGER IF EXISTS chunks_fts_insert")
+            cursor.execute("DROP TRIGGER IF EXISTS chunks_fts_delete")
+            cursor.execute("DROP TRIGGER IF EXISTS chunks_fts_update")
+            cursor.execute("DROP TABLE IF EXISTS chunks_fts")
+
         # Create FTS5 table with porter stemming and unicode support
         cursor.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
-                chunk_id UNINDEXED,
                 content,
-                metadata UNINDEXED,
+                content='chunks',
+                content_rowid='seq',
                 tokenize='porter unicode61 remove_diacritics 1'
             )
         """)
 
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_insert AFTER INSERT ON chunks BEGIN
+                INSERT INTO chunks_fts (rowid, content)
+                VALUES (new.seq, new.content);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_delete AFTER DELETE ON chunks BEGIN
+                INSERT INTO chunks_fts (chunks_fts, rowid, content)
+                VALUES ('delete', old.seq, old.content);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS chunks_fts_update AFTER UPDATE ON chunks BEGIN
+                INSERT INTO chunks_fts (chunks_fts, rowid, content)
+                VALUES ('delete', old.seq, old.content);
+                INSERT INTO chunks_fts (rowid, content)
+                VALUES (new.seq, new.content);
+            END
+        """)
+
+        if row is None or row[0] != self.FTS_SCHEMA_VERSION:
+            cursor.execute("INSERT INTO chunks_fts(chunks_fts) VALUES('rebuild')")
+            cursor.execute(
+                "INSERT OR REPLACE INTO config (key, value) VALUES ('fts_schema_version', ?)",
+                (self.FTS_SCHEMA_VERSION,)
+            )
+
         conn.commit()
         conn.close()
 
-    def index_chunk(self, chunk_id: str, content: str, metadata: str = ""):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _build_fts_query(
+        query: str,
+        exclude_terms: Tuple[str, ...],
+        exact_match: bool,
+        escape_special_chars: bool
+    ) -> str:
         """
-        Add a chunk to the FTS index
+        Build the FTS5 MATCH expression for a search
 
-        Args:
-            chunk_id: Unique chunk identifier
-            content: Text content to index
-            metadata: Optional metadata (as JSON string)
+        Cached so repeated queries skip the sanitizing and string building.
+        Arguments must be hashable, hence the tuple of exclude terms.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "INSERT OR REPLACE INTO chunks_fts (chunk_id, content, metadata) VALUES (?, ?, ?)",
-            (chunk_id, content, metadata)
-        )
+        if exact_match:
+            # 1. Handle exact match FIRST.
+            # This converts the query to a phrase, escaping internal quotes.
+            esc_query = query.replace('"', '""')
+            fts_query = '"' + esc_query + '"'
+        
+        elif escape_special_chars:
+            # 2. Handle standard queries
+            # Sanitize the *entire* query string.
+            fts_query = KeywordSearcher._escape_fts5_special_chars(query)
+        
+        else:
+            # 3. No escaping (e.g., from search_with_keywords). Pass raw query.
+            fts_query = query
+        
+        # Add exclusions
+        if exclude_terms:
+            for term in exclude_terms:
+                # Escape exclude terms as well *if* the main query was escaped
+                if escape_special_chars:
+                    term = KeywordSearcher._escape_fts5_special_chars(term)
+                
+                # Append the NOT operator
+                if fts_query.strip():
+                    fts_query += f" NOT {term}"
+                else:
+                    # This would be a query of *only* exclusions, 
+                    # which FTS5 doesn't support well.
+                    pass
 
-        conn.commit()
-        conn.close()
+        return fts_query
 
-    def index_chunks_batch(self, chunks: List[Tuple[str, str, str]]):
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _build_keyword_query(
+        required_keywords: Tuple[str, ...],
+        optional_keywords: Tuple[str, ...],
+        exclude_keywords: Tuple[str, ...]
+    ) -> Tuple[str, Optional[Tuple[str, ...]]]:
         """
-        Add multiple chunks to FTS index efficiently
+        Build the query and sanitized exclude terms for a keyword search
 
-        Args:
-            chunks: List of (chunk_id, content, metadata) tuples
+        Cached like _build_fts_query, so repeated keyword sets skip the
+        sanitizing and joining.
+
+        Returns:
+            (query, sanitized exclude terms or None); the query is empty if
+            there are no required or optional keywords. Cached values are
+            shared, hence tuples
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        query_parts = []
 
-        cursor.executemany(
-            "INSERT OR REPLACE INTO chunks_fts (chunk_id, content, metadata) VALUES (?, ?, ?)",
-            chunks
-        )
+        # Required terms (AND)
+        if required_keywords:
+            # Sanitize *each* keyword *before* joining
+            sanitized_required = [KeywordSearcher._escape_fts5_special_chars(kw) for kw in required_keywords]
+            required = " AND ".join(sanitized_required)
+            query_parts.append(f"({required})")
 
-        conn.commit()
-        conn.close()
+        # Optional terms (OR)
+        if optional_keywords:
+            # Sanitize *each* keyword *before* joining
+            sanitized_optional = [KeywordSearcher._escape_fts5_special_chars(kw) for kw in optional_keywords]
+            optional = " OR ".join(sanitized_optional)
+            query_parts.append(f"({optional})")
+
+        # Combine with AND
+        query = " AND ".join(query_parts) if query_parts else ""
+
+        # Sanitize *exclude* terms as well
+        sanitized_exclude = None
+        if exclude_keywords:
+            sanitized_exclude = tuple(KeywordSearcher._escape_fts5_special_chars(kw) for kw in exclude_keywords)
+
+        return query, sanitized_exclude
 
     def search(
         self,
@@ -147,45 +256,23 @@ class KeywordSearcher:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        if exact_match:
-            # 1. Handle exact match FIRST.
-            # This converts the query to a phrase, escaping internal quotes.
-            esc_query = query.replace('"', '""')
-            fts_query = '"' + esc_query + '"'
-        
-        elif escape_special_chars:
-            # 2. Handle standard queries
-            # Sanitize the *entire* query string.
-            fts_query = self._escape_fts5_special_chars(query)
-        
-        else:
-            # 3. No escaping (e.g., from search_with_keywords). Pass raw query.
-            fts_query = query
-        
-        # Add exclusions
-        if exclude_terms:
-            for term in exclude_terms:
-                # Escape exclude terms as well *if* the main query was escaped
-                if escape_special_chars:
-                    term = self._escape_fts5_special_chars(term)
-                
-                # Append the NOT operator
-                if fts_query.strip():
-                    fts_query += f" NOT {term}"
-                else:
-                    # This would be a query of *only* exclusions, 
-                    # which FTS5 doesn't support well.
-                    pass
+        fts_query = self._build_fts_query(
+            query,
+            tuple(exclude_terms) if exclude_terms else (),
+            exact_match,
+            escape_special_chars
+        )
 
         try:
             # FTS5 query with BM25 ranking (rank is negative, lower is better)
             cursor.execute("""
                 SELECT
-                    chunk_id,
-                    rank
+                    chunks.id,
+                    chunks_fts.rank
                 FROM chunks_fts
+                JOIN chunks ON chunks.seq = chunks_fts.rowid
                 WHERE chunks_fts MATCH ?
-                ORDER BY rank
+                ORDER BY chunks_fts.rank
                 LIMIT ?
             """, (fts_query, top_k))
 
@@ -220,34 +307,15 @@ class KeywordSearcher:
         Returns:
             List of (chunk_id, score) tuples
         """
-        # Build query
-        query_parts = []
-
-        # Required terms (AND)
-        if required_keywords:
-            # Sanitize *each* keyword *before* joining
-            sanitized_required = [self._escape_fts5_special_chars(kw) for kw in required_keywords]
-            required = " AND ".join(sanitized_required)
-            query_parts.append(f"({required})")
-
-        # Optional terms (OR)
-        if optional_keywords:
-            # Sanitize *each* keyword *before* joining
-            sanitized_optional = [self._escape_fts5_special_chars(kw) for kw in optional_keywords]
-            optional = " OR ".join(sanitized_optional)
-            query_parts.append(f"({optional})")
-
-        # Combine with AND
-        query = " AND ".join(query_parts) if query_parts else ""
+        query, sanitized_exclude = self._build_keyword_query(
+            tuple(required_keywords or ()),
+            tuple(optional_keywords or ()),
+            tuple(exclude_keywords or ())
+        )
 
         if not query:
             return []
 
-        # Sanitize *exclude* terms as well
-        sanitized_exclude = None
-        if exclude_keywords:
-            sanitized_exclude = [self._escape_fts5_special_chars(kw) for kw in exclude_keywords]
-
         # Use standard search with exclusions
         # We set escape_special_chars=False because we have *already*
         # built a perfectly-formed, sanitized FTS query.
@@ -277,9 +345,10 @@ class KeywordSearcher:
 
         try:
             cursor.execute(f"""
-                SELECT highlight(chunks_fts, 1, '{start_tag}', '{end_tag}')
+                SELECT highlight(chunks_fts, 0, '{start_tag}', '{end_tag}')
                 FROM chunks_fts
-                WHERE chunk_id = ? AND chunks_fts MATCH ?
+                WHERE rowid = (SELECT seq FROM chunks WHERE id = ?)
+                  AND chunks_fts MATCH ?
             """, (chunk_id, query))
 
             result = cursor.fetchone()
@@ -290,29 +359,64 @@ class KeywordSearcher:
             conn.close()
             return None
 
-    def delete_chunk(self, chunk_id: str):
-        """Remove a chunk from the FTS index"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def highlight_many(self, chunk_ids: List[str], query: str,
+                       start_tag: str = "<mark>", end_tag: str = "</mark>") -> Dict[str, str]:
+        """
+        Return the content of several chunks with matched terms highlighted
 
-        cursor.execute("DELETE FROM chunks_fts WHERE chunk_id = ?", (chunk_id,))
+        One FTS5 query per batch of chunk IDs, so the match expression is
+        parsed once rather than once per chunk.
 
-        conn.commit()
-        conn.close()
+        Args:
+            chunk_ids: Chunk identifiers
+            query: Search query used
+            start_tag: HTML/marker to start highlight
+            end_tag: HTML/marker to end highlight
 
-    def delete_chunks_batch(self, chunk_ids: List[str]):
-        """Remove multiple chunks from FTS index"""
+        Returns:
+            Dict mapping chunk ID to highlighted content (chunks that are not
+            found or do not match are omitted; empty if the query is invalid)
+        """
+        highlighted = {}
         if not chunk_ids:
-            return
+            return highlighted
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        placeholders = ','.join('?' * len(chunk_ids))
-        cursor.execute(f"DELETE FROM chunks_fts WHERE chunk_id IN ({placeholders})", chunk_ids)
+        try:
+            # Stay under SQLite's bound-parameter limit
+            for batch, placeholders in batched(chunk_ids):
+                cursor.execute(f"""
+                    SELECT c.id, highlight(chunks_fts, 0, ?, ?)
+                    FROM chunks_fts
+                    JOIN chunks c ON c.seq = chunks_fts.rowid
+                    WHERE chunks_fts MATCH ?
+                      AND c.id IN ({placeholders})
+                """, (start_tag, end_tag, query, *batch))
+                highlighted.update(cursor.fetchall())
+        except sqlite3.OperationalError:
+            highlighted = {}
+        finally:
+            conn.close()
 
-        conn.commit()
-        conn.close()
+        return highlighted
+
+    @classmethod
+    def query_cache_info(cls) -> Dict[str, int]:
+        """
+        Get parsed FTS5 query cache statistics (shared by all searchers)
+
+        Returns:
+            Dict with hits, misses, size and max_size
+        """
+        info = cls._build_fts_query.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize
+        }
 
     def count(self) -> int:
         """Get total number of indexed chunks"""
@@ -333,14 +437,8 @@ class KeywordSearcher:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Clear FTS table
-        cursor.execute("DELETE FROM chunks_fts")
-
-        # Repopulate from chunks table
-        cursor.execute("""
-            INSERT INTO chunks_fts (chunk_id, content, metadata)
-            SELECT id, content, json_object() FROM chunks
-        """)
+        # FTS5's built-in bulk rebuild from the external content table
+        cursor.execute("INSERT INTO chunks_fts(chunks_fts) VALUES('rebuild')")
 
         conn.commit()
-        conn.close()
\ No newline at end of file
+        conn.close()
@@ -6,6 +6,7 @@ from .text import TextLoader
 from .pdf import PDFLoader
 from .docx import DocxLoader
 from .registry import LoaderRegistry
+from .cache import LoadCache
 
 __all__ = [
     'DocumentLoader',
@@ -13,4 +14,5 @@ __all__ = [
     'PDFLoader',
     'DocxLoader',
     'LoaderRegistry',
+    'LoadCache',
 ]
@@ -2,15 +2,22 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, ClassVar, List
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 
 
 class DocumentLoader(ABC):
     """Base class for document loaders"""
     
-    # Subclasses may override this with a list of supported file extensions
+    # File extensions (lowercase, with the dot) this loader handles;
+    # LoaderRegistry dispatches on these. Leave empty only if the loader
+    # needs supports() to inspect the path
     SUPPORTED_EXTENSIONS: ClassVar[List[str]] = []
 
+    # Whether LoaderRegistry should keep this loader's output in its
+    # content-hash cache; only worth it when parsing costs far more than
+    # hashing the file
+    CACHE_RESULTS: ClassVar[bool] = False
+
     @abstractmethod
     def load(self, file_path: Path) -> str:
         """
@@ -27,7 +34,62 @@ class DocumentLoader(ABC):
             ValueError: If file can't be processed
         """
         pass
+
+    def load_from_bytes(self, data: bytes, file_path: Path) -> str:
+        """
+        Extract text content from the already-read bytes of a document
+
+        Loaders that can parse from memory override this; the default
+        re-reads the file from disk.
+
+        Args:
+            data: Raw file contents
+            file_path: Path the bytes were read from
+
+        Returns:
+            Extracted text content
+        """
+        return self.load(file_path)
+
+    def load_with_metadata(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Load document text and metadata together
+
+        Loaders that parse the file to extract metadata override this to
+        parse it only once.
+
+        Args:
+            file_path: Path to the document
+            data: Optional file contents that were already read
+
+        Returns:
+            Tuple of (content, metadata)
+        """
+        if data is not None:
+            content = self.load_from_bytes(data, file_path)
+        else:
+            content = self.load(file_path)
+        return content, self.get_metadata(file_path)
     
+    def cache_key(self) -> str:
+        """
+        Identify the extractor that produces this loader's output
+
+        LoadCache keys entries on this as well as the file contents, so a
+        different loader, backend or library version parses the file again
+        instead of reusing text another extractor produced. Loaders whose
+        output depends on an optional library override this to include it.
+
+        Returns:
+            Extractor identifier
+        """
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     @abstractmethod
     def supports(self, file_path: Path) -> bool:
         """
@@ -0,0 +1,128 @@
+# rag_anywhere/core/loaders/cache.py
+
+import hashlib
+import json
+import mmap
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class LoadCache:
+    """
+    Persistent cache of loader output keyed by a hash of the file contents.
+
+    Parsing PDFs and DOCX files dominates ingest time for static corpora;
+    hashing the bytes is far cheaper, so re-indexing an unchanged file (or
+    the same file under another path) skips the parse entirely. Keys combine
+    the content hash with the extractor (see ``DocumentLoader.cache_key``).
+    Entries are evicted least-recently-used once their total size exceeds
+    ``max_bytes``.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int = 256 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._init_db()
+
+    def _init_db(self):
+        conn = sqlite3.connect(self.db_path)
+        # Entries written before keys named the extractor or tracked their
+        # size cannot be reused; drop them
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(loads)")]
+        if columns and 'size' not in columns:
+            conn.execute("DROP TABLE loads")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS loads (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_loads_accessed_at ON loads(accessed_at)")
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def fingerprint(file_path: Path, data: Optional[bytes] = None) -> str:
+        """
+        Hash file contents with BLAKE2b
+
+        Args:
+            file_path: File to hash (memory-mapped rather than read)
+            data: File contents, if they were already read
+
+        Returns:
+            Hex digest
+        """
+        if data is not None:
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        with open(file_path, 'rb') as f:
+            if f.seek(0, 2) == 0:
+                return hashlib.blake2b(b'', digest_size=16).hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.blake2b(mapped, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Return cached (content, metadata) or None"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "SELECT content, metadata FROM loads WHERE key = ?",
+            (key,)
+        )
+        row = cursor.fetchone()
+        if row is not None:
+            cursor.execute(
+                "UPDATE loads SET accessed_at = ? WHERE key = ?",
+                (time.time(), key)
+            )
+            conn.commit()
+        conn.close()
+
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, key: str, content: str, metadata: Dict[str, Any]):
+        """Store loader output, evicting the least recently used entries"""
+        metadata_json = json.dumps(metadata, default=str)
+        size = len(content.encode('utf-8')) + len(metadata_json)
+        if size > self.max_bytes:
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(
+            "INSERT OR REPLACE INTO loads (key, content, metadata, size, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (key, content, metadata_json, size, time.time())
+        )
+        # Keep the most recently used entries that fit in max_bytes
+        cursor.execute("""
+            DELETE FROM loads WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (
+                        ORDER BY accessed_at DESC ROWS UNBOUNDED PRECEDING
+                    ) AS running_size
+                    FROM loads
+                )
+                WHERE running_size > ?
+            )
+        """, (self.max_bytes,))
+
+        conn.commit()
+        conn.close()
+
+    def clear(self):
+        """Remove all cached entries"""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM loads")
+        conn.commit()
+        conn.close()
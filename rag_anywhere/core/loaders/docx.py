@@ -1,60 +1,121 @@
 # rag_anywhere/core/loaders/docx.py
 
+import importlib.metadata
+import importlib.util
+import io
+import itertools
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from .base import DocumentLoader
 
 
 class DocxLoader(DocumentLoader):
     """Loader for Microsoft Word documents"""
-    
+
     SUPPORTED_EXTENSIONS = ['.docx', '.doc']
-    
+    CACHE_RESULTS = True
+
     def __init__(self):
-        try:
-            import docx
-            self.docx = docx
-        except ImportError as e:
+        # python-docx (and lxml under it) is only imported on first use, so
+        # building a LoaderRegistry stays cheap when no DOCX is loaded
+        if importlib.util.find_spec('docx') is None:
             raise ImportError(
                 "DocxLoader requires 'python-docx' package. "
                 "Install with: pip install python-docx"
-            ) from e
+            )
+        self._docx = None
+
+    @property
+    def docx(self):
+        """The python-docx module, imported on first access"""
+        if self._docx is None:
+            import docx
+            self._docx = docx
+        return self._docx
+
+    def _open(self, file_path: Path, data: Optional[bytes] = None):
+        """
+        Parse a DOCX package with python-docx
+
+        The package's zip archive is opened once and everything (body,
+        tables, core properties) is read from that one parse; already-read
+        bytes are parsed from memory instead of reopening the file.
+        """
+        if data is not None:
+            return self.docx.Document(io.BytesIO(data))
+        return self.docx.Document(str(file_path))
+
+    @staticmethod
+    def _extract_text(doc) -> str:
+        """Body paragraphs followed by table rows"""
+        # Each .text access re-walks the XML, so read it once per element
+        paragraphs = (text for text in (p.text for p in doc.paragraphs) if text.strip())
+        table_rows = [
+            row_text
+            for table in doc.tables
+            for row in table.rows
+            if (row_text := ' | '.join(cell.text for cell in row.cells)).strip()
+        ]
+        tables_header = ('', '--- Tables ---', '') if table_rows else ()
+
+        return "\n\n".join(itertools.chain(paragraphs, tables_header, table_rows))
 
     def load(self, file_path: Path) -> str:
         """Load DOCX file and extract text"""
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        
+
+        try:
+            return self._extract_text(self._open(file_path))
+        except Exception as e:
+            raise ValueError(f"Error loading DOCX {file_path}: {e}")
+
+    def load_from_bytes(self, data: bytes, file_path: Path) -> str:
+        """Extract text from already-read DOCX bytes"""
+        try:
+            return self._extract_text(self._open(file_path, data))
+        except Exception as e:
+            raise ValueError(f"Error loading DOCX {file_path}: {e}")
+
+    def load_with_metadata(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Load text and metadata from a single parse of the package"""
+        if data is None and not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
         try:
-            doc = self.docx.Document(str(file_path))
-            
-            # Extract text from paragraphs
-            paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
-            
-            # Extract text from tables
-            table_texts = []
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = ' | '.join(cell.text for cell in row.cells)
-                    if row_text.strip():
-                        table_texts.append(row_text)
-            
-            # Combine paragraphs and tables
-            all_text = paragraphs
-            if table_texts:
-                all_text.extend(['', '--- Tables ---', ''] + table_texts)
-            
-            return "\n\n".join(all_text)
+            doc = self._open(file_path, data)
+            content = self._extract_text(doc)
         except Exception as e:
             raise ValueError(f"Error loading DOCX {file_path}: {e}")
-    
+        return content, self._metadata(file_path, doc)
+
+    def cache_key(self) -> str:
+        """Loader class plus the python-docx version"""
+        try:
+            version = importlib.metadata.version('python-docx')
+        except importlib.metadata.PackageNotFoundError:
+            version = 'unknown'
+        return f"{super().cache_key()}:python-docx-{version}"
+
     def supports(self, file_path: Path) -> bool:
         """Check if file is DOCX"""
-        return file_path.suffix.lower() in ['.docx', '.doc']
-    
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
+
     def get_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract metadata from DOCX"""
+        try:
+            doc = self._open(file_path)
+        except Exception:
+            doc = None
+        return self._metadata(file_path, doc)
+
+    def _metadata(self, file_path: Path, doc) -> Dict[str, Any]:
+        """Metadata from file stats and, when parsed, the document itself"""
         stat = file_path.stat()
         metadata = {
             'filename': file_path.name,
@@ -62,11 +123,12 @@ class DocxLoader(DocumentLoader):
             'file_type': file_path.suffix.lower(),
             'mime_type': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
         }
-        
+        if doc is None:
+            return metadata
+
         try:
-            doc = self.docx.Document(str(file_path))
             core_props = doc.core_properties
-            
+
             if core_props.title:
                 metadata['title'] = core_props.title
             if core_props.author:
@@ -77,11 +139,11 @@ class DocxLoader(DocumentLoader):
                 metadata['created'] = core_props.created.isoformat()
             if core_props.modified:
                 metadata['modified'] = core_props.modified.isoformat()
-            
+
             # Count paragraphs
-            metadata['num_paragraphs'] = len([p for p in doc.paragraphs if p.text.strip()])
+            metadata['num_paragraphs'] = sum(1 for p in doc.paragraphs if p.text.strip())
             metadata['num_tables'] = len(doc.tables)
         except Exception:
             pass  # If metadata extraction fails, just return basic info
-        
+
         return metadata
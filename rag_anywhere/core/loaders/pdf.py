@@ -1,25 +1,177 @@
 # rag_anywhere/core/loaders/pdf.py
 
+import atexit
+import io
+import mmap
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from .base import DocumentLoader
 
 
+def _pymupdf_text_flags(pymupdf) -> int:
+    """
+    Text-only extraction flags for PyMuPDF
+
+    Images (and with them most of the graphics work) are skipped: the RAG
+    pipeline only wants prose, so table/figure structure is not needed.
+    """
+    return pymupdf.TEXTFLAGS_TEXT & ~pymupdf.TEXT_PRESERVE_IMAGES
+
+
+def _extract_page_range(file_path: str, start: int, stop: int, backend: str) -> List[str]:
+    """Extract text from pages [start, stop) of a PDF (runs in a worker process)"""
+    if backend == 'pymupdf':
+        import pymupdf
+
+        flags = _pymupdf_text_flags(pymupdf)
+        with pymupdf.open(file_path) as doc:
+            return [doc.load_page(i).get_text("text", flags=flags) for i in range(start, stop)]
+
+    import pypdf
+
+    reader = pypdf.PdfReader(file_path)
+    return [
+        reader.pages[i].extract_text(extraction_mode="plain") or ''
+        for i in range(start, stop)
+    ]
+
+
+# Process pool shared by every PDFLoader, see _get_pool
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the process pool for parallel page extraction, starting it on first use
+
+    One long-lived pool is shared by all loaders and threads, so worker
+    startup is paid once per process rather than once per PDF, and
+    concurrent extractions queue on the same workers instead of each
+    starting their own. Workers are started with 'spawn', not fork: the
+    loader also runs inside the multithreaded server, which holds the
+    embedding model, the FAISS index and a logging listener thread, and
+    forking such a process can deadlock on locks held by other threads.
+
+    Args:
+        max_workers: Worker count, used when the pool is first started
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next parallel extraction starts a new one"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def _shutdown_pool():
+    """Stop the worker processes at interpreter exit"""
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+
+
 class PDFLoader(DocumentLoader):
-    """Loader for PDF documents"""
+    """
+    Loader for PDF documents
+
+    Uses PyMuPDF (MuPDF, a C library) when it is installed, which extracts
+    text several times faster than pypdf, and falls back to pypdf otherwise.
+    """
     
     SUPPORTED_EXTENSIONS = ['.pdf']
+    CACHE_RESULTS = True
+
+    # Documents with fewer pages are extracted serially. Every worker re-opens
+    # the file and the first parallel extraction waits for worker startup
+    # (about 200 ms), so it only pays off once serial extraction takes
+    # several hundred milliseconds: about 30 pages with pypdf (~15 ms per
+    # page) and 250 with MuPDF (~2 ms per page).
+    PARALLEL_MIN_PAGES = {'pypdf': 32, 'pymupdf': 256}
     
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None):
+        try:
+            import pymupdf
+            self.pymupdf = pymupdf
+            self._text_flags = _pymupdf_text_flags(pymupdf)
+        except ImportError:
+            self.pymupdf = None
+
         try:
             import pypdf
             self.pypdf = pypdf
         except ImportError as e:
-            raise ImportError(
-                "PDFLoader requires 'pypdf' package. "
-                "Install with: pip install pypdf"
-            ) from e
+            if self.pymupdf is None:
+                raise ImportError(
+                    "PDFLoader requires 'pymupdf' or 'pypdf' package. "
+                    "Install with: pip install pymupdf"
+                ) from e
+            self.pypdf = None
+
+        self.max_workers = max_workers or min(os.cpu_count() or 1, 8)
+
+    @property
+    def backend(self) -> str:
+        """Name of the PDF library in use"""
+        return 'pymupdf' if self.pymupdf is not None else 'pypdf'
+
+    def cache_key(self) -> str:
+        """Loader class plus the backend and its version"""
+        library = self.pymupdf if self.pymupdf is not None else self.pypdf
+        version = getattr(library, '__version__', 'unknown')
+        return f"{super().cache_key()}:{self.backend}-{version}"
+
+    @contextmanager
+    def _open(self, file_path: Path, data: Optional[bytes] = None) -> Iterator[Any]:
+        """
+        Open a PDF with the active backend
+
+        Yields a ``pymupdf.Document`` or a ``pypdf.PdfReader``; callers use it
+        for both text and metadata so the file is only parsed once. With
+        PyMuPDF, fonts and other resources are owned by the document, so every
+        page extracted from the same handle reuses them instead of reloading
+        them per page.
+        """
+        if self.pymupdf is not None:
+            if data is not None:
+                doc = self.pymupdf.open(stream=data, filetype='pdf')
+            else:
+                doc = self.pymupdf.open(str(file_path))
+            try:
+                yield doc
+            finally:
+                doc.close()
+        elif data is not None:
+            with io.BytesIO(data) as stream:
+                yield self.pypdf.PdfReader(stream)
+        else:
+            # pypdf issues many small seeks and reads while parsing; serve them
+            # from a read-only mapping of the page cache instead of syscalls
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    yield self.pypdf.PdfReader(f)  # mmap rejects empty files
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield self.pypdf.PdfReader(mapped)
         
     def load(self, file_path: Path) -> str:
         """Load PDF file and extract text"""
@@ -27,48 +179,145 @@ class PDFLoader(DocumentLoader):
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'rb') as f:
-                reader = self.pypdf.PdfReader(f)
-                
-                # Extract text from all pages
-                text_parts = []
-                for page_num, page in enumerate(reader.pages):
-                    page_text = page.extract_text()
-                    if page_text.strip():
-                        text_parts.append(page_text)
-                
-                return "\n\n".join(text_parts)
+            with self._open(file_path) as doc:
+                return self._extract_text(doc, file_path)
+        except Exception as e:
+            raise ValueError(f"Error loading PDF {file_path}: {e}")
+
+    def load_from_bytes(self, data: bytes, file_path: Path) -> str:
+        """Extract text from PDF contents that were already read"""
+        try:
+            with self._open(file_path, data) as doc:
+                return self._extract_text(doc, file_path)
         except Exception as e:
             raise ValueError(f"Error loading PDF {file_path}: {e}")
+
+    def load_with_metadata(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Extract text and metadata from a single opened document"""
+        if data is None and not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        metadata = self._file_metadata(file_path)
+        try:
+            with self._open(file_path, data) as doc:
+                content = self._extract_text(doc, file_path)
+                try:
+                    self._add_document_metadata(doc, metadata)
+                except Exception:
+                    pass  # If metadata extraction fails, just return basic info
+        except Exception as e:
+            raise ValueError(f"Error loading PDF {file_path}: {e}")
+
+        return content, metadata
+
+    def _extract_text(self, doc, file_path: Path) -> str:
+        """Extract and join non-empty page texts from an opened document"""
+        num_pages = doc.page_count if self.pymupdf is not None else len(doc.pages)
+
+        # Extract text from all pages
+        page_texts = None
+        if num_pages >= self.PARALLEL_MIN_PAGES[self.backend] and self.max_workers >= 2:
+            page_texts = self._extract_parallel(file_path, num_pages)
+        if page_texts is None:
+            page_texts = self._iter_page_texts(doc)
+
+        return "\n\n".join(page_text for page_text in page_texts if page_text.strip())
+
+    def _iter_page_texts(self, doc) -> Iterator[str]:
+        """
+        Yield the text of each page in order
+
+        Pages are extracted lazily, so each backend page object can be
+        released as soon as its text has been read.
+        """
+        if self.pymupdf is not None:
+            for page in doc:
+                yield page.get_text("text", flags=self._text_flags)
+        else:
+            # "plain" (not "layout") mode: no positional layout reconstruction
+            for page in doc.pages:
+                yield page.extract_text(extraction_mode="plain") or ''
+
+    def _extract_parallel(self, file_path: Path, num_pages: int) -> Optional[List[str]]:
+        """
+        Extract page text across worker processes.
+
+        Processes rather than threads for both backends: pypdf is pure Python
+        and holds the GIL, and MuPDF documents must not be shared between
+        threads. Each worker opens the file itself and extracts a contiguous
+        page range, on the shared pool from _get_pool.
+
+        Returns:
+            Page texts in page order, or None if the pool broke (e.g. a
+            worker was killed); the caller then extracts serially
+        """
+        pool = _get_pool(self.max_workers)
+        workers = min(self.max_workers, num_pages)
+        step = -(-num_pages // workers)  # ceiling division
+        ranges = [(start, min(start + step, num_pages)) for start in range(0, num_pages, step)]
+
+        try:
+            futures = [
+                pool.submit(_extract_page_range, str(file_path), start, stop, self.backend)
+                for start, stop in ranges
+            ]
+            page_texts = []
+            for future in futures:
+                page_texts.extend(future.result())
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            return None
+
+        return page_texts
     
     def supports(self, file_path: Path) -> bool:
         """Check if file is PDF"""
-        return file_path.suffix.lower() == '.pdf'
+        return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
     
     def get_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Extract metadata from PDF"""
+        metadata = self._file_metadata(file_path)
+        
+        try:
+            with self._open(file_path) as doc:
+                self._add_document_metadata(doc, metadata)
+        except Exception:
+            pass  # If metadata extraction fails, just return basic info
+        
+        return metadata
+
+    @staticmethod
+    def _file_metadata(file_path: Path) -> Dict[str, Any]:
+        """Basic metadata that does not require parsing the PDF"""
         stat = file_path.stat()
-        metadata = {
+        return {
             'filename': file_path.name,
             'file_size': stat.st_size,
             'file_type': '.pdf',
             'mime_type': 'application/pdf',
         }
+
+    def _add_document_metadata(self, doc, metadata: Dict[str, Any]):
+        """Add page count and document info from an opened document"""
+        if self.pymupdf is not None:
+            metadata['num_pages'] = doc.page_count
+            info = doc.metadata or {}
+            for key in ('title', 'author', 'subject'):
+                if info.get(key):
+                    metadata[key] = info[key]
+            return
+
+        metadata['num_pages'] = len(doc.pages)
         
-        try:
-            with open(file_path, 'rb') as f:
-                reader = self.pypdf.PdfReader(f)
-                metadata['num_pages'] = len(reader.pages)
-                
-                # Extract PDF metadata if available
-                if reader.metadata:
-                    if reader.metadata.title:
-                        metadata['title'] = reader.metadata.title
-                    if reader.metadata.author:
-                        metadata['author'] = reader.metadata.author
-                    if reader.metadata.subject:
-                        metadata['subject'] = reader.metadata.subject
-        except Exception:
-            pass  # If metadata extraction fails, just return basic info
-        
-        return metadata
+        # Extract PDF metadata if available
+        if doc.metadata:
+            if doc.metadata.title:
+                metadata['title'] = doc.metadata.title
+            if doc.metadata.author:
+                metadata['author'] = doc.metadata.author
+            if doc.metadata.subject:
+                metadata['subject'] = doc.metadata.subject
@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from .base import DocumentLoader
+from .cache import LoadCache
 from .text import TextLoader
 from .pdf import PDFLoader
 from .docx import DocxLoader
@@ -15,8 +16,17 @@ class LoaderRegistry:
     Manages available loaders and routes files to appropriate loader.
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[LoadCache] = None):
+        """
+        Args:
+            cache: Optional content-hash cache for expensive loaders (PDF, DOCX)
+        """
         self.loaders: List[DocumentLoader] = []
+        self.cache = cache
+        # Extension -> highest-priority loader declaring it
+        self._by_ext: Dict[str, DocumentLoader] = {}
+        # Set when a loader declares no extensions and must be asked via supports()
+        self._needs_scan = False
         self._register_default_loaders()
     
     def _register_default_loaders(self):
@@ -34,6 +44,18 @@ class LoaderRegistry:
             self.loaders.append(DocxLoader())
         except ImportError as e:
             print(f"Warning: DOCX loader not available: {e}")
+
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self):
+        """Rebuild the extension lookup table from the loaders, in priority order"""
+        self._by_ext = {}
+        self._needs_scan = False
+        for loader in self.loaders:
+            if not loader.SUPPORTED_EXTENSIONS:
+                self._needs_scan = True
+            for ext in loader.SUPPORTED_EXTENSIONS:
+                self._by_ext.setdefault(ext.lower(), loader)
     
     def get_loader(self, file_path: Path) -> Optional[DocumentLoader]:
         """
@@ -45,6 +67,11 @@ class LoaderRegistry:
         Returns:
             DocumentLoader instance or None if no loader supports the file
         """
+        if not self._needs_scan:
+            return self._by_ext.get(file_path.suffix.lower())
+
+        # Custom loaders without declared extensions: fall back to asking
+        # every loader in priority order
         for loader in self.loaders:
             if loader.supports(file_path):
                 return loader
@@ -62,13 +89,20 @@ class LoaderRegistry:
             self.loaders.insert(0, loader)
         else:
             self.loaders.append(loader)
+        self._rebuild_dispatch()
     
-    def load_document(self, file_path: Path) -> tuple[str, Dict[str, Any]]:
+    def load_document(
+        self,
+        file_path: Path,
+        data: Optional[bytes] = None
+    ) -> tuple[str, Dict[str, Any]]:
         """
         Load document using appropriate loader
         
         Args:
             file_path: Path to document
+            data: Optional file contents that were already read (e.g. by a
+                prefetcher), so the loader can skip reading the file again
             
         Returns:
             Tuple of (content, metadata)
@@ -85,16 +119,22 @@ class LoaderRegistry:
                 f"Supported types: {self.get_supported_extensions()}"
             )
         
-        content = loader.load(file_path)
-        metadata = loader.get_metadata(file_path)
-        
+        if self.cache is None or not loader.CACHE_RESULTS:
+            return loader.load_with_metadata(file_path, data)
+
+        # The same bytes parsed by another loader or backend may differ
+        key = f"{self.cache.fingerprint(file_path, data)}:{loader.cache_key()}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            content, metadata = cached
+            # Same bytes may live under a different name
+            metadata['filename'] = file_path.name
+            return content, metadata
+
+        content, metadata = loader.load_with_metadata(file_path, data)
+        self.cache.put(key, content, metadata)
         return content, metadata
     
     def get_supported_extensions(self) -> List[str]:
         """Get list of all supported file extensions"""
-        extensions = set()
-        for loader in self.loaders:
-            # All loaders should define SUPPORTED_EXTENSIONS
-            if hasattr(loader, 'SUPPORTED_EXTENSIONS'):
-                extensions.update(loader.SUPPORTED_EXTENSIONS)
-        return sorted(extensions)
+        return sorted(self._by_ext)
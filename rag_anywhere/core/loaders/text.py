@@ -1,5 +1,6 @@
 # rag_anywhere/core/loaders/text.py
 
+import codecs
 from pathlib import Path
 from typing import Dict, Any
 
@@ -10,6 +11,16 @@ class TextLoader(DocumentLoader):
     """Loader for plain text and markdown files"""
     
     SUPPORTED_EXTENSIONS = ['.txt', '.md', '.markdown', '.rst', '.text']
+
+    # Byte order marks and the codec they imply. UTF-32-LE's BOM starts
+    # with UTF-16-LE's, so the UTF-32 marks are checked first.
+    BOM_ENCODINGS = [
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ]
     
     def load(self, file_path: Path) -> str:
         """Load text file"""
@@ -17,17 +28,29 @@ class TextLoader(DocumentLoader):
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            try:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    return f.read()
-            except Exception as e:
-                raise ValueError(f"Could not decode file {file_path}: {e}")
+            # One sized binary read, then decode in memory; no text-mode
+            # buffering and no second read if UTF-8 decoding fails
+            data = file_path.read_bytes()
         except Exception as e:
             raise ValueError(f"Error loading file {file_path}: {e}")
+
+        return self.load_from_bytes(data, file_path)
+
+    def load_from_bytes(self, data: bytes, file_path: Path) -> str:
+        """Decode text file contents that were already read"""
+        for bom, encoding in self.BOM_ENCODINGS:
+            if data.startswith(bom):
+                try:
+                    return data.decode(encoding)
+                except UnicodeDecodeError:
+                    # Not what the mark claims: decode as if it had none
+                    break
+
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Try with different encoding (latin-1 accepts any byte sequence)
+            return data.decode('latin-1')
     
     def supports(self, file_path: Path) -> bool:
         """Check if file is a supported text format"""
@@ -1,6 +1,10 @@
 # rag_anywhere/core/searcher.py
 
-from typing import List, Dict, Any, Optional, Literal
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Literal, Tuple
+
+import numpy as np
 
 from .embeddings.providers.embedding_gemma import EmbeddingGemmaProvider, TaskType
 from .vector_store import VectorStore
@@ -66,11 +70,68 @@ class Searcher:
         self,
         document_store: DocumentStore,
         vector_store: VectorStore,
-        embedding_provider: EmbeddingGemmaProvider
+        embedding_provider: EmbeddingGemmaProvider,
+        query_cache_size: int = 1024
     ):
+        """
+        Args:
+            document_store: Document and chunk storage
+            vector_store: Vector index
+            embedding_provider: Embedding model for queries
+            query_cache_size: Number of recent query embeddings to keep
+                (0 disables the cache)
+        """
         self.document_store = document_store
         self.vector_store = vector_store
         self.embedding_provider = embedding_provider
+        self.query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
+    def _embed_query(self, query: str, task: TaskType) -> np.ndarray:
+        """
+        Embed a query, reusing the embedding of a recent identical query
+
+        Repeated queries (e.g. re-run with another top_k or min_score) skip
+        the model entirely. Cached vectors are read-only.
+        """
+        key = (query, task)
+        with self._query_cache_lock:
+            vector = self._query_cache.get(key)
+            if vector is not None:
+                self._query_cache.move_to_end(key)
+                self._query_cache_hits += 1
+                return vector
+            self._query_cache_misses += 1
+
+        vector = self.embedding_provider.embed_query(query, task=task)
+        if self.query_cache_size <= 0:
+            return vector
+
+        vector.setflags(write=False)
+        with self._query_cache_lock:
+            self._query_cache[key] = vector
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return vector
+
+    def query_cache_info(self) -> Dict[str, int]:
+        """
+        Get query embedding cache statistics
+
+        Returns:
+            Dict with hits, misses, size and max_size
+        """
+        with self._query_cache_lock:
+            return {
+                'hits': self._query_cache_hits,
+                'misses': self._query_cache_misses,
+                'size': len(self._query_cache),
+                'max_size': self.query_cache_size
+            }
 
     def search(
         self,
@@ -96,34 +157,31 @@ class Searcher:
             return []
 
         # Generate task-specific query embedding
-        query_vector = self.embedding_provider.embed_query(query, task=task)
+        query_vector = self._embed_query(query, task)
         
-        # Search vector store
-        raw_results = self.vector_store.search(query_vector, k=top_k)
+        # Search vector store; the score threshold is applied there, before
+        # any lookups, so discarded results cost nothing
+        raw_results = self.vector_store.search(query_vector, k=top_k, min_score=min_score)
         
-        # Enrich with document context
+        # Enrich with document context: one joined lookup instead of a
+        # chunk and a document query per result
+        chunks = self.document_store.get_chunks_with_documents(
+            [chunk_id for chunk_id, _ in raw_results]
+        )
+
         results = []
         for chunk_id, score in raw_results:
-            # Apply score threshold if specified
-            if min_score is not None and score < min_score:
-                continue
-            
-            # Get chunk details
-            chunk = self.document_store.get_chunk(chunk_id)
+            # Get chunk and document details
+            chunk = chunks.get(chunk_id)
             if chunk is None:
                 continue
             
-            # Get document details
-            document = self.document_store.get_document(chunk['document_id'])
-            if document is None:
-                continue
-            
             result = SearchResult(
                 chunk_id=chunk_id,
                 chunk_content=chunk['content'],
                 similarity_score=score,
-                document_id=document['id'],
-                document_filename=document['filename'],
+                document_id=chunk['document_id'],
+                document_filename=chunk['document_filename'],
                 chunk_index=chunk['chunk_index'],
                 start_char=chunk['start_char'],
                 end_char=chunk['end_char'],
@@ -150,15 +208,12 @@ class Searcher:
         Returns:
             Combined text with context
         """
-        chunks = self.document_store.get_chunks_by_document(doc_id)
-        
-        # Get range of chunks to include
-        start_idx = max(0, chunk_index - context_chunks)
-        end_idx = min(len(chunks), chunk_index + context_chunks + 1)
-        
-        context_texts = []
-        for i in range(start_idx, end_idx):
-            if i < len(chunks):
-                context_texts.append(chunks[i]['content'])
+        # Only fetch the chunks in the window, not the whole document
+        chunks = self.document_store.get_chunks_range(
+            doc_id,
+            max(0, chunk_index - context_chunks),
+            chunk_index + context_chunks
+        )
+        context_texts = [chunk['content'] for chunk in chunks]
         
         return "\n\n".join(context_texts)
@@ -5,7 +5,7 @@ from typing import List, Dict, Any, Callable, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TextChunk:
     """Represents a chunk of text with metadata"""
     content: str
@@ -17,6 +17,22 @@ class TextChunk:
         if self.metadata is None:
             self.metadata = {}
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any], doc_id: str) -> "TextChunk":
+        """
+        Build a chunk from a stored chunk row (as returned by DocumentStore)
+
+        Args:
+            row: Chunk row with content, start_char, end_char and chunk_index
+            doc_id: ID of the document the chunk belongs to
+        """
+        return cls(
+            row['content'],
+            row['start_char'],
+            row['end_char'],
+            {'document_id': doc_id, 'chunk_index': row['chunk_index']}
+        )
+
 
 class TextSplitter(ABC):
     """Base interface for text splitting strategies"""
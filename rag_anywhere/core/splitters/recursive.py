@@ -1,6 +1,6 @@
 # rag_anywhere/core/splitters/recursive.py
 
-from typing import List
+from typing import List, Tuple
 
 from .base import TextSplitter, TextChunk
 
@@ -10,6 +10,12 @@ class RecursiveTextSplitter(TextSplitter):
     Splits text recursively optimized for 2048 token models.
     Default chunk size: ~1500 tokens (~5000 chars) to stay safely under 2048
     """
+
+    # Preferred break points, highest priority first
+    SEPARATORS = ('\n\n', '\n', '. ', '! ', '? ', '; ', ', ')
+
+    # Safety margin under the model's 2048 token limit
+    MAX_CHUNK_TOKENS = 1800
     
     def __init__(
         self, 
@@ -20,86 +26,127 @@ class RecursiveTextSplitter(TextSplitter):
         super().__init__(token_estimator)
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        # Smallest offset into a chunk that is strictly beyond 70% of chunk_size
+        self._min_break_offset = int(chunk_size * 0.7) + 1
+        # The default estimate is len // 4, which can be computed from the
+        # boundaries without slicing
+        self._uses_default_estimator = self.token_estimator is TextSplitter._default_token_estimate
     
     @property
     def name(self) -> str:
         return "recursive"
     
     def split(self, text: str) -> List[TextChunk]:
+        # Pass 1 only decides where chunks go; pass 2 builds the TextChunks
         chunks = []
+        text_len = len(text)
+        for start, end, estimated_tokens in self._boundaries(text):
+            # Trim surrounding whitespace by moving the bounds (rarely more
+            # than a character or two) rather than slicing and then stripping,
+            # so the chunk is sliced once and its offsets match its content
+            end = min(end, text_len)
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+
+            if start < end:  # Only add non-empty chunks
+                chunks.append(TextChunk(
+                    content=text[start:end],
+                    start_char=start,
+                    end_char=end,
+                    metadata={
+                        'estimated_tokens': estimated_tokens,
+                        'splitter': self.name
+                    }
+                ))
+        
+        return chunks
+
+    def _boundaries(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Compute chunk boundaries without building any chunks
+
+        Returns:
+            List of (start, end, estimated_tokens) tuples
+        """
+        boundaries = []
         start = 0
+        text_len = len(text)
 
-        while start < len(text):
+        # Boundary searches use str.rfind with start/end bounds on the full
+        # text; slices are only taken for custom token estimators
+        while start < text_len:
             # Calculate end position
             end = start + self.chunk_size
 
-            # Get chunk text
-            chunk_text = text[start:end]
-
             # Try to break at natural boundaries - NEVER break words mid-word
-            if end < len(text):
+            if end < text_len:
                 # Priority order: paragraph > sentence > space (any whitespace)
-                # Try preferred separators first (70% threshold for good breaks)
+                # Try preferred separators first (70% threshold for good breaks).
+                # Only the tail past the threshold can hold a good break, so
+                # each separator scan covers ~30% of the chunk, not all of it.
                 found_break = False
-                for separator in ['\n\n', '\n', '. ', '! ', '? ', '; ', ', ']:
-                    last_sep = chunk_text.rfind(separator)
-                    if last_sep > self.chunk_size * 0.7:  # At least 70% of target
-                        end = start + last_sep + len(separator)
-                        chunk_text = text[start:end]
+                break_from = start + self._min_break_offset
+                for separator in self.SEPARATORS:
+                    last_sep = text.rfind(separator, break_from, end)
+                    if last_sep != -1:  # At least 70% of target
+                        end = last_sep + len(separator)
                         found_break = True
                         break
 
                 # If no good break found, find ANY whitespace to avoid breaking words
                 if not found_break:
                     # Search backwards from end for any whitespace
-                    last_space = chunk_text.rfind(' ')
-                    last_newline = chunk_text.rfind('\n')
-                    last_tab = chunk_text.rfind('\t')
-                    last_whitespace = max(last_space, last_newline, last_tab)
-
-                    if last_whitespace > 0:  # Found whitespace anywhere in chunk
-                        end = start + last_whitespace + 1
-                        chunk_text = text[start:end]
+                    last_whitespace = self._last_whitespace(text, start, end)
+
+                    if last_whitespace > start:  # Found whitespace anywhere in chunk
+                        end = last_whitespace + 1
                     # If NO whitespace at all (pathological case: 6000+ chars no space)
                     # just hard break but this is extremely rare
-            
+
             # Verify we're under token limit
-            estimated_tokens = self.token_estimator(chunk_text)
-            while estimated_tokens > 1800:  # Safety margin under 2048
-                # Reduce chunk size and find whitespace boundary
-                reduction = int(self.chunk_size * 0.1)
-                end -= reduction
+            estimated_tokens = self._estimate_tokens(text, start, end)
+            while estimated_tokens > self.MAX_CHUNK_TOKENS:
+                # Tokens grow roughly linearly with length, so jump straight
+                # to the length that should fit (with a 5% margin) rather than
+                # shrinking in fixed steps and re-estimating each time.
+                # end strictly decreases, so this always terminates.
+                current_end = min(end, text_len)
+                target = start + int(
+                    (current_end - start) * self.MAX_CHUNK_TOKENS / estimated_tokens * 0.95
+                )
+                end = max(start, min(target, current_end - 1))
 
                 # Find last whitespace before new end position
-                temp_chunk = text[start:end]
-                last_space = temp_chunk.rfind(' ')
-                last_newline = temp_chunk.rfind('\n')
-                last_tab = temp_chunk.rfind('\t')
-                last_whitespace = max(last_space, last_newline, last_tab)
-
-                if last_whitespace > 0:
-                    end = start + last_whitespace + 1
-                    chunk_text = text[start:end]
-                else:
-                    # Pathological case: no whitespace found, hard break
-                    chunk_text = text[start:end]
-
-                estimated_tokens = self.token_estimator(chunk_text)
+                last_whitespace = self._last_whitespace(text, start, end)
+
+                if last_whitespace > start:
+                    end = last_whitespace + 1
+                # else: pathological case, no whitespace found, hard break
+
+                estimated_tokens = self._estimate_tokens(text, start, end)
             
-            if chunk_text.strip():  # Only add non-empty chunks
-                chunks.append(TextChunk(
-                    content=chunk_text.strip(),
-                    start_char=start,
-                    end_char=end,
-                    metadata={
-                        'estimated_tokens': estimated_tokens,
-                        'splitter': self.name
-                    }
-                ))
+            boundaries.append((start, end, estimated_tokens))
             
             # Move start position with overlap
             start = end - self.chunk_overlap
             if start >= len(text):
                 break
         
-        return chunks
+        return boundaries
+
+    def _estimate_tokens(self, text: str, start: int, end: int) -> int:
+        """Token estimate for text[start:end]"""
+        if self._uses_default_estimator:
+            return (min(end, len(text)) - start) // 4
+        return self.token_estimator(text[start:end])
+
+    @staticmethod
+    def _last_whitespace(text: str, start: int, end: int) -> int:
+        """Index of the last space, newline or tab in text[start:end], or -1"""
+        return max(
+            text.rfind(' ', start, end),
+            text.rfind('\n', start, end),
+            text.rfind('\t', start, end)
+        )
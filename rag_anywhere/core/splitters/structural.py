@@ -1,12 +1,16 @@
 # rag_anywhere/core/splitters/structural.py
 
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from .base import TextSplitter, TextChunk
 from .recursive import RecursiveTextSplitter
 
 
+# Paragraph separator (one or more blank lines)
+_PARA_RE = re.compile(r'\n\n+')
+
+
 class StructuralTextSplitter(TextSplitter):
     """
     Splits based on document structure, respecting 2048 token limit
@@ -22,6 +26,8 @@ class StructuralTextSplitter(TextSplitter):
         super().__init__(token_estimator)
         self.min_chunk_size = min_chunk_size
         self.max_chunk_size = max_chunk_size
+        # Fallback for oversized sections, created on first use
+        self._recursive: Optional[RecursiveTextSplitter] = None
     
     @property
     def name(self) -> str:
@@ -33,21 +39,29 @@ class StructuralTextSplitter(TextSplitter):
         # Split by structural elements
         sections = self._identify_sections(text)
         
-        current_chunk = ""
+        # The current chunk is kept as its sections plus their joined length
+        # and only joined when it is emitted; appending to a growing string
+        # would copy everything accumulated so far on every section
+        current_parts: List[str] = []
+        current_len = 0
         current_start = 0
+        # Running estimate for the current chunk: sections are estimated once
+        # and added up, so the growing chunk is never re-estimated
+        current_tokens = self.token_estimator("")
+        separator_tokens = self.token_estimator("\n\n")
+        uses_default_estimator = self.token_estimator is TextSplitter._default_token_estimate
         
         for section_text, section_start in sections:
             estimated_tokens = self.token_estimator(section_text)
-            current_tokens = self.token_estimator(current_chunk)
             
             # If section alone is too large, split it
             if estimated_tokens > 1800:
-                if current_chunk:
+                if current_parts:
                     # Save current chunk
                     chunks.append(TextChunk(
-                        content=current_chunk.strip(),
+                        content="\n\n".join(current_parts).strip(),
                         start_char=current_start,
-                        end_char=current_start + len(current_chunk),
+                        end_char=current_start + current_len,
                         metadata={
                             'split_type': 'structural',
                             'estimated_tokens': current_tokens,
@@ -56,49 +70,65 @@ class StructuralTextSplitter(TextSplitter):
                     ))
                 
                 # Recursively split large section
-                recursive = RecursiveTextSplitter(
-                    chunk_size=self.max_chunk_size,
-                    token_estimator=self.token_estimator
-                )
-                sub_chunks = recursive.split(section_text)
+                if self._recursive is None:
+                    self._recursive = RecursiveTextSplitter(
+                        chunk_size=self.max_chunk_size,
+                        token_estimator=self.token_estimator
+                    )
+                sub_chunks = self._recursive.split(section_text)
                 chunks.extend(sub_chunks)
                 
-                current_chunk = ""
+                current_parts = []
+                current_len = 0
                 current_start = section_start + len(section_text)
+                current_tokens = self.token_estimator("")
             
             # If adding would exceed max, save current and start new
             elif current_tokens + estimated_tokens > 1800:
-                if current_chunk:
+                if current_parts:
                     chunks.append(TextChunk(
-                        content=current_chunk.strip(),
+                        content="\n\n".join(current_parts).strip(),
                         start_char=current_start,
-                        end_char=current_start + len(current_chunk),
+                        end_char=current_start + current_len,
                         metadata={
                             'split_type': 'structural',
                             'estimated_tokens': current_tokens,
                             'splitter': self.name
                         }
                     ))
-                current_chunk = section_text
+                current_parts = [section_text]
+                current_len = len(section_text)
                 current_start = section_start
+                current_tokens = estimated_tokens
             
             # Otherwise, accumulate
             else:
-                if current_chunk:
-                    current_chunk += "\n\n" + section_text
+                if current_parts:
+                    current_parts.append(section_text)
+                    current_len += 2 + len(section_text)
+                    if uses_default_estimator:
+                        # len // 4 does not add up across pieces; it is exact
+                        # (and free) on the joined length
+                        current_tokens = current_len // 4
+                    else:
+                        # Per-piece tokenizer counts include special tokens,
+                        # so the sum errs on the high (safe) side
+                        current_tokens += separator_tokens + estimated_tokens
                 else:
-                    current_chunk = section_text
+                    current_parts = [section_text]
+                    current_len = len(section_text)
                     current_start = section_start
+                    current_tokens = estimated_tokens
         
         # Add final chunk
-        if current_chunk and len(current_chunk) >= self.min_chunk_size:
+        if current_parts and current_len >= self.min_chunk_size:
             chunks.append(TextChunk(
-                content=current_chunk.strip(),
+                content="\n\n".join(current_parts).strip(),
                 start_char=current_start,
-                end_char=current_start + len(current_chunk),
+                end_char=current_start + current_len,
                 metadata={
                     'split_type': 'structural',
-                    'estimated_tokens': self.token_estimator(current_chunk),
+                    'estimated_tokens': current_tokens,
                     'splitter': self.name
                 }
             ))
@@ -109,13 +139,17 @@ class StructuralTextSplitter(TextSplitter):
         """Identify structural sections in document"""
         sections = []
         
-        # Split by double newlines (paragraphs)
-        paragraphs = re.split(r'\n\n+', text)
-        
-        current_pos = 0
-        for para in paragraphs:
+        # Split by blank lines (paragraphs), taking each paragraph's start
+        # from the match offsets so runs of 3+ newlines are counted exactly
+        para_start = 0
+        for match in _PARA_RE.finditer(text):
+            para = text[para_start:match.start()]
             if para.strip():
-                sections.append((para, current_pos))
-            current_pos += len(para) + 2  # Account for \n\n
+                sections.append((para, para_start))
+            para_start = match.end()
+
+        para = text[para_start:]
+        if para.strip():
+            sections.append((para, para_start))
         
         return sections
@@ -0,0 +1,29 @@
+# rag_anywhere/core/sqlite_utils.py
+
+"""Helpers shared by the SQLite-backed stores"""
+
+from typing import Iterator, List, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# IDs per "IN (...)" query, under SQLite's bound-parameter limit (999 in
+# builds before 3.32)
+IN_BATCH_SIZE = 900
+
+
+def batched(ids: Sequence[T], size: int = IN_BATCH_SIZE) -> Iterator[Tuple[List[T], str]]:
+    """
+    Split IDs into batches small enough to bind in one "IN (...)" clause
+
+    Args:
+        ids: IDs to split
+        size: Maximum IDs per batch
+
+    Yields:
+        Tuples of (batch, placeholders), where placeholders is the
+        comma-separated "?" list for the batch
+    """
+    ids = list(ids)
+    for start in range(0, len(ids), size):
+        batch = ids[start:start + size]
+        yield batch, ','.join('?' * len(batch))
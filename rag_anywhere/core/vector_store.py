@@ -1,9 +1,12 @@
 # rag_anywhere/core/vector_store.py
 
+import json
 import sqlite3
+import threading
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from .sqlite_utils import batched
 from ..utils.logging import get_logger
 
 logger = get_logger('core.vector_store')
@@ -12,9 +15,53 @@ logger = get_logger('core.vector_store')
 class VectorStore:
     """
     Hybrid vector store: FAISS for fast search + SQLite for persistence
+
+    Vectors are persisted in pages of up to VECTORS_PER_PAGE per row
+    (chunk_vector_pages): SQLite write cost follows row count far more than
+    bytes, so this cuts B-tree inserts and WAL frames on bulk ingest. The
+    page of each vector is recorded in chunk_vector_locations, so deletes
+    find their pages in SQL, including pages written by other connections.
+
+    add_batch is the only writer and normalizes before persisting, so stored
+    vectors are already unit length and are indexed as is on load.
     """
+
+    VECTORS_PER_PAGE = 32
+
+    # With index_type="auto", corpora larger than this are loaded into an
+    # HNSW graph (approximate, sub-linear search) instead of a flat index
+    # (exact, brute force)
+    HNSW_MIN_VECTORS = 10_000
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+
+    # Deleted vectors leave free slots in id_map (and, since HNSW cannot
+    # remove vectors, tombstones in an HNSW graph); the index is rebuilt
+    # from SQLite once they exceed this fraction of id_map
+    MAX_DELETED_RATIO = 0.1
+
+    # index_type="sq8" keeps vectors as 8-bit codes (a quarter of float32),
+    # with per-dimension ranges trained on a sample of up to SQ8_TRAIN_SIZE
+    # stored vectors. Ranges trained on a handful of vectors would clip
+    # every later one, so stores smaller than SQ8_MIN_TRAIN_SIZE use a flat
+    # index, and the quantizer is trained once the store grows past it
+    SQ8_TRAIN_SIZE = 10_000
+    SQ8_MIN_TRAIN_SIZE = 1_000
     
-    def __init__(self, db_path: str, dimension: int = 768):
+    def __init__(self, db_path: str, dimension: int = 768, index_type: str = "auto"):
+        """
+        Args:
+            db_path: Path to the SQLite database
+            dimension: Embedding dimension
+            index_type: "flat" (exact), "hnsw" (approximate), "sq8" (exact
+                search over 8-bit quantized vectors, 4x less memory; flat
+                below SQ8_MIN_TRAIN_SIZE vectors) or "auto" (flat below
+                HNSW_MIN_VECTORS vectors, HNSW above)
+        """
+        if index_type not in ("auto", "flat", "hnsw", "sq8"):
+            raise ValueError(f"Unknown index type: {index_type}")
+
         try:
             import faiss
             self.faiss = faiss
@@ -31,81 +78,316 @@ class VectorStore:
 
         self.db_path = db_path
         self.dimension = dimension
+        self.index_type = index_type
+        # Kind of the index actually built ("flat", "hnsw" or "sq8")
+        self.index_kind = "flat"
+        # Vectors still in an HNSW graph whose chunks were deleted
+        self._tombstones = 0
 
         try:
             # FAISS index for inner-product similarity search. Always initialized
             # to a valid (possibly empty) index so type checkers know it's not None.
-            logger.debug(f"Creating FAISS IndexFlatIP with dimension {self.dimension}")
-            self.index: faiss.IndexFlatIP = self.faiss.IndexFlatIP(self.dimension)
+            logger.debug(f"Creating FAISS index with dimension {self.dimension}")
+            self.index: faiss.IndexIDMap
+            self.index, self.index_kind = self._new_index(0)
             logger.debug("FAISS index created successfully")
         except Exception as e:
             logger.error(f"Failed to create FAISS index: {type(e).__name__}: {e}", exc_info=True)
             raise
 
-        # Maps FAISS index positions to chunk IDs
-        self.id_map: Dict[int, str] = {}
+        # Maps FAISS IDs to chunk IDs, and back. FAISS IDs are assigned
+        # sequentially and never reused, so id_map is a list indexed by FAISS
+        # ID; deleted vectors leave a None instead of renumbering the rest.
+        self.id_map: List[Optional[str]] = []
+        self._faiss_ids: Dict[str, int] = {}
+
+        # One long-lived connection; the server may call in from several
+        # threads, so every use of it is serialized. Writers (add, delete
+        # and index rebuilds) hold this lock for their whole operation, so
+        # a rebuild never misses vectors added while it runs.
+        self.conn = self._connect()
+        self._lock = threading.Lock()
+        # Guards the FAISS index itself: searches may run on server worker
+        # threads while documents are added or removed. Always taken after
+        # _lock, never before it.
+        self._index_lock = threading.RLock()
+        # Reused (1, dim) query batch for search; only touched under _index_lock
+        self._query_buf = np.empty((1, self.dimension), dtype=np.float32)
 
         self._load_or_create()
     
+    def _new_index(self, num_vectors: int):
+        """
+        Create an empty index sized for num_vectors vectors, and its kind
+
+        The inner-product index (flat or HNSW) is wrapped in an IndexIDMap
+        so vectors carry stable IDs; flat indexes can then remove vectors in
+        place with remove_ids instead of being rebuilt.
+        """
+        use_hnsw = self.index_type == "hnsw" or (
+            self.index_type == "auto" and num_vectors > self.HNSW_MIN_VECTORS
+        )
+
+        if self.index_type == "sq8" and num_vectors >= self.SQ8_MIN_TRAIN_SIZE:
+            # Needs training (see _train) before vectors are added
+            return self.faiss.IndexIDMap(self.faiss.IndexScalarQuantizer(
+                self.dimension,
+                self.faiss.ScalarQuantizer.QT_8bit,
+                self.faiss.METRIC_INNER_PRODUCT
+            )), "sq8"
+
+        if not use_hnsw:
+            return self.faiss.IndexIDMap(self.faiss.IndexFlatIP(self.dimension)), "flat"
+
+        base = self.faiss.IndexHNSWFlat(self.dimension, self.HNSW_M, self.faiss.METRIC_INNER_PRODUCT)
+        base.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+        base.hnsw.efSearch = self.HNSW_EF_SEARCH
+        return self.faiss.IndexIDMap(base), "hnsw"
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection tuned for write throughput
+
+        WAL with synchronous=NORMAL fsyncs only at checkpoints instead of
+        twice per commit. The connection is in autocommit mode; multi-row
+        writes open their own transaction.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+        conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+        """)
+        return conn
+    
     def _load_or_create(self):
         """Load vectors from SQLite into FAISS on startup"""
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        """
+        Build the FAISS index from the vectors in SQLite
+
+        Caller holds the lock, so no write can happen while the pages are
+        read; searches keep using the old index until the new one is
+        swapped in under _index_lock.
+        """
         logger.debug("Loading vectors from SQLite into FAISS")
 
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            self._migrate_row_vectors()
 
-            # Get all vectors from database
-            logger.debug("Querying chunk_vectors table")
-            cursor.execute("SELECT chunk_id, vector FROM chunk_vectors")
-            rows = cursor.fetchall()
-            conn.close()
+            page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+            if page_size < 8192:
+                logger.warning(
+                    f"Database page size is {page_size} bytes; vector pages load "
+                    f"faster from databases created with 8192-byte pages"
+                )
+
+            # Size the load from blob lengths (read from record headers,
+            # without touching the vector data)
+            num_pages, total_bytes = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length(vectors)), 0) FROM chunk_vector_pages"
+            ).fetchone()
+            logger.debug(f"Found {num_pages} vector pages in database")
+
+            page_bytes = 4 * self.dimension
+            num_vectors = total_bytes // page_bytes
+            chunk_ids: List[str] = []
+            # (chunk_id, page_id) of every stored vector
+            locations: List[Tuple[str, int]] = []
+            # FAISS' Python bindings expose multiple index types; the
+            # index in this project expects a 2D float32 array of shape
+            # (n, d) as the first positional argument.
+            vectors_array = np.empty((num_vectors, self.dimension), dtype=np.float32)
+
+            if num_pages:
+                # Stream the pages straight into the preallocated array:
+                # each blob is copied once, and neither the full row list
+                # nor a joined copy of every blob is held in memory.
+                # Vectors were normalized when written, so no norm pass here.
+                logger.info(f"Loading {num_pages} vector pages into FAISS index...")
+                cursor = self.conn.execute(
+                    "SELECT page_id, chunk_ids, vectors FROM chunk_vector_pages ORDER BY page_id"
+                )
+                while rows := cursor.fetchmany(1000):
+                    for page_id, page_chunk_ids, vectors_blob in rows:
+                        page_chunk_ids = json.loads(page_chunk_ids)
+                        start = len(chunk_ids)
+                        end = start + len(page_chunk_ids)
+
+                        # Guard against any shape mismatch at runtime
+                        if len(vectors_blob) != len(page_chunk_ids) * page_bytes or end > num_vectors:
+                            error_msg = (
+                                f"Stored vector page {page_id} has {len(vectors_blob)} bytes, "
+                                f"expected {len(page_chunk_ids)} x {self.dimension} float32 values"
+                            )
+                            logger.error(error_msg)
+                            raise ValueError(error_msg)
+
+                        vectors_array[start:end] = np.frombuffer(
+                            vectors_blob, dtype=np.float32
+                        ).reshape(-1, self.dimension)
+                        locations.extend((chunk_id, page_id) for chunk_id in page_chunk_ids)
+                        chunk_ids.extend(page_chunk_ids)
 
-            logger.debug(f"Found {len(rows)} vectors in database")
-
-            # Reset index and mapping to ensure we are always in a consistent state
-            logger.debug("Resetting FAISS index and ID mapping")
-            self.index = self.faiss.IndexFlatIP(self.dimension)
-            self.id_map = {}
-
-            if rows:
-                # Load existing vectors into FAISS
-                logger.info(f"Loading {len(rows)} vectors into FAISS index...")
-                vectors = []
-                chunk_ids = []
-
-                for chunk_id, vector_blob in rows:
-                    vector = np.frombuffer(vector_blob, dtype=np.float32)
-                    vectors.append(vector)
-                    chunk_ids.append(chunk_id)
-
-                if vectors:
-                    # FAISS' Python bindings expose multiple index types; IndexFlatIP
-                    # in this project expects a 2D float32 array of shape (n, d) as
-                    # the first positional argument.
-                    vectors_array = np.asarray(vectors, dtype=np.float32)
-                    logger.debug(f"Vectors array shape: {vectors_array.shape}")
-
-                    # Guard against any shape mismatch at runtime
-                    if vectors_array.ndim != 2 or vectors_array.shape[1] != self.dimension:
-                        error_msg = f"Stored vectors have wrong shape {vectors_array.shape}, expected (*, {self.dimension})"
-                        logger.error(error_msg)
-                        raise ValueError(error_msg)
-
-                    # Populate FAISS index and ID mapping. The IndexFlatIP.add
-                    # binding takes the 2D float32 array as its single argument.
-                    # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
-                    logger.debug("Adding vectors to FAISS index")
-                    self.index.add(vectors_array.astype(np.float32))  # type: ignore[call-arg]
-                    self.id_map = {i: chunk_id for i, chunk_id in enumerate(chunk_ids)}
-                    logger.info(f"✓ Successfully loaded {len(vectors)} vectors into FAISS index")
+            self._sync_locations(locations)
+
+            # Build the new index and mapping off to the side (HNSW
+            # construction can take a while; searches keep using the old
+            # index), then swap them in together
+            logger.debug("Building FAISS index and ID mapping")
+            index, index_kind = self._new_index(len(chunk_ids))
+            if chunk_ids:
+                logger.debug(f"Vectors array shape: {vectors_array.shape}")
+
+                # Populate FAISS index. The add_with_ids binding takes the
+                # 2D float32 array and int64 IDs.
+                # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
+                logger.debug("Adding vectors to FAISS index")
+                faiss_ids = np.arange(len(chunk_ids), dtype=np.int64)
+                if not index.is_trained:
+                    self._train(index, vectors_array)
+                index.add_with_ids(vectors_array, faiss_ids)  # type: ignore[call-arg]
+
+            with self._index_lock:
+                self.index = index
+                self.index_kind = index_kind
+                self._tombstones = 0
+                self.id_map = chunk_ids
+                self._faiss_ids = {chunk_id: i for i, chunk_id in enumerate(chunk_ids)}
+
+            if chunk_ids:
+                logger.info(
+                    f"✓ Successfully loaded {len(chunk_ids)} vectors into FAISS "
+                    f"{index_kind} index"
+                )
             else:
-                # Already initialized to an empty index above
                 logger.info("✓ Created new empty FAISS index")
 
         except Exception as e:
             logger.error(f"Failed to load vectors: {type(e).__name__}: {e}", exc_info=True)
             raise
+
+    def _train(self, index, vectors: np.ndarray):
+        """
+        Train a quantized index on an evenly spaced sample of all stored
+        vectors (every rebuild trains a new index, so ranges follow the
+        store as it grows)
+        """
+        step = max(1, len(vectors) // self.SQ8_TRAIN_SIZE)
+        # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
+        index.train(vectors[::step][:self.SQ8_TRAIN_SIZE])  # type: ignore[call-arg]
+
+    def _migrate_row_vectors(self):
+        """
+        Move vectors stored one per row in chunk_vectors (older databases)
+        into packed pages. Caller holds the lock.
+        """
+        rows = self.conn.execute("SELECT chunk_id, vector FROM chunk_vectors ORDER BY rowid").fetchall()
+        if not rows:
+            return
+
+        logger.info(f"Packing {len(rows)} stored vectors into pages...")
+        chunk_ids = [chunk_id for chunk_id, _ in rows]
+        vectors = np.frombuffer(
+            b"".join(vector_blob for _, vector_blob in rows), dtype=np.float32
+        ).reshape(len(rows), -1)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._write_pages(chunk_ids, vectors)
+            self.conn.execute("DELETE FROM chunk_vectors")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _sync_locations(self, locations: List[Tuple[str, int]]):
+        """
+        Rebuild chunk_vector_locations from the pages if it does not match
+        them (databases from before the table existed). Caller holds the lock.
+        """
+        (num_locations,) = self.conn.execute(
+            "SELECT COUNT(*) FROM chunk_vector_locations"
+        ).fetchone()
+        if num_locations == len(locations):
+            return
+
+        logger.info(f"Indexing the pages of {len(locations)} stored vectors...")
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute("DELETE FROM chunk_vector_locations")
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO chunk_vector_locations (chunk_id, page_id) VALUES (?, ?)",
+                locations
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+    def _write_pages(self, chunk_ids: List[str], vectors: np.ndarray):
+        """
+        Store float32 vectors VECTORS_PER_PAGE to a row. Caller holds the
+        lock and has a transaction open.
+        """
+        for start in range(0, len(chunk_ids), self.VECTORS_PER_PAGE):
+            page_chunk_ids = chunk_ids[start:start + self.VECTORS_PER_PAGE]
+            cursor = self.conn.execute(
+                "INSERT INTO chunk_vector_pages (chunk_ids, vectors) VALUES (?, ?)",
+                (json.dumps(page_chunk_ids), vectors[start:start + len(page_chunk_ids)].tobytes())
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO chunk_vector_locations (chunk_id, page_id) VALUES (?, ?)",
+                [(chunk_id, cursor.lastrowid) for chunk_id in page_chunk_ids]
+            )
+
+    def _remove_from_pages(self, chunk_ids: List[str]):
+        """
+        Drop vectors from their pages, rewriting each affected page once.
+        Chunk IDs without a stored vector are ignored. Caller holds the lock
+        and has a transaction open.
+        """
+        removed = set(chunk_ids)
+
+        # Look the pages up (and forget the locations) with batched IN
+        # queries, staying under SQLite's bound-parameter limit
+        page_ids = set()
+        for batch, placeholders in batched(removed):
+            page_ids.update(page_id for (page_id,) in self.conn.execute(
+                f"SELECT page_id FROM chunk_vector_locations WHERE chunk_id IN ({placeholders})",
+                batch
+            ))
+            self.conn.execute(
+                f"DELETE FROM chunk_vector_locations WHERE chunk_id IN ({placeholders})",
+                batch
+            )
+
+        pages = []
+        for batch, placeholders in batched(page_ids):
+            pages.extend(self.conn.execute(
+                f"SELECT page_id, chunk_ids, vectors FROM chunk_vector_pages WHERE page_id IN ({placeholders})",
+                batch
+            ).fetchall())
+
+        for page_id, page_chunk_ids, vectors_blob in pages:
+            page_chunk_ids = json.loads(page_chunk_ids)
+            keep = [offset for offset, chunk_id in enumerate(page_chunk_ids) if chunk_id not in removed]
+
+            if not keep:
+                self.conn.execute("DELETE FROM chunk_vector_pages WHERE page_id = ?", (page_id,))
+                continue
+
+            # Kept vectors stay on the same page, so their locations hold
+            page_vectors = np.frombuffer(vectors_blob, dtype=np.float32).reshape(-1, self.dimension)
+            self.conn.execute(
+                "UPDATE chunk_vector_pages SET chunk_ids = ?, vectors = ? WHERE page_id = ?",
+                (json.dumps([page_chunk_ids[offset] for offset in keep]), page_vectors[keep].tobytes(), page_id)
+            )
     
     def add(self, chunk_id: str, vector: np.ndarray):
         """
@@ -118,27 +400,7 @@ class VectorStore:
         if vector.shape[0] != self.dimension:
             raise ValueError(f"Vector dimension mismatch: expected {self.dimension}, got {vector.shape[0]}")
         
-        # Ensure vector is normalized for cosine similarity
-        norm = np.linalg.norm(vector)
-        if norm > 0:
-            vector = vector / norm
-        
-        # Add to FAISS
-        faiss_id = len(self.id_map)
-        to_add = np.array([vector], dtype=np.float32, copy=False)
-        # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
-        self.index.add(to_add)  # type: ignore[call-arg]
-        self.id_map[faiss_id] = chunk_id
-        
-        # Persist to SQLite
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO chunk_vectors (chunk_id, vector) VALUES (?, ?)",
-            (chunk_id, vector.astype(np.float32).tobytes())
-        )
-        conn.commit()
-        conn.close()
+        self.add_batch([chunk_id], vector.reshape(1, -1))
     
     def add_batch(self, chunk_ids: List[str], vectors: np.ndarray):
         """
@@ -154,41 +416,53 @@ class VectorStore:
         if vectors.shape[1] != self.dimension:
             raise ValueError(f"Vector dimension mismatch: expected {self.dimension}, got {vectors.shape[1]}")
         
-        # Normalize vectors
-        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-        norms[norms == 0] = 1  # Avoid division by zero
-        vectors = vectors / norms
-        
-        # Add to FAISS
-        start_id = len(self.id_map)
-        to_add_batch = vectors.astype(np.float32, copy=False)
-        # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
-        self.index.add(to_add_batch)  # type: ignore[call-arg]
-        
-        # Update ID mapping
-        for i, chunk_id in enumerate(chunk_ids):
-            self.id_map[start_id + i] = chunk_id
-        
-        # Persist to SQLite
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Normalize vectors in place with FAISS' SIMD kernel (zero rows are
+        # left as is) on one contiguous float32 copy, which FAISS and SQLite
+        # both store; the caller's array is untouched
+        vectors = np.array(vectors, dtype=np.float32, order='C')
+        self.faiss.normalize_L2(vectors)
         
-        for chunk_id, vector in zip(chunk_ids, vectors):
-            cursor.execute(
-                "INSERT OR REPLACE INTO chunk_vectors (chunk_id, vector) VALUES (?, ?)",
-                (chunk_id, vector.astype(np.float32).tobytes())
-            )
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            # Persist to SQLite as packed pages in one transaction; a chunk
+            # ID that is already stored is replaced
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._remove_from_pages(chunk_ids)
+                self._write_pages(list(chunk_ids), vectors)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+            # Add to FAISS; a chunk ID that is already indexed is replaced,
+            # as in SQLite above
+            with self._index_lock:
+                self._remove_from_index(chunk_ids)
+                next_id = len(self.id_map)
+                faiss_ids = np.arange(next_id, next_id + len(chunk_ids), dtype=np.int64)
+                # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
+                self.index.add_with_ids(vectors, faiss_ids)  # type: ignore[call-arg]
+
+                # Update ID mapping
+                self.id_map.extend(chunk_ids)
+                for faiss_id, chunk_id in enumerate(chunk_ids, next_id):
+                    self._faiss_ids[chunk_id] = faiss_id
+
+            self._rebuild_if_needed()
     
-    def search(self, query_vector: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
         """
         Search for similar vectors
         
         Args:
             query_vector: Query embedding (768-dimensional)
             k: Number of results to return
+            min_score: Drop results with a lower similarity
             
         Returns:
             List of (chunk_id, similarity_score) tuples, sorted by similarity
@@ -199,50 +473,115 @@ class VectorStore:
         if query_vector.shape[0] != self.dimension:
             raise ValueError(f"Query vector dimension mismatch: expected {self.dimension}, got {query_vector.shape[0]}")
         
-        # Normalize query vector
-        norm = np.linalg.norm(query_vector)
-        if norm > 0:
-            query_vector = query_vector / norm
-        
-        # Search FAISS index
-        k = min(k, self.index.ntotal)  # Don't request more than available
-        # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
-        distances, indices = self.index.search(  # type: ignore[call-arg]
-            np.array([query_vector], dtype=np.float32), 
-            k
-        )
+        # Search FAISS index; over-fetch by the number of tombstones so
+        # deleted vectors cannot crowd out live results
+        top_k = k
+        with self._index_lock:
+            if self.index.ntotal == 0:
+                return []
+
+            # FAISS only takes float32: copy the query into the preallocated
+            # (1, dim) batch and normalize it in place (the caller's vector is
+            # untouched, and no temporaries are allocated)
+            query = self._query_buf
+            np.copyto(query[0], query_vector, casting='unsafe')
+            self.faiss.normalize_L2(query)
+
+            k = min(k + self._tombstones, self.index.ntotal)  # Don't request more than available
+            # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
+            distances, indices = self.index.search(query, k)  # type: ignore[call-arg]
         
-        # Map FAISS indices back to chunk IDs
-        results = []
-        for dist, idx in zip(distances[0], indices[0]):
-            if idx != -1 and idx in self.id_map:  # -1 means no result
-                chunk_id = self.id_map[idx]
-                # Convert inner product back to similarity score (already normalized, so IP = cosine similarity)
-                similarity = float(dist)
-                results.append((chunk_id, similarity))
+            # Map FAISS IDs back to chunk IDs (-1 means no result, None a
+            # deleted vector). Inner product of normalized vectors is already
+            # the cosine similarity; tolist() converts all scores at once.
+            # FAISS returns scores in descending order, so the score threshold
+            # ends the scan at the first result below it.
+            id_map = self.id_map
+            results = []
+            for faiss_id, similarity in zip(indices[0].tolist(), distances[0].tolist()):
+                if min_score is not None and similarity < min_score:
+                    break
+                if faiss_id != -1:
+                    chunk_id = id_map[faiss_id]
+                    if chunk_id is not None:
+                        results.append((chunk_id, similarity))
         
-        return results
+        return results[:top_k]
     
     def delete(self, chunk_ids: List[str]):
         """
         Delete vectors from store
-        Note: This requires rebuilding the FAISS index
         
         Args:
             chunk_ids: List of chunk IDs to delete
         """
-        # Delete from SQLite
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        placeholders = ','.join('?' * len(chunk_ids))
-        cursor.execute(f"DELETE FROM chunk_vectors WHERE chunk_id IN ({placeholders})", chunk_ids)
-        conn.commit()
-        conn.close()
-        
-        # Rebuild FAISS index from SQLite
-        self._load_or_create()
+        with self._lock:
+            # Delete from SQLite
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._remove_from_pages(chunk_ids)
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
+            # Remove from FAISS in place
+            with self._index_lock:
+                self._remove_from_index(chunk_ids)
+            self._rebuild_if_needed()
+
+    def _remove_from_index(self, chunk_ids: List[str]):
+        """Remove the given chunk IDs' vectors from the FAISS index, if present"""
+        faiss_ids = [self._faiss_ids.pop(chunk_id) for chunk_id in chunk_ids if chunk_id in self._faiss_ids]
+        if not faiss_ids:
+            return
+
+        for faiss_id in faiss_ids:
+            self.id_map[faiss_id] = None
+
+        if self.index_kind == "hnsw":
+            # HNSW graphs do not support removal: with no chunk ID in id_map
+            # the vector is skipped by search until the graph is rebuilt
+            self._tombstones += len(faiss_ids)
+            return
+
+        # FAISS stubs show C-style API, but runtime uses Pythonic API (ignore)
+        self.index.remove_ids(np.array(faiss_ids, dtype=np.int64))  # type: ignore[call-arg]
+
+    def _rebuild_if_needed(self):
+        """
+        Rebuild the index from SQLite once deleted vectors pile up, or once
+        an sq8 store has grown enough to train its quantizer
+
+        Renumbers FAISS IDs, so id_map loses its free slots, and drops
+        HNSW tombstones from the graph. Caller holds the lock, so the
+        rebuild runs under the same lock as writes.
+        """
+        num_deleted = len(self.id_map) - len(self._faiss_ids)
+        if num_deleted and num_deleted > len(self.id_map) * self.MAX_DELETED_RATIO:
+            logger.info(f"Rebuilding {self.index_kind} index to drop {num_deleted} deleted vectors")
+            self._load()
+        elif (
+            self.index_type == "sq8"
+            and self.index_kind != "sq8"
+            and len(self._faiss_ids) >= self.SQ8_MIN_TRAIN_SIZE
+        ):
+            logger.info(f"Training 8-bit quantizer on {len(self._faiss_ids)} vectors")
+            self._load()
     
     def count(self) -> int:
         """Get total number of vectors in the index"""
-        return self.index.ntotal
+        # index.ntotal would also count HNSW tombstones
+        with self._index_lock:
+            return len(self._faiss_ids)
+
+    def close(self):
+        """Close database connection."""
+        conn = getattr(self, 'conn', None)
+        if conn:
+            conn.close()
+            self.conn = None
+
+    def __del__(self):
+        """Cleanup on deletion."""
+        self.close()
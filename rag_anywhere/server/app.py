@@ -6,9 +6,10 @@ import argparse
 import traceback
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
 
 from .lifecycle import lifespan
+from .models import StatusResponse
+from .responses import FastJSONResponse
 from .routes import search, documents, admin, kg
 
 # Create FastAPI app
@@ -16,7 +17,8 @@ app = FastAPI(
     title="RAG Anywhere",
     description="Secure, portable, local-first RAG system",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # Include routers
@@ -25,11 +27,15 @@ app.include_router(documents.router)
 app.include_router(admin.router)
 app.include_router(kg.router)
 
-# Legacy endpoint for backwards compatibility
-@app.get("/status")
-async def root_status():
-    """Root status endpoint (redirects to admin status)"""
-    return RedirectResponse(url="/admin/status")
+# Legacy endpoint for backwards compatibility. Served by the admin handler
+# directly rather than redirecting, so health-check polls take one round trip.
+app.add_api_route(
+    "/status",
+    admin.status,
+    methods=["GET"],
+    response_model=StatusResponse,
+    tags=["admin"],
+)
 
 
 def main():
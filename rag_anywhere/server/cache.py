@@ -0,0 +1,69 @@
+# rag_anywhere/server/cache.py
+
+"""Short-lived cache of encoded search responses"""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded response bodies with a time-to-live
+
+    Entries are tagged with a version of the searchable content (see
+    routes/search.py _cache_version); a lookup with another version misses,
+    so reloading the database or writing to it, from this process or the
+    CLI, invalidates cached responses right away. Only used from the event
+    loop, so it needs no locking.
+    """
+
+    def __init__(self, max_size: int = 512, ttl: float = 60.0):
+        """
+        Args:
+            max_size: Maximum number of cached responses (0 disables the cache)
+            ttl: Seconds a cached response stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, Hashable, bytes]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, version: Hashable) -> Optional[bytes]:
+        """Get a cached body, or None if missing, stale or expired"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, entry_version, body = entry
+            if entry_version == version and time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return body
+            del self._entries[key]
+
+        self._misses += 1
+        return None
+
+    def put(self, key: Hashable, version: Hashable, body: bytes):
+        """Cache a body, evicting the least recently used entries"""
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, version, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def info(self) -> Dict[str, int]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hits, misses, size and max_size
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'size': len(self._entries),
+            'max_size': self.max_size
+        }
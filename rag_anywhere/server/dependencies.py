@@ -4,6 +4,10 @@ from fastapi import HTTPException
 
 from .lifecycle import lifecycle
 
+# Activity is only used for minute-scale idle checks, so the state file is
+# rewritten at most this often (seconds) rather than on every request
+ACTIVITY_WRITE_INTERVAL = 5.0
+
 
 def get_rag_context():
     """Dependency to get RAG context"""
@@ -12,7 +16,7 @@ def get_rag_context():
     
     # Update activity timestamp
     if lifecycle.server_state:
-        lifecycle.server_state.update_activity()
+        lifecycle.server_state.update_activity(min_interval=ACTIVITY_WRITE_INTERVAL)
     
     return lifecycle.rag_context
 
@@ -49,3 +53,13 @@ def get_server_state():
     if not lifecycle.server_state:
         raise HTTPException(status_code=503, detail="Server not initialized")
     return lifecycle.server_state
+
+
+def get_search_cache():
+    """Dependency to get the search response cache"""
+    return lifecycle.search_cache
+
+
+def get_jobs():
+    """Dependency to get the background job registry"""
+    return lifecycle.jobs
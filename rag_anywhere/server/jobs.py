@@ -0,0 +1,84 @@
+# rag_anywhere/server/jobs.py
+
+"""In-process registry of background jobs"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class JobRegistry:
+    """
+    Progress records of background jobs, by job ID
+
+    Jobs are plain dicts that the worker thread updates in place. Finished
+    jobs (status ``completed`` or ``failed``) stay available for polling for
+    ``ttl`` seconds, and at most ``max_finished`` of them are kept; running
+    jobs are never evicted. Jobs are created and read from the event loop
+    and finished from worker threads, so access is locked.
+    """
+
+    FINISHED_STATUSES = frozenset({'completed', 'failed'})
+
+    def __init__(self, max_finished: int = 100, ttl: float = 3600.0):
+        """
+        Args:
+            max_finished: Maximum number of finished jobs kept
+            ttl: Seconds a finished job stays available
+        """
+        self.max_finished = max_finished
+        self.ttl = ttl
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        # Finished job IDs -> time they finished, oldest first
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, **fields: Any) -> Dict[str, Any]:
+        """
+        Register a new queued job
+
+        Args:
+            **fields: Initial progress fields
+
+        Returns:
+            The job dict, including its ``job_id`` and ``status``
+        """
+        job = {'job_id': uuid.uuid4().hex, 'status': 'queued', **fields}
+        with self._lock:
+            self._evict()
+            self._jobs[job['job_id']] = job
+        return job
+
+    def finish(self, job: Dict[str, Any], status: str, error: Optional[str] = None):
+        """Mark a job completed or failed, starting its time-to-live"""
+        if status not in self.FINISHED_STATUSES:
+            raise ValueError(f"Not a finished status: {status}")
+
+        with self._lock:
+            job['status'] = status
+            if error is not None:
+                job['error'] = error
+            self._finished[job['job_id']] = time.monotonic()
+            self._evict()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job, or None if unknown or evicted"""
+        with self._lock:
+            self._evict()
+            return self._jobs.get(job_id)
+
+    def _evict(self):
+        """Drop expired finished jobs and the oldest beyond max_finished"""
+        expired_before = time.monotonic() - self.ttl
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            if finished_at >= expired_before and len(self._finished) <= self.max_finished:
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
@@ -1,16 +1,19 @@
 # rag_anywhere/server/lifecycle.py
 
 import sys
-import signal
 import traceback
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from ..config import Config
-from ..cli.context import RAGContext
 from ..utils.logging import get_logger
+from .cache import ResponseCache
+from .jobs import JobRegistry
 from .state import ServerState
 
+if TYPE_CHECKING:
+    from ..cli.context import RAGContext
+
 logger = get_logger('server.lifecycle')
 
 
@@ -18,14 +21,21 @@ class ServerLifecycle:
     """Manages server startup and shutdown"""
     
     def __init__(self):
-        self.rag_context: Optional[RAGContext] = None
+        self.rag_context: Optional["RAGContext"] = None
         self.config: Optional[Config] = None
         self.server_state: Optional[ServerState] = None
         self.db_name: Optional[str] = None
         self.port: Optional[int] = None
+        # Background jobs (e.g. entity reprocessing)
+        self.jobs = JobRegistry()
+        # Encoded responses of recent identical search requests
+        self.search_cache = ResponseCache()
     
     def setup(self, db_name: str, port: int):
         """Setup server resources"""
+        # Imported here: RAGContext pulls in FAISS, numpy and the model stack
+        from ..cli.context import RAGContext
+
         self.db_name = db_name
         self.port = port
 
@@ -50,6 +60,8 @@ class ServerLifecycle:
             # Clear references to allow garbage collection
             self.rag_context.embedding_provider = None
             self.rag_context.vector_store = None
+            if self.rag_context.document_store is not None:
+                self.rag_context.document_store.close()
             self.rag_context.document_store = None
 
         logger.info("✓ Server shut down")
@@ -70,15 +82,9 @@ async def lifespan(app):
 
         lifecycle.setup(app.state.db_name, app.state.port)
 
-        # Setup signal handlers
-        def signal_handler(sig, frame):
-            logger.info("Received shutdown signal")
-            sys.stderr.write("\nReceived shutdown signal...\n")
-            sys.stderr.flush()
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # SIGINT/SIGTERM are left to uvicorn, which stops accepting requests,
+        # drains in-flight ones and then resumes this context manager so the
+        # shutdown below runs
 
         logger.info("Server lifecycle startup completed successfully")
         sys.stderr.write("Lifecycle: Setup complete\n")
@@ -91,12 +97,13 @@ async def lifespan(app):
         error_msg = f"FATAL: Server startup failed during lifespan: {e}"
         logger.error(error_msg, exc_info=True)
 
-        # Write directly to stderr (bypasses buffering issues)
-        sys.stderr.write(f"\n{'='*60}\n")
-        sys.stderr.write(f"{error_msg}\n")
-        sys.stderr.write(f"{'='*60}\n")
-        sys.stderr.write(traceback.format_exc())
-        sys.stderr.write(f"{'='*60}\n\n")
+        # Write directly to stderr (bypasses buffering issues), as a single
+        # write so the report is not interleaved with other output
+        separator = '=' * 60
+        sys.stderr.write(
+            f"\n{separator}\n{error_msg}\n{separator}\n"
+            f"{traceback.format_exc()}{separator}\n\n"
+        )
         sys.stderr.flush()
 
         raise
@@ -109,6 +116,5 @@ async def lifespan(app):
             logger.info("Server shutdown completed")
         except Exception as e:
             logger.error(f"Error during shutdown: {e}", exc_info=True)
-            sys.stderr.write(f"Error during shutdown: {e}\n")
-            sys.stderr.write(traceback.format_exc())
+            sys.stderr.write(f"Error during shutdown: {e}\n{traceback.format_exc()}")
             sys.stderr.flush()
@@ -2,15 +2,17 @@
 
 import os
 import sys
+import http.client
 import signal
 import subprocess
 import time
-from typing import Optional
+from collections import deque
+from typing import Optional, Tuple
 import socket
-import requests
 
 from .state import ServerState, ServerStatus
 from ..config import Config
+from ..config.embedding_config import EMBEDDING_MODEL
 from ..utils import get_logger
 
 logger = get_logger('server.manager')
@@ -24,21 +26,58 @@ class ServerManager:
         self.state = ServerState(config.config_dir)
         self.log_dir = config.config_dir / "logs"
         self.log_dir.mkdir(exist_ok=True)
+        # Kept-alive connection for status polls and admin calls to the server,
+        # created on first use (see _get_http)
+        self._http = None
+        # Global config as last read from disk, with the file's mtime at the
+        # time (see get_configured_port)
+        self._global_config_cache: Optional[Tuple[Optional[int], dict]] = None
+    
+    def _get_http(self):
+        """
+        HTTP session for talking to the server
+
+        requests is imported here rather than at module level, so commands
+        that never contact the server do not pay for importing it.
+        """
+        if self._http is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._http = requests.Session()
+            self._http.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=2))
+        return self._http
     
     def is_port_available(self, port: int) -> bool:
         """Check if port is available"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        try:
-            sock.bind(('127.0.0.1', port))
-            sock.close()
-            return True
-        except OSError:
-            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            # Same option uvicorn binds with, so a port left in TIME_WAIT
+            # (e.g. by a server that was just stopped) counts as available
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(('127.0.0.1', port))
+                return True
+            except OSError:
+                return False
     
     def get_configured_port(self) -> int:
-        """Get configured port or default"""
-        global_config = self.config.load_global_config()
-        return global_config.get('server', {}).get('port', 8000)
+        """
+        Get configured port or default
+
+        The global config is only re-parsed when the file changed since it
+        was last read, whichever process (or Config.save_global_config)
+        wrote it.
+        """
+        try:
+            mtime = self.config.global_config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        cached = self._global_config_cache
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, self.config.load_global_config())
+            self._global_config_cache = cached
+        return cached[1].get('server', {}).get('port', 8000)
     
     def start_server(self, port: Optional[int] = None, force: bool = False, debug: bool = False) -> bool:
         """
@@ -79,7 +118,6 @@ class ServerManager:
         logger.info(f"Starting server for database '{active_db}'")
 
         # Get embedding model (now global)
-        from ..config.embedding_config import EMBEDDING_MODEL
         embedding_model = EMBEDDING_MODEL
 
         # Setup log files
@@ -94,11 +132,14 @@ class ServerManager:
         
         # Write separator
         timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-        stdout_file.write(f"\n{'='*60}\n")
-        stdout_file.write(f"Server start attempt: {timestamp}\n")
-        stdout_file.write(f"Database: {active_db}\n")
-        stdout_file.write(f"Port: {port}\n")
-        stdout_file.write(f"{'='*60}\n\n")
+        separator = '=' * 60
+        stdout_file.write(
+            f"\n{separator}\n"
+            f"Server start attempt: {timestamp}\n"
+            f"Database: {active_db}\n"
+            f"Port: {port}\n"
+            f"{separator}\n\n"
+        )
         stdout_file.flush()
         
         # Start server process
@@ -120,6 +161,7 @@ class ServerManager:
                 stdout=stdout_file if not debug else None,
                 stderr=stderr_file if not debug else None,
                 start_new_session=True,  # Detach from parent
+                close_fds=True,  # Child inherits only stdio (the log files)
                 env=env
             )
             
@@ -131,53 +173,68 @@ class ServerManager:
             stderr_file.close()
             raise RuntimeError(f"Failed to start server process: {e}")
         
-        # Wait a moment and check if it started
+        # Poll until the server answers, the process dies, or the deadline
+        # passes. The server only accepts connections once startup (model
+        # loading) is done, so refused connections fail fast until then.
+        # Probes go over one plain HTTPConnection, which reconnects by itself
+        # after a refused attempt and keeps the socket alive once up.
         logger.debug("Waiting for server to start...")
-        time.sleep(2)  # Initial wait for process to start
 
-        # Check if process is still alive
-        if process.poll() is not None:
-            # Process died
-            exit_code = process.returncode
-            logger.error(f"Server process died with exit code {exit_code}")
+        startup_timeout = 32.0  # Generous for model loading
+        poll_interval = 0.05
+        deadline = time.monotonic() + startup_timeout
+        last_error: Optional[Exception] = None
+        probe = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
 
-            # Read error logs
-            stdout_file.close()
-            stderr_file.close()
-
-            error_msg = "Server failed to start. "
+        while True:
+            # Check if process is still alive
+            if process.poll() is not None:
+                # Process died
+                exit_code = process.returncode
+                logger.error(f"Server process died with exit code {exit_code}")
 
-            # Try to read last few lines of stderr
-            try:
-                with open(stderr_log, 'r') as f:
-                    lines = f.readlines()
-                    if lines:
-                        error_msg += "Last error:\n" + ''.join(lines[-10:])
-            except Exception:
-                pass
+                # Read error logs
+                stdout_file.close()
+                stderr_file.close()
 
-            raise RuntimeError(error_msg)
+                error_msg = "Server failed to start. "
 
-        # Verify server is responding (with retries)
-        logger.debug("Checking if server is responding...")
+                # Try to read last few lines of stderr (only the end of the
+                # log is read; it is appended to across every start)
+                try:
+                    with open(stderr_log, 'rb') as f:
+                        size = f.seek(0, os.SEEK_END)
+                        f.seek(max(0, size - 64 * 1024))
+                        if f.tell():
+                            f.readline()  # Skip the partial first line
+                        lines = deque(f, maxlen=10)
+                        if lines:
+                            error_msg += "Last error:\n" + b''.join(lines).decode('utf-8', errors='replace')
+                except Exception:
+                    pass
 
-        max_retries = 10  # More retries for model loading
-        retry_delay = 3   # Longer delay between retries (3 seconds)
+                probe.close()
+                raise RuntimeError(error_msg)
 
-        for attempt in range(max_retries):
             try:
-                response = requests.get(f"http://127.0.0.1:{port}/status", timeout=5)
-                if response.status_code == 200:
+                probe.request('GET', '/status')
+                response = probe.getresponse()
+                response.read()
+                if response.status == 200:
                     logger.debug("Server is responding")
                     break
-            except requests.RequestException as e:
-                if attempt < max_retries - 1:
-                    logger.debug(f"Server not ready yet (attempt {attempt + 1}/{max_retries}), waiting {retry_delay}s...")
-                    time.sleep(retry_delay)
-                else:
-                    # Only log as warning, not an error - server may still be loading
-                    logger.warning(f"Server took longer than expected to respond: {e}")
-                    # Don't fail - server is running, just may be loading
+            except (OSError, http.client.HTTPException) as e:
+                last_error = e
+                probe.close()  # Reset; the next request reconnects
+
+            if time.monotonic() >= deadline:
+                # Only log as warning, not an error - server may still be loading
+                logger.warning(f"Server took longer than expected to respond: {last_error}")
+                # Don't fail - server is running, just may be loading
+                break
+            time.sleep(poll_interval)
+
+        probe.close()
         
         # Save state
         self.state.save_state(
@@ -214,8 +271,16 @@ class ServerManager:
         try:
             os.kill(pid, signal.SIGTERM)
             
-            # Wait for graceful shutdown
-            time.sleep(2)
+            # Wait up to 2s for graceful shutdown. The server runs in its own
+            # session and may not be our child, so liveness is probed with
+            # signal 0 rather than waitpid.
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    break  # Exited
+                time.sleep(0.02)
             
             # Force kill if still alive
             try:
@@ -236,13 +301,20 @@ class ServerManager:
         """Restart the server"""
         logger.info("Restarting server")
         self.stop_server()
-        time.sleep(1)
+
+        # Give the port up to 1s to be released instead of always waiting
+        if port is None:
+            port = self.get_configured_port()
+        deadline = time.monotonic() + 1.0
+        while not self.is_port_available(port) and time.monotonic() < deadline:
+            time.sleep(0.02)
+
         return self.start_server(port=port, force=True, debug=debug)
     
     def get_status(self) -> dict:
         """Get current server status"""
         state_data = self.state.load_state()
-        actual_status = self.state.get_actual_status()
+        actual_status = self.state.get_actual_status(state_data)
         
         return {
             'status': actual_status.value,
@@ -286,7 +358,7 @@ class ServerManager:
         """
         state_data = self.state.load_state()
         
-        if not state_data or not self.state.is_server_running():
+        if not state_data or not self.state.is_server_running(state_data):
             # Server not running, will be started fresh with new DB
             return False
         
@@ -295,7 +367,6 @@ class ServerManager:
         old_model = state_data.get('embedding_model')
 
         # Embedding model is now global, so no need to reload
-        from ..config.embedding_config import EMBEDDING_MODEL
         new_model = EMBEDDING_MODEL
 
         # Since embedding model is global, we never need to reload it
@@ -304,9 +375,10 @@ class ServerManager:
         logger.info(f"Switching database from '{old_db}' to '{new_db_name}' (reload_model={reload_model})")
         
         # Send reload signal to server
+        import requests
         try:
             port = state_data['port']
-            response = requests.post(
+            response = self._get_http().post(
                 f"http://127.0.0.1:{port}/admin/reload",
                 json={
                     'database': new_db_name,
@@ -4,6 +4,48 @@ from pydantic import BaseModel, Field, model_validator
 from typing import Optional, List, Dict, Any
 
 
+# Keyword search mode flags (see KeywordSearchRequest.validate_search_mode)
+_MODE_FREEFORM = 1
+_MODE_STRUCTURED = 2
+_MODE_NO_KEYWORDS = 4  # Structured mode with only empty keyword lists
+_MODE_EXCLUDE_TERMS = 8
+_MODE_EXCLUDE_KEYWORDS = 16
+_MODE_EXACT_MATCH = 32
+
+
+def _search_mode_error(flags: int) -> Optional[str]:
+    """Validation error for a combination of keyword search mode flags, if any"""
+    has_freeform = bool(flags & _MODE_FREEFORM)
+    has_structured = bool(flags & _MODE_STRUCTURED)
+
+    if not has_freeform and not has_structured:
+        return "Must provide either 'query' (free-form mode) or 'required_keywords'/'optional_keywords' (structured mode)"
+
+    if has_freeform and has_structured:
+        return "Cannot mix free-form mode ('query') with structured mode ('required_keywords'/'optional_keywords')"
+
+    # Validate structured mode has at least some keywords
+    if flags & _MODE_NO_KEYWORDS:
+        return "Structured mode requires at least 'required_keywords' or 'optional_keywords'"
+
+    # Validate free-form mode incompatible fields
+    if has_freeform and flags & _MODE_EXCLUDE_KEYWORDS:
+        return "Use 'exclude_terms' instead of 'exclude_keywords' in free-form mode"
+
+    # Validate structured mode incompatible fields
+    if has_structured:
+        if flags & _MODE_EXCLUDE_TERMS:
+            return "Use 'exclude_keywords' instead of 'exclude_terms' in structured mode"
+        if flags & _MODE_EXACT_MATCH:
+            return "'exact_match' is only supported in free-form mode"
+
+    return None
+
+
+# Every flag combination resolved once at import; validation is a lookup
+_SEARCH_MODE_ERRORS = [_search_mode_error(flags) for flags in range(64)]
+
+
 # Request Models
 class SearchRequest(BaseModel):
     query: str = Field(..., description="Search query text")
@@ -36,30 +78,22 @@ class KeywordSearchRequest(BaseModel):
     @model_validator(mode='after')
     def validate_search_mode(self):
         """Ensure exactly one search mode is specified"""
-        has_freeform = self.query is not None
-        has_structured = self.required_keywords is not None or self.optional_keywords is not None
-
-        if not has_freeform and not has_structured:
-            raise ValueError("Must provide either 'query' (free-form mode) or 'required_keywords'/'optional_keywords' (structured mode)")
-
-        if has_freeform and has_structured:
-            raise ValueError("Cannot mix free-form mode ('query') with structured mode ('required_keywords'/'optional_keywords')")
-
-        # Validate structured mode has at least some keywords
-        if has_structured and not self.required_keywords and not self.optional_keywords:
-            raise ValueError("Structured mode requires at least 'required_keywords' or 'optional_keywords'")
-
-        # Validate free-form mode incompatible fields
-        if has_freeform:
-            if self.exclude_keywords is not None:
-                raise ValueError("Use 'exclude_terms' instead of 'exclude_keywords' in free-form mode")
-
-        # Validate structured mode incompatible fields
-        if has_structured:
-            if self.exclude_terms is not None:
-                raise ValueError("Use 'exclude_keywords' instead of 'exclude_terms' in structured mode")
-            if self.exact_match:
-                raise ValueError("'exact_match' is only supported in free-form mode")
+        # Each field is read once (attribute access goes through Pydantic)
+        required_keywords = self.required_keywords
+        optional_keywords = self.optional_keywords
+        has_structured = required_keywords is not None or optional_keywords is not None
+        flags = (
+            (self.query is not None) * _MODE_FREEFORM
+            | has_structured * _MODE_STRUCTURED
+            | (has_structured and not required_keywords and not optional_keywords) * _MODE_NO_KEYWORDS
+            | (self.exclude_terms is not None) * _MODE_EXCLUDE_TERMS
+            | (self.exclude_keywords is not None) * _MODE_EXCLUDE_KEYWORDS
+            | self.exact_match * _MODE_EXACT_MATCH
+        )
+
+        error = _SEARCH_MODE_ERRORS[flags]
+        if error is not None:
+            raise ValueError(error)
 
         return self
 
@@ -117,6 +151,19 @@ class SearchResponse(BaseModel):
     results: List[SearchResultItem]
 
 
+class CacheInfo(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class SearchCacheInfoResponse(BaseModel):
+    responses: CacheInfo
+    query_embeddings: CacheInfo
+    keyword_queries: CacheInfo
+
+
 class AddDocumentResponse(BaseModel):
     status: str
     document_id: str
@@ -170,12 +217,26 @@ class KGStatsResponse(BaseModel):
 class ReprocessRequest(BaseModel):
     document_id: Optional[str] = Field(None, description="Document ID to reprocess")
     labels: Optional[List[str]] = Field(None, description="Additional entity labels")
+    wait: bool = Field(
+        False, description="Reprocess before responding instead of queueing a background job"
+    )
 
 
 class ReprocessResponse(BaseModel):
-    status: str
+    status: str  # queued, or success when the request waited
+    job_id: Optional[str] = None
+    # Only set when the request waited for reprocessing to finish
+    documents_processed: Optional[int] = None
+    total_entities: Optional[int] = None
+
+
+class ReprocessJobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    documents_total: int
     documents_processed: int
     total_entities: int
+    error: Optional[str] = None
 
 
 class StatusResponse(BaseModel):
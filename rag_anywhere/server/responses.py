@@ -0,0 +1,31 @@
+# rag_anywhere/server/responses.py
+
+"""Response classes shared by the app and its routes"""
+
+# Responses are encoded with orjson when it is installed: a single C call per
+# response instead of the standard library encoder
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+
+    def encode_json(content) -> bytes:
+        """Encode a JSON-compatible value to bytes"""
+        return orjson.dumps(content)
+
+    def json_fragment(text: str):
+        """Embed already-encoded JSON text as-is in encode_json output"""
+        return orjson.Fragment(text)
+except ImportError:
+    import json
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
+    def encode_json(content) -> bytes:
+        """Encode a JSON-compatible value to bytes"""
+        return json.dumps(content, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def json_fragment(text: str):
+        """Embed already-encoded JSON text as-is in encode_json output"""
+        # The standard library encoder has no raw passthrough: decode it
+        return json.loads(text)
+
+__all__ = ['FastJSONResponse', 'encode_json', 'json_fragment']
@@ -1,6 +1,6 @@
 # rag_anywhere/server/routes/__init__.py
 """API route modules"""
 
-from . import search, documents, admin
+from . import search, documents, admin, kg
 
-__all__ = ['search', 'documents', 'admin']
+__all__ = ['search', 'documents', 'admin', 'kg']
@@ -1,6 +1,7 @@
 # rag_anywhere/server/routes/admin.py
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from ..models import StatusResponse, ReloadRequest, ReloadResponse, SleepResponse
 from ..dependencies import get_rag_context, get_server_state
@@ -30,12 +31,13 @@ async def status(rag_context: RAGContext = Depends(get_rag_context)):
             num_vectors=0,
         )
 
-    # Active DB and stores available: compute real stats
+    # Active DB and stores available: report (briefly cached) stats
+    num_documents, num_vectors = await run_in_threadpool(rag_context.get_content_stats)
     return StatusResponse(
         status="running",
         active_database=rag_context.active_db_name,
-        num_documents=len(rag_context.document_store.list_documents()),
-        num_vectors=rag_context.vector_store.count(),
+        num_documents=num_documents,
+        num_vectors=num_vectors,
     )
 
 
@@ -1,17 +1,23 @@
 # rag_anywhere/server/routes/documents.py
 
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
 from ..models import (
     AddDocumentRequest, AddDocumentResponse,
     RemoveDocumentRequest, RemoveDocumentResponse,
-    ListDocumentsResponse, DocumentListItem,
-    BatchAddRequest, BatchAddResponse, BatchDocumentResult, BatchAddSummary
+    ListDocumentsResponse,
+    BatchAddRequest, BatchAddResponse, BatchDocumentItem
 )
 from ..dependencies import get_rag_context_with_database
+from ..responses import FastJSONResponse, encode_json, json_fragment
 from ...cli.context import RAGContext
-from ...core.splitters import SplitterFactory
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
@@ -34,32 +40,23 @@ async def add_document(
         if not file_path.exists():
             raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
         
-        # Apply splitter overrides if provided
-        original_splitter = None
+        # Splitter overrides apply to this document only
+        splitter = None
         if request.splitter_overrides:
-            file_ext = file_path.suffix.lower()
-            splitter_config = rag_context.get_splitter_config(file_ext, request.splitter_overrides)
-            
-            splitter = SplitterFactory.create_splitter(
-                splitter_config['strategy'],
-                token_estimator=rag_context.safe_embedding_provider.estimate_tokens,
-                **{k: v for k, v in splitter_config.items() if k != 'strategy'}
+            splitter = rag_context.get_override_splitter(
+                file_path.suffix.lower(), request.splitter_overrides
             )
-            
-            original_splitter = rag_context.safe_indexer.splitter
-            rag_context.safe_indexer.splitter = splitter
         
-        # Index document
-        doc_id = rag_context.safe_indexer.index_document(
+        # Index document (loading, embedding and storage are blocking: run
+        # them on a worker thread)
+        doc_id = await run_in_threadpool(
+            rag_context.safe_indexer.index_document,
             file_path,
             request.metadata,
-            request.doc_type
+            request.doc_type,
+            splitter=splitter
         )
         
-        # Restore original splitter
-        if original_splitter:
-            rag_context.safe_indexer.splitter = original_splitter
-        
         return AddDocumentResponse(
             status="success",
             document_id=doc_id,
@@ -72,6 +69,145 @@ async def add_document(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _batch_error(doc_item: BatchDocumentItem, error: str) -> Dict[str, Any]:
+    """BatchDocumentResult for a document that failed, as a plain dict"""
+    return {
+        'file_path': doc_item.file_path,
+        'status': "error",
+        'document_id': None,
+        'filename': None,
+        'error': error
+    }
+
+
+def _prepare_batch_item(doc_item: BatchDocumentItem, rag_context: RAGContext):
+    """
+    Load, split and store one document of a batch (runs on a worker thread)
+
+    Returns:
+        (pending, None) on success, (None, error result dict) on failure
+    """
+    try:
+        file_path = Path(doc_item.file_path)
+
+        if not file_path.exists():
+            return None, _batch_error(doc_item, f"File not found: {file_path}")
+
+        # Splitter overrides apply to this document only
+        splitter = None
+        if doc_item.splitter_overrides:
+            splitter = rag_context.get_override_splitter(
+                file_path.suffix.lower(), doc_item.splitter_overrides
+            )
+
+        pending = rag_context.safe_indexer.prepare_document(
+            file_path,
+            doc_item.metadata,
+            doc_item.doc_type,
+            splitter=splitter
+        )
+        return pending, None
+
+    except Exception as e:
+        return None, _batch_error(doc_item, str(e))
+
+
+def _index_batch(request: BatchAddRequest, rag_context: RAGContext) -> List[Optional[Dict[str, Any]]]:
+    """
+    Index the documents of a batch (runs on a worker thread)
+
+    Stage 1 loads, splits and stores documents on up to batch_concurrency
+    threads, so loading and parsing overlap. Documents sharing a filename
+    are prepared one after the other, so the duplicate check behaves as in a
+    serial batch. Stage 2 embeds the chunks of all prepared documents in
+    shared batches regardless of document boundaries, then stores vectors
+    and entities. A failure in a shared batch only rolls back the documents
+    that fail on their own.
+
+    With fail_fast, the result is the same as processing the documents one
+    by one and stopping at the first error in request order: documents
+    after it are skipped, or rolled back if they were already prepared.
+    Prepared documents that are not completed for any other reason are
+    rolled back as well, so none stay stored without vectors.
+
+    Returns:
+        BatchDocumentResult dicts in request order (None for skipped documents)
+    """
+    documents = request.documents
+    indexer = rag_context.safe_indexer
+    concurrency = max(1, rag_context.db_config.get('batch_concurrency', 4))
+    item_results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+    prepared: List[Optional[Any]] = [None] * len(documents)
+    # Prepared documents that were completed or rolled back by stage 2
+    completed = set()
+
+    # Index of the first failed document, in request order
+    first_error = len(documents)
+    first_error_lock = threading.Lock()
+
+    def prepare_items(indices: List[int]):
+        nonlocal first_error
+        for i in indices:
+            if request.fail_fast and i > first_error:
+                return
+            pending, error = _prepare_batch_item(documents[i], rag_context)
+            prepared[i] = pending
+            item_results[i] = error
+            if error is not None and request.fail_fast:
+                with first_error_lock:
+                    first_error = min(first_error, i)
+
+    same_name: Dict[str, List[int]] = {}
+    for i, doc_item in enumerate(documents):
+        same_name.setdefault(Path(doc_item.file_path).name, []).append(i)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(prepare_items, same_name.values()))
+
+        # Documents after the first error may have started before it
+        # happened; a serial batch would never have reached them
+        if request.fail_fast:
+            for i in range(first_error + 1, len(documents)):
+                item_results[i] = None
+
+        order = [
+            i for i, pending in enumerate(prepared)
+            if pending is not None and (not request.fail_fast or i < first_error)
+        ]
+        if order:
+            errors = indexer.complete_documents(
+                [prepared[i] for i in order], stop_on_error=request.fail_fast
+            )
+            completed.update(errors)
+            for i in order:
+                doc_item = documents[i]
+                doc_id = prepared[i].doc_id
+                error = errors[doc_id]
+                if error is None:
+                    item_results[i] = {
+                        'file_path': doc_item.file_path,
+                        'status': "success",
+                        'document_id': doc_id,
+                        'filename': Path(doc_item.file_path).name,
+                        'error': None
+                    }
+                else:
+                    item_results[i] = _batch_error(doc_item, error)
+                    if request.fail_fast:
+                        # Stage 1 errors after this one were never reached
+                        for j in range(i + 1, len(documents)):
+                            item_results[j] = None
+                        break
+    finally:
+        indexer.discard_documents([
+            pending for pending in prepared
+            if pending is not None and pending.doc_id not in completed
+        ])
+
+    return item_results
+
+
 @router.post("/add-batch", response_model=BatchAddResponse)
 async def add_documents_batch(
     request: BatchAddRequest,
@@ -81,87 +217,35 @@ async def add_documents_batch(
     Add multiple documents in a single API call.
 
     - **documents**: List of documents to add (file_path, metadata, splitter_overrides)
-    - **fail_fast**: If true, stop processing on first error
+    - **fail_fast**: If true, stop processing on first error (in request
+      order; later documents are skipped)
 
     Returns detailed results for each document and a summary.
     """
-    results = []
-    succeeded = 0
-    failed = 0
-
-    for doc_item in request.documents:
-        try:
-            file_path = Path(doc_item.file_path)
-
-            if not file_path.exists():
-                results.append(BatchDocumentResult(
-                    file_path=doc_item.file_path,
-                    status="error",
-                    error=f"File not found: {file_path}"
-                ))
-                failed += 1
-
-                if request.fail_fast:
-                    break
-                continue
-
-            # Apply splitter overrides if provided
-            original_splitter = None
-            if doc_item.splitter_overrides:
-                file_ext = file_path.suffix.lower()
-                splitter_config = rag_context.get_splitter_config(file_ext, doc_item.splitter_overrides)
-
-                splitter = SplitterFactory.create_splitter(
-                    splitter_config['strategy'],
-                    token_estimator=rag_context.safe_embedding_provider.estimate_tokens,
-                    **{k: v for k, v in splitter_config.items() if k != 'strategy'}
-                )
-
-                original_splitter = rag_context.safe_indexer.splitter
-                rag_context.safe_indexer.splitter = splitter
-
-            # Index document
-            doc_id = rag_context.safe_indexer.index_document(
-                file_path,
-                doc_item.metadata,
-                doc_item.doc_type
-            )
+    # The whole batch runs on one worker thread (which fans out to its own
+    # pool), so the event loop stays free for other requests and a client
+    # disconnect cannot interrupt it halfway
+    item_results = await run_in_threadpool(_index_batch, request, rag_context)
 
-            # Restore original splitter
-            if original_splitter:
-                rag_context.safe_indexer.splitter = original_splitter
-
-            results.append(BatchDocumentResult(
-                file_path=doc_item.file_path,
-                status="success",
-                document_id=doc_id,
-                filename=file_path.name
-            ))
-            succeeded += 1
-
-        except Exception as e:
-            results.append(BatchDocumentResult(
-                file_path=doc_item.file_path,
-                status="error",
-                error=str(e)
-            ))
-            failed += 1
-
-            if request.fail_fast:
-                break
+    # Results in request order (skipped documents are left out)
+    results = [result for result in item_results if result is not None]
+    succeeded = sum(1 for result in results if result['status'] == "success")
+    failed = len(results) - succeeded
 
     # Determine overall status
     status = "completed" if failed == 0 else "partial"
 
-    return BatchAddResponse(
-        status=status,
-        results=results,
-        summary=BatchAddSummary(
-            total=len(request.documents),
-            succeeded=succeeded,
-            failed=failed
-        )
-    )
+    # Results are plain dicts in the BatchAddResponse shape, encoded directly
+    # rather than validated and serialized item by item
+    return FastJSONResponse({
+        'status': status,
+        'results': results,
+        'summary': {
+            'total': len(request.documents),
+            'succeeded': succeeded,
+            'failed': failed
+        }
+    })
 
 
 @router.post("/remove", response_model=RemoveDocumentResponse)
@@ -175,7 +259,9 @@ async def remove_document(
     - **document_id**: UUID of the document to remove
     """
     try:
-        success = rag_context.safe_indexer.remove_document(request.document_id)
+        success = await run_in_threadpool(
+            rag_context.safe_indexer.remove_document, request.document_id
+        )
         
         if not success:
             raise HTTPException(status_code=404, detail="Document not found")
@@ -198,26 +284,29 @@ async def list_documents(
     Returns a list of documents with metadata and chunk counts.
     """
     try:
-        documents = rag_context.safe_document_store.list_documents()
-        
-        # Add chunk count for each document
-        doc_items = []
-        for doc in documents:
-            chunks = rag_context.safe_document_store.get_chunks_by_document(doc['id'])
-            doc_items.append(DocumentListItem(
-                id=doc['id'],
-                filename=doc['filename'],
-                doc_type=doc.get('doc_type', 'text'),
-                created_at=doc['created_at'],
-                metadata=doc['metadata'],
-                num_chunks=len(chunks)
-            ))
-        
-        return ListDocumentsResponse(documents=doc_items)
-        
+        # Metadata is opaque to the server: keep the stored JSON text and
+        # splice it into the output instead of decoding and re-encoding it
+        rows = rag_context.safe_document_store.iter_documents_with_counts(raw_metadata=True)
+        # Pull the first row now so database errors still surface as a 500
+        # instead of a truncated stream
+        first = await run_in_threadpool(next, rows, None)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    def _gen():
+        # Encode the ListDocumentsResponse shape row by row: nothing but the
+        # current document is held in memory, and the first bytes go out
+        # as soon as the first row is read
+        yield b'{"documents":['
+        if first is not None:
+            for i, (doc, num_chunks) in enumerate(itertools.chain([first], rows)):
+                doc['metadata'] = json_fragment(doc['metadata'])
+                doc['num_chunks'] = num_chunks
+                yield (b',' if i else b'') + encode_json(doc)
+        yield b']}'
+
+    return StreamingResponse(_gen(), media_type="application/json")
+
 
 @router.get("/{document_id}")
 async def get_document(
@@ -230,16 +319,19 @@ async def get_document(
     - **document_id**: UUID of the document
     """
     try:
-        document = rag_context.safe_document_store.get_document(document_id)
+        document_store = rag_context.safe_document_store
+        document = await run_in_threadpool(document_store.get_document, document_id)
         
         if not document:
             raise HTTPException(status_code=404, detail="Document not found")
         
         # Add chunks
-        chunks = rag_context.safe_document_store.get_chunks_by_document(document_id)
+        chunks = await run_in_threadpool(document_store.get_chunks_by_document, document_id)
         document['chunks'] = chunks
         
-        return document
+        # Plain store data: encode it directly instead of through
+        # jsonable_encoder
+        return FastJSONResponse(document)
         
     except HTTPException:
         raise
@@ -1,22 +1,41 @@
 """Knowledge Graph API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List
 
 from ..models import (
-    EntityItem,
     EntityListResponse,
     EntityDetailsResponse,
     KGStatsResponse,
     ReprocessRequest,
     ReprocessResponse,
+    ReprocessJobResponse,
 )
-from ..dependencies import get_rag_context_with_database
+from ..dependencies import get_jobs, get_rag_context_with_database
+from ..jobs import JobRegistry
+from ..responses import FastJSONResponse
 from ...cli.context import RAGContext
+from ...core.splitters.base import TextChunk
 
 router = APIRouter(prefix="/kg", tags=["knowledge-graph"])
 
 
+# EntityItem fields, in graph_nodes column names
+_ENTITY_ITEM_FIELDS = ("id", "name", "display_name", "category", "frequency")
+
+
+def _entity_item(entity: dict) -> dict:
+    """EntityItem fields of a graph_nodes row"""
+    return {
+        "id": entity["id"],
+        "name": entity["name"],
+        "display_name": entity["display_name"],
+        "category": entity["category"],
+        "frequency": entity["frequency"],
+    }
+
+
 @router.get("/entities", response_model=EntityListResponse)
 async def list_entities(
     category: Optional[str] = Query(None, description="Filter by entity category"),
@@ -37,14 +56,17 @@ async def list_entities(
         )
 
     try:
-        entities = rag_context.safe_entity_store.query_entities(
-            category=category, min_frequency=min_frequency, limit=limit
+        # Rows are selected with exactly the EntityItem fields, so they are
+        # encoded as-is: no per-entity model or dict is built
+        entities = await run_in_threadpool(
+            rag_context.safe_entity_store.query_entities,
+            category=category,
+            min_frequency=min_frequency,
+            limit=limit,
+            columns=_ENTITY_ITEM_FIELDS,
         )
 
-        return EntityListResponse(
-            entities=[EntityItem(**entity) for entity in entities],
-            total=len(entities),
-        )
+        return FastJSONResponse({"entities": entities, "total": len(entities)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -67,35 +89,32 @@ async def get_entity_details(
         )
 
     try:
-        entity = rag_context.safe_entity_store.get_entity_by_name(entity_name, category)
+        entity_store = rag_context.safe_entity_store
+        entity = await run_in_threadpool(entity_store.get_entity_by_name, entity_name, category)
 
         if not entity:
             raise HTTPException(status_code=404, detail=f"Entity '{entity_name}' not found")
 
         # Get related chunks
-        chunk_ids = rag_context.safe_entity_store.get_entity_chunks(entity_name, category)
+        chunk_ids = await run_in_threadpool(entity_store.get_entity_chunks, entity_name, category)
 
         # Get related entities (co-occurrence)
-        related = rag_context.safe_entity_store.get_related_entities(entity['id'], limit=20)
+        related = await run_in_threadpool(
+            entity_store.get_related_entities, entity['id'], limit=20
+        )
         related_entities = [
             {
-                "entity": {
-                    "id": rel_ent["id"],
-                    "name": rel_ent["name"],
-                    "display_name": rel_ent["display_name"],
-                    "category": rel_ent["category"],
-                    "frequency": rel_ent["frequency"],
-                },
+                "entity": _entity_item(rel_ent),
                 "co_occurrence_count": count,
             }
             for rel_ent, count in related
         ]
 
-        return EntityDetailsResponse(
-            entity=EntityItem(**entity),
-            chunk_ids=chunk_ids,
-            related_entities=related_entities,
-        )
+        return FastJSONResponse({
+            "entity": _entity_item(entity),
+            "chunk_ids": chunk_ids,
+            "related_entities": related_entities,
+        })
     except HTTPException:
         raise
     except Exception as e:
@@ -120,7 +139,9 @@ async def get_chunks_by_entity(
         )
 
     try:
-        chunk_ids = rag_context.safe_entity_store.get_entity_chunks(entity, category)
+        chunk_ids = await run_in_threadpool(
+            rag_context.safe_entity_store.get_entity_chunks, entity, category
+        )
         return chunk_ids
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -141,22 +162,80 @@ async def get_stats(
         )
 
     try:
-        stats = rag_context.safe_entity_store.get_stats()
-        return KGStatsResponse(**stats)
+        # Store data already has the KGStatsResponse shape: encode it directly
+        stats = await run_in_threadpool(rag_context.safe_entity_store.get_stats)
+        return FastJSONResponse(stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _run_reprocess(
+    jobs: JobRegistry,
+    job: dict,
+    rag_context: RAGContext,
+    doc_ids: List[str],
+    user_labels: List[str],
+):
+    """
+    Re-extract entities for documents, recording progress in the job dict.
+
+    Entities are rewritten one document at a time, so a failure only loses
+    the document being processed.
+    """
+    gliner_config = rag_context.db_config.get('gliner', {})
+    default_labels = gliner_config.get('default_labels', [])
+    batch_size = max(1, gliner_config.get('batch_size', 32))
+    document_store = rag_context.safe_document_store
+    entity_store = rag_context.safe_entity_store
+    gliner_processor = rag_context.safe_gliner_processor
+
+    job["status"] = "running"
+    try:
+        for doc_id in doc_ids:
+            chunks = document_store.get_chunks_by_document(doc_id)
+
+            if chunks:
+                # Convert to TextChunk-like objects
+                text_chunks = [TextChunk.from_row(chunk, doc_id) for chunk in chunks]
+
+                # Process with GLiNER in micro-batches of chunks
+                chunk_entities_map = {}
+                for i in range(0, len(text_chunks), batch_size):
+                    chunk_entities_map.update(gliner_processor.process_chunks(
+                        text_chunks[i:i + batch_size], default_labels, user_labels
+                    ))
+
+                # Delete existing and add new
+                entity_store.delete_chunks_entities(list(chunk_entities_map))
+                for chunk_id, chunk_entities in chunk_entities_map.items():
+                    job["total_entities"] += entity_store.add_entities(
+                        chunk_id, chunk_entities.entities, source='gliner'
+                    )
+
+            job["documents_processed"] += 1
+
+        jobs.finish(job, "completed")
+    except Exception as e:
+        jobs.finish(job, "failed", error=str(e))
+
+
 @router.post("/reprocess", response_model=ReprocessResponse)
 async def reprocess_entities(
     request: ReprocessRequest,
+    background_tasks: BackgroundTasks,
     rag_context: RAGContext = Depends(get_rag_context_with_database),
+    jobs: JobRegistry = Depends(get_jobs),
 ):
     """
-    Reprocess document(s) to re-extract entities.
+    Queue document(s) for entity re-extraction.
 
     - **document_id**: Specific document to reprocess (omit to reprocess all)
     - **labels**: Additional entity labels beyond defaults
+    - **wait**: Reprocess before responding
+
+    Returns a job ID; poll `/kg/jobs/{job_id}` for progress. With `wait`,
+    responds once reprocessing is done with `status: success` and the
+    document and entity counts, as this endpoint did before it queued jobs.
     """
     if rag_context.entity_store is None:
         raise HTTPException(
@@ -173,52 +252,47 @@ async def reprocess_entities(
         if request.document_id:
             doc_ids = [request.document_id]
         else:
-            docs = rag_context.safe_document_store.list_documents()
+            docs = await run_in_threadpool(rag_context.safe_document_store.list_documents)
             doc_ids = [doc['id'] for doc in docs]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Get GLiNER config
-        gliner_config = rag_context.db_config.get('gliner', {})
-        default_labels = gliner_config.get('default_labels', [])
-        user_labels = request.labels or []
-
-        total_entities = 0
-        for doc_id in doc_ids:
-            # Get chunks for document
-            chunks = rag_context.safe_document_store.get_chunks_by_document(doc_id)
-
-            if not chunks:
-                continue
-
-            # Convert to TextChunk-like objects
-            from ...core.splitters.base import TextChunk
-
-            text_chunks = []
-            for chunk in chunks:
-                tc = TextChunk(
-                    content=chunk['content'],
-                    start_char=chunk['start_char'],
-                    end_char=chunk['end_char'],
-                    metadata={'document_id': doc_id, 'chunk_index': chunk['chunk_index']},
-                )
-                text_chunks.append(tc)
-
-            # Process with GLiNER
-            chunk_entities_map = rag_context.safe_gliner_processor.process_chunks(
-                text_chunks, default_labels, user_labels
-            )
-
-            # Delete existing and add new
-            for chunk_id, chunk_entities in chunk_entities_map.items():
-                rag_context.safe_entity_store.delete_chunk_entities(chunk_id)
-                num_entities = rag_context.safe_entity_store.add_entities(
-                    chunk_id, chunk_entities.entities, source='gliner'
-                )
-                total_entities += num_entities
-
-        return ReprocessResponse(
+    job = jobs.create(
+        documents_total=len(doc_ids),
+        documents_processed=0,
+        total_entities=0,
+        error=None,
+    )
+    task_args = (jobs, job, rag_context, doc_ids, request.labels or [])
+
+    if request.wait:
+        await run_in_threadpool(_run_reprocess, *task_args)
+        if job["status"] == "failed":
+            raise HTTPException(status_code=500, detail=job["error"])
+        return ReprocessResponse.model_construct(
             status="success",
-            documents_processed=len(doc_ids),
-            total_entities=total_entities,
+            job_id=job["job_id"],
+            documents_processed=job["documents_processed"],
+            total_entities=job["total_entities"],
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+
+    # Sync task: Starlette runs it in its threadpool after the response is sent
+    background_tasks.add_task(_run_reprocess, *task_args)
+
+    return ReprocessResponse.model_construct(status="queued", job_id=job["job_id"])
+
+
+@router.get("/jobs/{job_id}", response_model=ReprocessJobResponse)
+async def get_reprocess_job(job_id: str, jobs: JobRegistry = Depends(get_jobs)):
+    """
+    Get the progress of an entity reprocessing job.
+
+    - **job_id**: ID returned by `/kg/reprocess`
+
+    Finished jobs are kept for an hour (at most the 100 most recent).
+    """
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    return ReprocessJobResponse.model_construct(**job)
@@ -1,22 +1,83 @@
 # rag_anywhere/server/routes/search.py
 
-from fastapi import APIRouter, Depends, HTTPException
+import functools
+import hashlib
+import uuid
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 
 from ..models import (
-    SearchRequest, SearchResponse, SearchResultItem,
+    SearchRequest, SearchResponse, SearchCacheInfoResponse,
     KeywordSearchRequest, KeywordSearchResponse, KeywordSearchResultItem,
     DocumentInfo, ChunkPosition
 )
-from ..dependencies import get_rag_context_with_database
+from ..cache import ResponseCache
+from ..dependencies import get_rag_context_with_database, get_search_cache
+from ..responses import encode_json
 from ...cli.context import RAGContext
+from ...core.keyword_search import KeywordSearcher
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
+# Distinguishes this server process in ETags: the load counter and SQLite's
+# data_version in _cache_version are only meaningful within one process
+_PROCESS_TOKEN = uuid.uuid4().hex
+
+# Search responses may be stored by clients but must be revalidated (with
+# If-None-Match) before every reuse, so a changed index is never missed
+_CACHE_CONTROL = "no-cache"
+
+
+def _cache_version(rag_context: RAGContext) -> tuple:
+    """
+    Version of the searchable content
+
+    Changes on every database load (the load counter never repeats within
+    the process), on every in-process write (indexer generation) and on
+    every commit to the database file from any connection or process.
+    """
+    return (
+        rag_context.load_generation,
+        rag_context.safe_indexer.generation,
+        rag_context.safe_document_store.data_version()
+    )
+
+
+def _etag(cache_key: tuple, cache_version: tuple) -> str:
+    """ETag of a search response: the request and the content version"""
+    digest = hashlib.blake2b(
+        repr((_PROCESS_TOKEN, cache_key, cache_version)).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _not_modified(http_request: Request, etag: str) -> Optional[Response]:
+    """A 304 response if the client already has this ETag, else None"""
+    if_none_match = http_request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+        )
+    return None
+
+
+def _json_response(body: bytes, etag: str) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    )
+
+
 @router.post("", response_model=SearchResponse)
 async def search(
     request: SearchRequest,
-    rag_context: RAGContext = Depends(get_rag_context_with_database)
+    http_request: Request,
+    rag_context: RAGContext = Depends(get_rag_context_with_database),
+    cache: ResponseCache = Depends(get_search_cache)
 ):
     """
     Search for documents using task-optimized semantic similarity.
@@ -26,43 +87,125 @@ async def search(
     - **min_score**: Minimum similarity score threshold (0.0-1.0)
     - **task**: Task type for embedding (retrieval, fact_checking, code_retrieval, etc.)
     """
+    # Identical requests against unchanged content reuse the encoded response
+    # (or, if the client already has it, skip the body altogether)
+    cache_key = ("search", request.model_dump_json())
+    cache_version = _cache_version(rag_context)
+    etag = _etag(cache_key, cache_version)
+    not_modified = _not_modified(http_request, etag)
+    if not_modified is not None:
+        return not_modified
+    body = cache.get(cache_key, cache_version)
+    if body is not None:
+        return _json_response(body, etag)
+
     try:
-        results = rag_context.safe_searcher.search(
+        # Embedding and FAISS search are CPU-bound; run them on a worker
+        # thread so the event loop keeps serving other requests
+        results = await run_in_threadpool(
+            rag_context.safe_searcher.search,
             query=request.query,
             top_k=request.top_k,
             min_score=request.min_score,
             task=request.task
         )
 
-        # Convert core SearchResult objects into API SearchResultItem models
-        return SearchResponse(
-            results=[
-                SearchResultItem(
-                    chunk_id=r.chunk_id,
-                    content=r.chunk_content,
-                    similarity_score=r.similarity_score,
-                    document=DocumentInfo(
-                        id=r.document_id,
-                        filename=r.document_filename,
-                    ),
-                    position=ChunkPosition(
-                        chunk_index=r.chunk_index,
-                        start_char=r.start_char,
-                        end_char=r.end_char,
-                    ),
-                    metadata=r.metadata,
-                )
-                for r in results
-            ]
-        )
+        # SearchResult.to_dict() already has the SearchResultItem shape and
+        # the values come from the stores: encode the dicts directly, without
+        # building response models first
+        body = encode_json({'results': [r.to_dict() for r in results]})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    cache.put(cache_key, cache_version, body)
+    return _json_response(body, etag)
+
+
+@functools.lru_cache(maxsize=256)
+def _describe_keywords(
+    required_keywords: Tuple[str, ...],
+    optional_keywords: Tuple[str, ...],
+    exclude_keywords: Tuple[str, ...]
+) -> Tuple[str, Optional[str]]:
+    """
+    Build the display description and highlight query of a structured search
+
+    Cached so repeated keyword sets skip the string building.
+
+    Returns:
+        (query description, highlight query or None)
+    """
+    # Build query description for display
+    query_parts = []
+    if required_keywords:
+        query_parts.append(f"Required: {', '.join(required_keywords)}")
+    if optional_keywords:
+        query_parts.append(f"Optional: {', '.join(optional_keywords)}")
+    if exclude_keywords:
+        query_parts.append(f"Exclude: {', '.join(exclude_keywords)}")
+
+    # For structured mode, combine required and optional for highlighting
+    highlight_parts = required_keywords + optional_keywords
+    highlight_query = " OR ".join(highlight_parts) if highlight_parts else None
+
+    return " | ".join(query_parts), highlight_query
+
+
+def _enrich_keyword_results(
+    rag_context: RAGContext,
+    raw_results: List[Tuple[str, float]],
+    highlight_query: Optional[str]
+) -> List[KeywordSearchResultItem]:
+    """Attach chunk and document context (and highlights) to keyword hits"""
+    # Enrich results with document context (one joined lookup)
+    chunks = rag_context.safe_document_store.get_chunks_with_documents(
+        [chunk_id for chunk_id, _ in raw_results]
+    )
+
+    # Highlight all hits in one FTS5 query
+    highlighted = {}
+    if highlight_query:
+        highlighted = rag_context.safe_keyword_searcher.highlight_many(
+            list(chunks), highlight_query
+        )
+
+    enriched_results = []
+    for chunk_id, score in raw_results:
+        # Get chunk (with its document's filename) from document store
+        chunk = chunks.get(chunk_id)
+        if not chunk:
+            continue
+
+        # Get content (highlighted if requested; falls back to the plain
+        # content if highlighting failed)
+        content = highlighted.get(chunk_id) or chunk['content']
+
+        # Built from store data, so without validation (as in search)
+        enriched_results.append(KeywordSearchResultItem.model_construct(
+            chunk_id=chunk_id,
+            content=content,
+            score=score,
+            document=DocumentInfo.model_construct(
+                id=chunk['document_id'],
+                filename=chunk['document_filename']
+            ),
+            position=ChunkPosition.model_construct(
+                chunk_index=chunk['chunk_index'],
+                start_char=chunk['start_char'],
+                end_char=chunk['end_char']
+            ),
+            metadata=chunk['metadata']
+        ))
+
+    return enriched_results
+
 
 @router.post("/keyword", response_model=KeywordSearchResponse)
 async def keyword_search(
     request: KeywordSearchRequest,
-    rag_context: RAGContext = Depends(get_rag_context_with_database)
+    http_request: Request,
+    rag_context: RAGContext = Depends(get_rag_context_with_database),
+    cache: ResponseCache = Depends(get_search_cache)
 ):
     """
     Unified keyword search supporting both free-form and structured modes.
@@ -86,11 +229,24 @@ async def keyword_search(
     - **top_k**: Number of results (1-100)
     - **highlight**: Highlight matched terms with <mark> tags
     """
+    # Identical requests against unchanged content reuse the encoded response
+    # (or, if the client already has it, skip the body altogether)
+    cache_key = ("keyword", request.model_dump_json())
+    cache_version = _cache_version(rag_context)
+    etag = _etag(cache_key, cache_version)
+    not_modified = _not_modified(http_request, etag)
+    if not_modified is not None:
+        return not_modified
+    body = cache.get(cache_key, cache_version)
+    if body is not None:
+        return _json_response(body, etag)
+
     try:
         # Detect mode and execute appropriate search
         if request.query is not None:
             # Free-form mode
-            raw_results = rag_context.safe_keyword_searcher.search(
+            raw_results = await run_in_threadpool(
+                rag_context.safe_keyword_searcher.search,
                 query=request.query,
                 top_k=request.top_k,
                 exclude_terms=request.exclude_terms,
@@ -99,75 +255,35 @@ async def keyword_search(
             query_display = request.query
         else:
             # Structured mode
-            raw_results = rag_context.safe_keyword_searcher.search_with_keywords(
+            raw_results = await run_in_threadpool(
+                rag_context.safe_keyword_searcher.search_with_keywords,
                 required_keywords=request.required_keywords,
                 optional_keywords=request.optional_keywords,
                 exclude_keywords=request.exclude_keywords,
                 top_k=request.top_k
             )
-            # Build query description for display
-            query_parts = []
-            if request.required_keywords:
-                query_parts.append(f"Required: {', '.join(request.required_keywords)}")
-            if request.optional_keywords:
-                query_parts.append(f"Optional: {', '.join(request.optional_keywords)}")
-            if request.exclude_keywords:
-                query_parts.append(f"Exclude: {', '.join(request.exclude_keywords)}")
-            query_display = " | ".join(query_parts)
+            query_display, keywords_highlight = _describe_keywords(
+                tuple(request.required_keywords or ()),
+                tuple(request.optional_keywords or ()),
+                tuple(request.exclude_keywords or ())
+            )
 
         # Build highlight query
         if request.highlight:
             if request.query is not None:
                 highlight_query = request.query
             else:
-                # For structured mode, combine required and optional for highlighting
-                highlight_parts = []
-                if request.required_keywords:
-                    highlight_parts.extend(request.required_keywords)
-                if request.optional_keywords:
-                    highlight_parts.extend(request.optional_keywords)
-                highlight_query = " OR ".join(highlight_parts) if highlight_parts else None
+                highlight_query = keywords_highlight
         else:
             highlight_query = None
 
-        # Enrich results with document context
-        enriched_results = []
-        for chunk_id, score in raw_results:
-            # Get chunk from document store
-            chunk = rag_context.safe_document_store.get_chunk(chunk_id)
-            if not chunk:
-                continue
-
-            # Get document
-            document = rag_context.safe_document_store.get_document(chunk['document_id'])
-            if not document:
-                continue
-
-            # Get content (highlighted if requested)
-            if highlight_query:
-                content = rag_context.safe_keyword_searcher.highlight(chunk_id, highlight_query)
-                if not content:  # Fallback if highlight fails
-                    content = chunk['content']
-            else:
-                content = chunk['content']
-
-            enriched_results.append(KeywordSearchResultItem(
-                chunk_id=chunk_id,
-                content=content,
-                score=score,
-                document=DocumentInfo(
-                    id=document['id'],
-                    filename=document['filename']
-                ),
-                position=ChunkPosition(
-                    chunk_index=chunk['chunk_index'],
-                    start_char=chunk['start_char'],
-                    end_char=chunk['end_char']
-                ),
-                metadata=chunk['metadata']
-            ))
-
-        return KeywordSearchResponse(
+        # Document lookups and highlighting are SQLite queries: run them
+        # on a worker thread as well
+        enriched_results = await run_in_threadpool(
+            _enrich_keyword_results, rag_context, raw_results, highlight_query
+        )
+
+        response = KeywordSearchResponse.model_construct(
             results=enriched_results,
             query=query_display
         )
@@ -178,4 +294,25 @@ async def keyword_search(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    body = response.model_dump_json().encode()
+    cache.put(cache_key, cache_version, body)
+    return _json_response(body, etag)
 
+
+@router.get("/cache-info", response_model=SearchCacheInfoResponse)
+async def cache_info(
+    rag_context: RAGContext = Depends(get_rag_context_with_database),
+    cache: ResponseCache = Depends(get_search_cache)
+):
+    """
+    Get hit/miss statistics of the search caches.
+
+    - **responses**: Encoded responses of identical search requests
+    - **query_embeddings**: Semantic query embeddings (per loaded database)
+    - **keyword_queries**: Parsed FTS5 keyword queries
+    """
+    return {
+        'responses': cache.info(),
+        'query_embeddings': rag_context.safe_searcher.query_cache_info(),
+        'keyword_queries': KeywordSearcher.query_cache_info(),
+    }
@@ -1,6 +1,7 @@
 # rag_anywhere/server/state.py
 
 import json
+import time
 import psutil
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -21,6 +22,8 @@ class ServerState:
     def __init__(self, config_dir: Path):
         self.state_file = config_dir / "server.json"
         self.pid_file = config_dir / "server.pid"
+        # Monotonic time of the last activity write (see update_activity)
+        self._activity_written_at: Optional[float] = None
     
     def save_state(
         self,
@@ -59,8 +62,22 @@ class ServerState:
         except Exception:
             return None
     
-    def update_activity(self):
-        """Update last activity timestamp"""
+    def update_activity(self, min_interval: float = 0.0):
+        """
+        Update last activity timestamp
+
+        Args:
+            min_interval: Skip the write if the timestamp was written less
+                than this many seconds ago
+        """
+        now = time.monotonic()
+        if (
+            self._activity_written_at is not None
+            and now - self._activity_written_at < min_interval
+        ):
+            return
+        self._activity_written_at = now
+
         state = self.load_state()
         if state:
             state['last_activity'] = datetime.now().isoformat()
@@ -83,9 +100,15 @@ class ServerState:
         if self.pid_file.exists():
             self.pid_file.unlink()
     
-    def is_server_running(self) -> bool:
-        """Check if server process is actually running"""
-        state = self.load_state()
+    def is_server_running(self, state: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check if server process is actually running
+
+        Args:
+            state: Already loaded state (read from disk if None)
+        """
+        if state is None:
+            state = self.load_state()
         if not state:
             return False
         
@@ -93,21 +116,24 @@ class ServerState:
         if not pid:
             return False
         
-        try:
-            process = psutil.Process(pid)
-            # Check if it's actually our server process
-            return process.is_running()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return False
+        # A single existence check (kill(pid, 0) on POSIX); building a
+        # psutil.Process would also read the process's /proc entry
+        return psutil.pid_exists(pid)
     
-    def get_actual_status(self) -> ServerStatus:
-        """Get actual server status (checking if process is alive)"""
-        state = self.load_state()
+    def get_actual_status(self, state: Optional[Dict[str, Any]] = None) -> ServerStatus:
+        """
+        Get actual server status (checking if process is alive)
+
+        Args:
+            state: Already loaded state (read from disk if None)
+        """
+        if state is None:
+            state = self.load_state()
         
         if not state:
             return ServerStatus.STOPPED
         
-        if not self.is_server_running():
+        if not self.is_server_running(state):
             # Process dead but state file exists = crashed
             if state.get('status') in ['running', 'sleeping']:
                 return ServerStatus.CRASHED
@@ -1,5 +1,8 @@
 # rag_anywhere/utils/logging.py
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 
@@ -27,11 +30,20 @@ def setup_logging(config_dir: Path, debug: bool = False):
     console_formatter = logging.Formatter('%(levelname)s - %(message)s')
     console_handler.setFormatter(console_formatter)
     
+    # Handlers run on a background listener thread: logging calls only
+    # enqueue the record, the file and console writes happen off the caller's
+    # path. The listener is stopped (and the queue drained) at exit.
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Root logger
     root_logger = logging.getLogger('rag_anywhere')
     root_logger.setLevel(logging.DEBUG)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return root_logger
 
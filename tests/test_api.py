@@ -45,6 +45,8 @@ class APITester:
         self.base_url = base_url
         self.test_files = []
         self.document_ids = []
+        # One session for all tests: requests reuse a kept-alive connection
+        self.http = requests.Session()
 
     def setup_test_files(self):
         """Create temporary test files"""
@@ -73,7 +75,7 @@ class APITester:
         print_test("Single document add")
 
         file_path = str(self.test_files[0].absolute())
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/documents/add",
             json={
                 "file_path": file_path,
@@ -100,7 +102,7 @@ class APITester:
             for f in self.test_files[1:]  # Skip first file (already added)
         ]
 
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/documents/add-batch",
             json={
                 "documents": documents,
@@ -127,7 +129,7 @@ class APITester:
         """Test listing documents"""
         print_test("List documents")
 
-        response = requests.get(f"{self.base_url}/documents/list", timeout=10)
+        response = self.http.get(f"{self.base_url}/documents/list", timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -142,7 +144,7 @@ class APITester:
         """Test semantic search"""
         print_test("Semantic search")
 
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search",
             json={
                 "query": "neural networks and deep learning",
@@ -170,7 +172,7 @@ class APITester:
         """Test keyword search"""
         print_test("Keyword search")
 
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search/keyword",
             json={
                 "query": "machine learning",
@@ -202,7 +204,7 @@ class APITester:
         """Test keyword search with exact match"""
         print_test("Keyword search with exact match")
 
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search/keyword",
             json={
                 "query": "Google's",
@@ -225,7 +227,7 @@ class APITester:
         """Test structured keyword search (unified endpoint)"""
         print_test("Structured keyword search")
 
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search/keyword",
             json={
                 "required_keywords": ["learning"],
@@ -250,7 +252,7 @@ class APITester:
         print_test("Keyword search mode validation")
 
         # Test 1: No query or keywords (should fail)
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search/keyword",
             json={
                 "top_k": 5
@@ -265,7 +267,7 @@ class APITester:
         print_success("Correctly rejected request with no query or keywords")
 
         # Test 2: Mixed mode (should fail)
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/search/keyword",
             json={
                 "query": "machine learning",
@@ -291,7 +293,7 @@ class APITester:
             return True
 
         doc_id = self.document_ids[0]
-        response = requests.post(
+        response = self.http.post(
             f"{self.base_url}/documents/remove",
             json={"document_id": doc_id},
             timeout=30
@@ -311,7 +313,7 @@ class APITester:
         # Remove remaining documents
         for doc_id in self.document_ids[1:]:  # Skip first (already removed)
             try:
-                requests.post(
+                self.http.post(
                     f"{self.base_url}/documents/remove",
                     json={"document_id": doc_id},
                     timeout=10
@@ -331,6 +333,8 @@ class APITester:
             except:
                 pass
 
+        self.http.close()
+
         print_success("Cleanup complete")
 
     def run_all_tests(self):
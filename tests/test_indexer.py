@@ -0,0 +1,137 @@
+"""Indexer failure handling when documents share embedding batches"""
+
+import zlib
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('faiss')
+
+from rag_anywhere.core.document_store import DocumentStore
+from rag_anywhere.core.indexer import Indexer
+from rag_anywhere.core.keyword_search import KeywordSearcher
+from rag_anywhere.core.vector_store import VectorStore
+
+
+DIMENSION = 8
+
+
+class FakeEmbeddingProvider:
+    """Deterministic embeddings; fails on any text containing 'embed-fail'"""
+
+    def estimate_tokens(self, text):
+        return len(text) // 4
+
+    def format_document_chunk(self, title, content):
+        return content
+
+    def embed(self, texts):
+        if any('embed-fail' in text for text in texts):
+            raise RuntimeError('embedding failed')
+        return np.stack([
+            np.random.default_rng(zlib.crc32(text.encode())).standard_normal(DIMENSION)
+            for text in texts
+        ]).astype(np.float32)
+
+
+class FakeGlinerProcessor:
+    """Extracts nothing; fails on any chunk containing 'gliner-fail'"""
+
+    def process_chunks(self, chunks, default_labels, user_labels=None):
+        if any('gliner-fail' in chunk.content for chunk in chunks):
+            raise RuntimeError('entity extraction failed')
+        return {}
+
+
+class FakeEntityStore:
+    def __init__(self):
+        self.deleted = []
+
+    def add_entities(self, chunk_id, entities, source='gliner'):
+        return 0
+
+    def delete_chunks_entities(self, chunk_ids):
+        self.deleted.extend(chunk_ids)
+        return 0
+
+
+@pytest.fixture
+def indexer(tmp_path):
+    db_path = str(tmp_path / 'test.db')
+    document_store = DocumentStore(db_path)
+    return Indexer(
+        document_store=document_store,
+        vector_store=VectorStore(db_path, dimension=DIMENSION, index_type='flat'),
+        embedding_provider=FakeEmbeddingProvider(),
+        keyword_searcher=KeywordSearcher(db_path),
+        entity_store=FakeEntityStore(),
+        gliner_processor=FakeGlinerProcessor(),
+        splitter_kwargs={'chunk_size': 200, 'chunk_overlap': 0},
+    )
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def _stored(indexer):
+    """Filenames with a document row, and chunk IDs with a vector"""
+    filenames = indexer.document_store.list_filenames()
+    vectors = {chunk_id for chunk_id in indexer.vector_store.id_map if chunk_id is not None}
+    return filenames, vectors
+
+
+@pytest.mark.parametrize('marker', ['gliner-fail', 'embed-fail'])
+def test_failure_rolls_back_only_that_document(tmp_path, indexer, marker):
+    files = [
+        _write(tmp_path, 'a.txt', 'apples and bananas'),
+        _write(tmp_path, 'b.txt', f'cherries {marker}'),
+        _write(tmp_path, 'c.txt', 'dates and figs'),
+    ]
+
+    doc_ids = indexer.index_documents(files)
+
+    filenames, vectors = _stored(indexer)
+    assert len(doc_ids) == 2
+    assert filenames == {'a.txt', 'c.txt'}
+    assert vectors == {f'{doc_id}_0' for doc_id in doc_ids}
+    assert indexer.keyword_searcher.search('cherries') == []
+
+
+def test_complete_documents_reports_each_document(tmp_path, indexer):
+    pending = [
+        indexer.prepare_document(_write(tmp_path, 'a.txt', 'apples')),
+        indexer.prepare_document(_write(tmp_path, 'b.txt', 'bananas gliner-fail')),
+        indexer.prepare_document(_write(tmp_path, 'c.txt', 'cherries')),
+    ]
+
+    results = indexer.complete_documents(pending)
+
+    assert results == {
+        pending[0].doc_id: None,
+        pending[1].doc_id: 'entity extraction failed',
+        pending[2].doc_id: None,
+    }
+    assert _stored(indexer)[0] == {'a.txt', 'c.txt'}
+    assert indexer.entity_store.deleted == pending[1].chunk_ids
+
+
+def test_complete_documents_stop_on_error(tmp_path, indexer):
+    pending = [
+        indexer.prepare_document(_write(tmp_path, 'a.txt', 'apples')),
+        indexer.prepare_document(_write(tmp_path, 'b.txt', 'bananas embed-fail')),
+        indexer.prepare_document(_write(tmp_path, 'c.txt', 'cherries')),
+    ]
+
+    results = indexer.complete_documents(pending, stop_on_error=True)
+
+    # As if the documents had been processed one by one up to the failure
+    assert results == {
+        pending[0].doc_id: None,
+        pending[1].doc_id: 'embedding failed',
+    }
+    filenames, vectors = _stored(indexer)
+    assert filenames == {'a.txt'}
+    assert vectors == set(pending[0].chunk_ids)
@@ -0,0 +1,179 @@
+"""FTS5 index consistency with the chunks table"""
+
+import sqlite3
+
+import pytest
+
+from rag_anywhere.core.document_store import DocumentStore
+from rag_anywhere.core.keyword_search import KeywordSearcher
+from rag_anywhere.core.splitters import TextChunk
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'test.db')
+
+
+def _add(store, filename, *texts):
+    chunks = []
+    offset = 0
+    for text in texts:
+        chunks.append(TextChunk(text, offset, offset + len(text)))
+        offset += len(text) + 2
+    return store.add_document(filename, '\n\n'.join(texts), chunks)
+
+
+def _matches(searcher, query):
+    return {chunk_id for chunk_id, _ in searcher.search(query, top_k=100)}
+
+
+def _chunk_ids(db_path, doc_id):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT id FROM chunks WHERE document_id = ? ORDER BY chunk_index", (doc_id,)
+        )]
+    finally:
+        conn.close()
+
+
+def _assert_index_consistent(db_path):
+    """FTS5 integrity check against the external content table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("INSERT INTO chunks_fts (chunks_fts, rank) VALUES ('integrity-check', 1)")
+    finally:
+        conn.close()
+
+
+def test_insert_is_indexed(db_path):
+    store = DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+
+    doc_id = _add(store, 'a.txt', 'apples and bananas', 'cherries and dates')
+    apples, cherries = _chunk_ids(db_path, doc_id)
+
+    assert _matches(searcher, 'apples') == {apples}
+    assert _matches(searcher, 'cherry') == {cherries}  # Porter stemming
+    assert searcher.count() == 2
+    _assert_index_consistent(db_path)
+
+
+def test_update_reindexes_chunk(db_path):
+    store = DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+    doc_id = _add(store, 'a.txt', 'apples and bananas')
+    (chunk_id,) = _chunk_ids(db_path, doc_id)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE chunks SET content = 'figs and grapes' WHERE id = ?", (chunk_id,))
+    conn.commit()
+    conn.close()
+
+    assert _matches(searcher, 'apples') == set()
+    assert _matches(searcher, 'grapes') == {chunk_id}
+    _assert_index_consistent(db_path)
+
+
+def test_delete_removes_from_index(db_path):
+    store = DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+    kept = _add(store, 'a.txt', 'apples and bananas')
+    removed = _add(store, 'b.txt', 'apples and cherries')
+    other = _add(store, 'c.txt', 'apples and dates')
+
+    store.delete_document(removed)
+    store.delete_documents([other])
+
+    assert _matches(searcher, 'apples') == set(_chunk_ids(db_path, kept))
+    assert _matches(searcher, 'cherries') == set()
+    assert searcher.count() == 1
+    _assert_index_consistent(db_path)
+
+
+def test_index_survives_vacuum(db_path):
+    store = DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+    first = _add(store, 'a.txt', 'apples')
+    second = _add(store, 'b.txt', 'bananas')
+    third = _add(store, 'c.txt', 'cherries')
+    store.delete_document(first)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("VACUUM")
+    conn.close()
+
+    assert _matches(searcher, 'bananas') == set(_chunk_ids(db_path, second))
+    assert _matches(searcher, 'cherries') == set(_chunk_ids(db_path, third))
+    _assert_index_consistent(db_path)
+
+
+def test_highlight_many(db_path):
+    store = DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+    doc_id = _add(store, 'a.txt', 'apples and bananas', 'cherries only')
+    apples, cherries = _chunk_ids(db_path, doc_id)
+
+    highlighted = searcher.highlight_many([apples, cherries], 'bananas')
+    assert highlighted == {apples: 'apples and <mark>bananas</mark>'}
+
+
+def test_migrates_rowid_keyed_index(db_path):
+    # Layout before chunks had an INTEGER PRIMARY KEY: the index was keyed
+    # on the implicit rowid (FTS schema version 3)
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE documents (
+            id TEXT PRIMARY KEY, filename TEXT NOT NULL, content TEXT NOT NULL,
+            doc_type TEXT DEFAULT 'text', metadata TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE chunks (
+            id TEXT PRIMARY KEY, document_id TEXT NOT NULL, chunk_index INTEGER NOT NULL,
+            content TEXT NOT NULL, start_char INTEGER, end_char INTEGER, metadata TEXT,
+            FOREIGN KEY (document_id) REFERENCES documents(id) ON DELETE CASCADE
+        );
+        CREATE TABLE chunk_vectors (
+            chunk_id TEXT PRIMARY KEY, vector BLOB NOT NULL,
+            FOREIGN KEY (chunk_id) REFERENCES chunks(id) ON DELETE CASCADE
+        );
+        CREATE TABLE config (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+        CREATE VIRTUAL TABLE chunks_fts USING fts5(
+            content, content='chunks', tokenize='porter unicode61 remove_diacritics 1'
+        );
+        CREATE TRIGGER chunks_fts_insert AFTER INSERT ON chunks BEGIN
+            INSERT INTO chunks_fts (rowid, content) VALUES (new.rowid, new.content);
+        END;
+        CREATE TRIGGER chunks_fts_delete AFTER DELETE ON chunks BEGIN
+            INSERT INTO chunks_fts (chunks_fts, rowid, content)
+            VALUES ('delete', old.rowid, old.content);
+        END;
+        INSERT INTO config VALUES ('fts_schema_version', '3');
+        INSERT INTO documents (id, filename, content) VALUES ('doc', 'a.txt', '');
+        INSERT INTO chunks VALUES ('gone', 'doc', 0, 'apples', 0, 6, '{}');
+        INSERT INTO chunks VALUES ('b', 'doc', 1, 'bananas', 8, 15, '{}');
+        INSERT INTO chunks VALUES ('c', 'doc', 2, 'cherries', 17, 25, '{}');
+        DELETE FROM chunks WHERE id = 'gone';
+        PRAGMA user_version = 1;
+    """)
+    conn.close()
+
+    DocumentStore(db_path)
+    searcher = KeywordSearcher(db_path)
+
+    assert _matches(searcher, 'bananas') == {'b'}
+    assert _matches(searcher, 'cherries') == {'c'}
+    assert _matches(searcher, 'apples') == set()
+    _assert_index_consistent(db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        # Existing rowids are kept, and foreign keys still target chunks
+        assert conn.execute("SELECT id, seq FROM chunks ORDER BY seq").fetchall() == [('b', 2), ('c', 3)]
+        (chunk_vectors_sql,) = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'chunk_vectors'"
+        ).fetchone()
+        assert 'REFERENCES chunks(id)' in chunk_vectors_sql
+    finally:
+        conn.close()
@@ -0,0 +1,111 @@
+"""LoadCache keys and size-bounded eviction"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from rag_anywhere.core.loaders import DocumentLoader, LoadCache, LoaderRegistry
+
+
+class CountingLoader(DocumentLoader):
+    """Loader that records how often it parses a file"""
+
+    SUPPORTED_EXTENSIONS = ['.count']
+    CACHE_RESULTS = True
+
+    def __init__(self, version='1'):
+        self.version = version
+        self.loads = 0
+
+    def load(self, file_path: Path) -> str:
+        self.loads += 1
+        return f"v{self.version}: {file_path.read_text()}"
+
+    def supports(self, file_path: Path) -> bool:
+        return file_path.suffix == '.count'
+
+    def get_metadata(self, file_path: Path):
+        return {'filename': file_path.name}
+
+    def cache_key(self) -> str:
+        return f"{super().cache_key()}:{self.version}"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LoadCache(tmp_path / 'loads.db')
+
+
+def test_cache_hit_skips_parse(tmp_path, cache):
+    registry = LoaderRegistry(cache=cache)
+    loader = CountingLoader()
+    registry.register(loader)
+    (tmp_path / 'a.count').write_text('same bytes')
+    (tmp_path / 'b.count').write_text('same bytes')
+
+    assert registry.load_document(tmp_path / 'a.count')[0] == 'v1: same bytes'
+    content, metadata = registry.load_document(tmp_path / 'b.count')
+
+    assert loader.loads == 1
+    assert content == 'v1: same bytes'
+    assert metadata['filename'] == 'b.count'
+
+
+def test_other_extractor_misses(tmp_path, cache):
+    path = tmp_path / 'a.count'
+    path.write_text('text')
+
+    old = LoaderRegistry(cache=cache)
+    old.register(CountingLoader('1'))
+    old.load_document(path)
+
+    new_loader = CountingLoader('2')
+    new = LoaderRegistry(cache=cache)
+    new.register(new_loader)
+
+    assert new.load_document(path)[0] == 'v2: text'
+    assert new_loader.loads == 1
+
+
+def test_evicts_least_recently_used_by_size(tmp_path):
+    cache = LoadCache(tmp_path / 'loads.db', max_bytes=100)
+    for key in ('a', 'b', 'c'):
+        cache.put(key, 'x' * 30, {})
+    cache.get('a')
+    cache.put('d', 'x' * 30, {})
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.get('d') is not None
+
+
+def test_skips_entries_larger_than_the_cache(tmp_path):
+    cache = LoadCache(tmp_path / 'loads.db', max_bytes=100)
+    cache.put('small', 'x', {})
+    cache.put('large', 'x' * 200, {})
+
+    assert cache.get('large') is None
+    assert cache.get('small') == ('x', {})
+
+
+def test_drops_entries_without_extractor_keys(tmp_path):
+    db_path = tmp_path / 'loads.db'
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE loads (
+            fingerprint TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """)
+    conn.execute("INSERT INTO loads VALUES ('abc', 'old text', '{}', 0)")
+    conn.commit()
+    conn.close()
+
+    cache = LoadCache(db_path)
+    assert cache.get('abc') is None
+    cache.put('abc', 'new text', {})
+    assert cache.get('abc') == ('new text', {})
@@ -0,0 +1,130 @@
+"""
+Chunk boundaries of the text splitters on fixed inputs
+
+The expected chunk contents (pinned as a digest) and token estimates are
+what the splitters produced before they were optimized; offsets point at
+the chunk content (leading/trailing whitespace excluded).
+"""
+
+import hashlib
+
+import pytest
+
+from rag_anywhere.core.splitters import RecursiveTextSplitter, StructuralTextSplitter
+
+
+SENTENCES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Pack my box with five dozen liquor jugs!",
+    "How vexingly quick daft zebras jump?",
+    "Sphinx of black quartz, judge my vow;",
+]
+
+
+def _document(paragraph_sizes):
+    """Paragraphs of the given number of sentences, separated by blank lines"""
+    return '\n\n'.join(
+        ' '.join(SENTENCES[(p + s) % len(SENTENCES)] for s in range(size))
+        for p, size in enumerate(paragraph_sizes)
+    )
+
+
+PROSE = _document([3, 12, 1, 40, 7, 2, 25])
+LINES = '\n'.join(SENTENCES[i % len(SENTENCES)] for i in range(60))
+UNBROKEN = 'x' * 1500 + ' tail. ' + 'y' * 400
+
+
+def _heavy_estimate(text):
+    """Token estimator that makes every paragraph of PROSE expensive"""
+    return 8 * len(text.split())
+
+
+def _digest(chunks):
+    return hashlib.sha1('\x00'.join(c.content for c in chunks).encode()).hexdigest()
+
+
+RECURSIVE_CASES = {
+    'prose_overlap': (
+        PROSE, dict(chunk_size=400, chunk_overlap=50),
+        '96559f58d473107be2612c4e148ab2815caf2f3c',
+        [(0, 284), (235, 606), (558, 889), (840, 1211), (1162, 1533), (1484, 1855),
+         (1806, 2177), (2128, 2462), (2413, 2740), (2691, 3062), (3013, 3384), (3335, 3623)],
+        [71, 93, 83, 93, 93, 93, 93, 83, 82, 93, 93, 72],
+    ),
+    'prose': (
+        PROSE, dict(chunk_size=300, chunk_overlap=0),
+        'cab66fffa2ef763be4c09d264058fd9e6819d75a',
+        [(0, 284), (285, 523), (524, 769), (770, 1050), (1051, 1289), (1290, 1533),
+         (1534, 1772), (1773, 2016), (2017, 2255), (2257, 2540), (2542, 2781),
+         (2782, 3062), (3063, 3301), (3302, 3545), (3546, 3623)],
+        [71, 59, 61, 70, 59, 61, 59, 61, 60, 71, 60, 70, 59, 61, 19],
+    ),
+    'lines': (
+        LINES, dict(chunk_size=400, chunk_overlap=50),
+        '8f9ca2ea1f8cc3698c9e559fc6d97b5f4359160c',
+        [(0, 366), (317, 688), (639, 1010), (961, 1332), (1283, 1654), (1605, 1976),
+         (1927, 2298), (2249, 2414)],
+        [91, 93, 93, 93, 93, 93, 93, 41],
+    ),
+    'unbroken': (
+        UNBROKEN, dict(chunk_size=400, chunk_overlap=0),
+        '0bc668bc6edd04588b2fa3432ebcaeb305547024',
+        [(0, 400), (400, 800), (800, 1200), (1200, 1506), (1507, 1907)],
+        [100, 100, 100, 76, 100],
+    ),
+}
+
+STRUCTURAL_CASES = {
+    # Oversized paragraphs go through the recursive splitter, whose offsets
+    # are relative to the paragraph
+    'prose': (
+        PROSE, dict(min_chunk_size=100, max_chunk_size=1200, token_estimator=_heavy_estimate),
+        '80f5b87ce677a0b72bec47879079e03fc8a75985',
+        [(0, 644), (0, 1048), (450, 1609), (1049, 1609), (2257, 2619), (2621, 3623)],
+        [952, 1568, 1720, 832, 536, 1488],
+    ),
+    'prose_default_estimate': (
+        PROSE * 3, dict(min_chunk_size=100, max_chunk_size=2000),
+        '51bbf0ef4947986f7e660e3d9c4d605565a13c79',
+        [(0, 6242), (6244, 10869)],
+        [1560, 1156],
+    ),
+}
+
+
+@pytest.mark.parametrize('case', RECURSIVE_CASES)
+def test_recursive_boundaries(case):
+    text, kwargs, digest, offsets, tokens = RECURSIVE_CASES[case]
+    chunks = RecursiveTextSplitter(**kwargs).split(text)
+
+    assert _digest(chunks) == digest
+    assert [(c.start_char, c.end_char) for c in chunks] == offsets
+    assert [c.metadata['estimated_tokens'] for c in chunks] == tokens
+    assert all(c.content == text[c.start_char:c.end_char] for c in chunks)
+
+
+@pytest.mark.parametrize('case', STRUCTURAL_CASES)
+def test_structural_boundaries(case):
+    text, kwargs, digest, offsets, tokens = STRUCTURAL_CASES[case]
+    chunks = StructuralTextSplitter(**kwargs).split(text)
+
+    assert _digest(chunks) == digest
+    assert [(c.start_char, c.end_char) for c in chunks] == offsets
+    assert [c.metadata['estimated_tokens'] for c in chunks] == tokens
+
+
+def test_recursive_custom_estimator_matches_default():
+    # The default estimator is computed from offsets without slicing; a
+    # custom estimator doing the same arithmetic must agree with it
+    default = RecursiveTextSplitter(chunk_size=300, chunk_overlap=30).split(PROSE)
+    custom = RecursiveTextSplitter(
+        chunk_size=300, chunk_overlap=30, token_estimator=lambda s: len(s) // 4
+    ).split(PROSE)
+
+    assert [(c.content, c.metadata) for c in default] == [(c.content, c.metadata) for c in custom]
+
+
+def test_empty_text():
+    assert RecursiveTextSplitter().split('') == []
+    assert StructuralTextSplitter().split('') == []
+    assert StructuralTextSplitter().split('\n\n \n') == []
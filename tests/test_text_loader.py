@@ -0,0 +1,33 @@
+"""TextLoader decoding of byte order marks and non-UTF-8 files"""
+
+import codecs
+from pathlib import Path
+
+import pytest
+
+from rag_anywhere.core.loaders import TextLoader
+
+
+TEXT = 'Café – naïve text'
+
+
+@pytest.mark.parametrize('data', [
+    TEXT.encode('utf-8'),
+    codecs.BOM_UTF8 + TEXT.encode('utf-8'),
+    TEXT.encode('utf-16'),
+    codecs.BOM_UTF16_BE + TEXT.encode('utf-16-be'),
+    TEXT.encode('utf-32'),
+    codecs.BOM_UTF32_LE + TEXT.encode('utf-32-le'),
+    codecs.BOM_UTF32_BE + TEXT.encode('utf-32-be'),
+], ids=['utf-8', 'utf-8-bom', 'utf-16', 'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'])
+def test_decodes_by_byte_order_mark(data):
+    assert TextLoader().load_from_bytes(data, Path('a.txt')) == TEXT
+
+
+@pytest.mark.parametrize('data', [
+    'Café'.encode('latin-1'),
+    codecs.BOM_UTF8 + b'caf\xe9',
+    codecs.BOM_UTF16_LE + b'\x00\xd8',  # Unpaired surrogate
+])
+def test_falls_back_to_latin_1(data):
+    assert TextLoader().load_from_bytes(data, Path('a.txt')) == data.decode('latin-1')
@@ -0,0 +1,120 @@
+"""VectorStore persistence: add, delete and reload round trips"""
+
+import json
+import sqlite3
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('faiss')
+
+from rag_anywhere.core.document_store import DocumentStore
+from rag_anywhere.core.vector_store import VectorStore
+
+
+DIMENSION = 16
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'test.db')
+    DocumentStore(path)  # Creates the vector tables
+    return path
+
+
+@pytest.fixture
+def vectors():
+    return np.random.default_rng(0).standard_normal((100, DIMENSION)).astype(np.float32)
+
+
+def _chunk_ids(n):
+    return [f'chunk-{i}' for i in range(n)]
+
+
+def _live_ids(store):
+    return {chunk_id for chunk_id in store.id_map if chunk_id is not None}
+
+
+def _stored_rows(db_path):
+    """Chunk IDs recorded in the vector pages and in the location table"""
+    conn = sqlite3.connect(db_path)
+    try:
+        locations = {row[0] for row in conn.execute("SELECT chunk_id FROM chunk_vector_locations")}
+        paged = set()
+        for (page_chunk_ids,) in conn.execute("SELECT chunk_ids FROM chunk_vector_pages"):
+            paged.update(json.loads(page_chunk_ids))
+        return locations, paged
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize('index_type', ['flat', 'hnsw', 'auto'])
+def test_add_search_reload(db_path, vectors, index_type):
+    ids = _chunk_ids(len(vectors))
+    store = VectorStore(db_path, dimension=DIMENSION, index_type=index_type)
+    store.add_batch(ids, vectors)
+
+    assert store.count() == len(ids)
+    assert store.search(vectors[7], k=1)[0][0] == 'chunk-7'
+
+    reloaded = VectorStore(db_path, dimension=DIMENSION, index_type=index_type)
+    assert reloaded.count() == len(ids)
+    assert _live_ids(reloaded) == set(ids)
+    assert reloaded.search(vectors[42], k=1)[0][0] == 'chunk-42'
+
+
+@pytest.mark.parametrize('index_type', ['flat', 'hnsw'])
+def test_delete_persists(db_path, vectors, index_type):
+    ids = _chunk_ids(len(vectors))
+    store = VectorStore(db_path, dimension=DIMENSION, index_type=index_type)
+    store.add_batch(ids, vectors)
+
+    store.delete(ids[:5])
+    assert store.count() == len(ids) - 5
+    assert all(chunk_id not in ids[:5] for chunk_id, _ in store.search(vectors[0], k=10))
+
+    reloaded = VectorStore(db_path, dimension=DIMENSION, index_type=index_type)
+    assert reloaded.count() == len(ids) - 5
+    assert _live_ids(reloaded) == set(ids[5:])
+    assert _stored_rows(db_path) == (set(ids[5:]), set(ids[5:]))
+
+
+def test_delete_vectors_written_by_another_store(db_path, vectors):
+    ids = _chunk_ids(10)
+    first = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    first.add_batch(ids, vectors[:10])
+
+    # Written through another connection, so not in first's in-memory index
+    second = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    second.add_batch(['other-1', 'other-2'], vectors[10:12])
+    first.delete(['other-1'])
+
+    reloaded = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    assert _live_ids(reloaded) == set(ids) | {'other-2'}
+
+
+def test_add_replaces_existing_vector(db_path, vectors):
+    ids = _chunk_ids(10)
+    store = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    store.add_batch(ids, vectors[:10])
+
+    store.add_batch(['chunk-3'], vectors[50:51])
+    assert store.count() == 10
+    assert store.search(vectors[50], k=1)[0][0] == 'chunk-3'
+
+    reloaded = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    assert reloaded.count() == 10
+    assert reloaded.search(vectors[50], k=1)[0][0] == 'chunk-3'
+
+
+def test_rebuild_compacts_id_map(db_path, vectors):
+    ids = _chunk_ids(len(vectors))
+    store = VectorStore(db_path, dimension=DIMENSION, index_type='flat')
+    store.add_batch(ids, vectors)
+
+    # Well past MAX_DELETED_RATIO, so the index is rebuilt from SQLite
+    store.delete(ids[10:40])
+
+    assert len(store.id_map) == len(store._faiss_ids) == 70
+    assert _live_ids(store) == set(ids[:10]) | set(ids[40:])
+    assert store.search(vectors[60], k=1)[0][0] == 'chunk-60'